@@ -0,0 +1,356 @@
+"""Benchmarks hors ligne du serveur MCP CFNEWS (API simulée)."""
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import server
+from utils import json_codec
+from utils.cache import ResponseCache
+from utils.cfnews_client import CFNewsClient
+from utils.mock_api import MockCFNewsAPI
+from utils.prefetch import Prefetcher
+
+
+# Scénarios: nom -> (outil MCP, arguments)
+SCENARIOS: Dict[str, Any] = {
+    "search_operations": (server.search_operations, {"operation_types": ["LBO"], "sectors": ["Biotechnologies"]}),
+    "search_operations_fetch_all": (server.search_operations, {"operation_types": ["LBO"], "fetch_all": True, "max_items": 200}),
+    "search_funds": (server.search_funds, {"segments": ["LBO"], "status": ["Closé"]}),
+    "search_actors": (server.search_actors, {"actor_types": ["Fonds d'investissement"]}),
+    "search_companies": (server.search_companies, {"sectors": ["Biotechnologies"], "revenue_min": 10}),
+    "search_people": (server.search_people, {"organization_types": ["Fonds"], "executives_only": True}),
+    "search_news": (server.search_news, {"themes": ["LBO"], "max_results": 20}),
+    "get_fund_portfolio": (server.get_fund_portfolio, {"fund_id": 1625}),
+    "deal_statistics": (server.deal_statistics, {"group_by": ["sector", "quarter"], "max_items": 1000}),
+    "get_funds_portfolios": (server.get_funds_portfolios, {"fund_ids": list(range(1625, 1633)), "overlap": True}),
+    "batch_search": (server.batch_search, {"queries": [
+        {"entity": "operations", "filters": {"sectors": [sector]}} for sector in ("Biotechnologies", "Services Financiers", "Produits & Services industriels")
+    ] + [{"entity": "funds", "filters": {"segments": ["Venture Capital"]}}]}),
+}
+
+
+def peak_rss_mb() -> float:
+    """Pic de mémoire résidente du processus (Mo)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sur macOS, en kilo-octets ailleurs
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(samples: List[float], pct: int) -> float:
+    """Percentile (méthode inclusive) d'une liste de mesures."""
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+async def run_scenario(
+    tool: Callable[..., Any],
+    kwargs: Dict[str, Any],
+    api: MockCFNewsAPI,
+    iterations: int,
+    concurrency: int,
+    use_cache: bool,
+    prefetch: int = 0
+) -> Dict[str, Any]:
+    """Appelle un outil `iterations` fois avec `concurrency` appels simultanés."""
+    fn = getattr(tool, "fn", tool)
+    paged = "page" in inspect.signature(fn).parameters
+    server.client = CFNewsClient(
+        "benchmark",
+        transport=api.transport(),
+        cache=ResponseCache() if use_cache else None,
+        prefetcher=Prefetcher(prefetch) if use_cache and prefetch else None
+    )
+    latencies: List[float] = []
+    sizes: List[int] = []
+    errors = 0
+    counter = iter(range(iterations))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            call_kwargs = dict(kwargs)
+            if "fund_id" in call_kwargs:
+                call_kwargs["fund_id"] += i % 20
+            elif paged and not call_kwargs.get("fetch_all"):
+                call_kwargs["page"] = i % 5 + 1
+            start = time.perf_counter()
+            output = await fn(**call_kwargs)
+            latencies.append(time.perf_counter() - start)
+            sizes.append(len(output.encode("utf-8")))
+            if output.startswith('{"error"'):
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    prefetch_stats = server.client.stats()["prefetch"]
+    await server.client.close()
+    server.client = None
+
+    return {
+        "calls": iterations,
+        "errors": errors,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "throughput": iterations / elapsed,
+        "avg_bytes": statistics.mean(sizes),
+        "peak_rss_mb": peak_rss_mb(),
+        "prefetch": prefetch_stats,
+    }
+
+
+async def bench_tools(args: argparse.Namespace) -> Dict[str, Any]:
+    """Benchmark des outils MCP contre l'API simulée."""
+    api = MockCFNewsAPI(
+        total_items=args.total_items,
+        text_size=args.text_size,
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate
+    )
+    selected = args.only or list(SCENARIOS)
+    results = {}
+    print(f"{'outil':<30} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'appels/s':>9} {'octets':>8} {'RSS Mo':>7} {'err':>4}")
+    for name in selected:
+        tool, kwargs = SCENARIOS[name]
+        stats = await run_scenario(
+            tool, kwargs, api, args.iterations, args.concurrency, args.cache, args.prefetch
+        )
+        results[name] = stats
+        print(
+            f"{name:<30} {stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f} "
+            f"{stats['throughput']:>9.1f} {stats['avg_bytes']:>8.0f} {stats['peak_rss_mb']:>7.1f} {stats['errors']:>4}"
+        )
+    return results
+
+
+def time_call(fn: Callable[[], Any], repeat: int) -> float:
+    """Durée médiane d'un appel (ms) sur `repeat` exécutions."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+async def bench_json(args: argparse.Namespace) -> Dict[str, Any]:
+    """Micro-benchmark du décodage/encodage JSON: stdlib contre orjson."""
+    api = MockCFNewsAPI(text_size=args.text_size, portfolio_size=args.portfolio_size)
+    payloads = {
+        "actualite_100": api.page("actualite", 1, 100),
+        "operation_100": api.page("operation", 1, 100),
+        "portfolio": api.portfolio(1625),
+    }
+    results = {}
+    print(f"{'payload':<16} {'Ko':>7} {'opération':<14} {'json ms':>9} {'orjson ms':>10} {'gain':>6}")
+    for name, payload in payloads.items():
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        ops = {
+            "loads": (lambda: json.loads(body), lambda: json_codec.loads(body)),
+            "dumps_indent": (
+                lambda: json.dumps(payload, ensure_ascii=False, indent=2),
+                lambda: json_codec.dumps(payload, indent=True)
+            ),
+            "dumps_compact": (
+                lambda: json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+                lambda: json_codec.dumps(payload)
+            ),
+        }
+        results[name] = {"bytes": len(body)}
+        for op, (stdlib_fn, codec_fn) in ops.items():
+            stdlib_ms = time_call(stdlib_fn, args.repeat)
+            codec_ms = time_call(codec_fn, args.repeat)
+            results[name][op] = {"json_ms": stdlib_ms, f"{json_codec.BACKEND}_ms": codec_ms}
+            print(
+                f"{name:<16} {len(body) / 1024:>7.1f} {op:<14} {stdlib_ms:>9.3f} "
+                f"{codec_ms:>10.3f} {stdlib_ms / codec_ms:>5.1f}x"
+            )
+    if json_codec.BACKEND != "orjson":
+        print("⚠️  orjson n'est pas installé: les deux colonnes utilisent la bibliothèque standard")
+    return results
+
+
+def import_times(repeat: int, top: int = 10) -> Dict[str, Any]:
+    """
+    Temps d'import de server.py mesuré par `python -X importtime` (processus neufs).
+    
+    Returns:
+        Durée médiane (ms) et paquets les plus coûteux (temps propre cumulé, ms)
+    """
+    totals = []
+    packages: Dict[str, List[float]] = {}
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import server"],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stderr
+        own: Dict[str, float] = {}
+        for line in output.splitlines():
+            # import time: self [us] | cumulative | imported package
+            if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+                continue
+            self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            package = name.split(".")[0]
+            own[package] = own.get(package, 0.0) + int(self_us) / 1000
+            if name == "server":
+                totals.append(int(cumulative_us) / 1000)
+        for package, ms in own.items():
+            packages.setdefault(package, []).append(ms)
+    ranked = sorted(((statistics.median(ms), package) for package, ms in packages.items()), reverse=True)
+    return {
+        "import_ms": statistics.median(totals),
+        "packages": {package: round(ms, 2) for ms, package in ranked[:top]}
+    }
+
+
+async def time_to_first_response(
+    tool: str = "search_news",
+    arguments: Optional[Dict[str, Any]] = None,
+    env: Optional[Dict[str, str]] = None,
+    timeout: float = 30.0,
+    idle: float = 0.0
+) -> Dict[str, float]:
+    """
+    Lance `server.py` en mode stdio et mesure le délai jusqu'à la réponse au
+    premier appel d'outil (démarrage de l'interpréteur inclus).
+    
+    Args:
+        tool: Outil appelé
+        arguments: Arguments de l'appel
+        env: Variables d'environnement du processus (défaut: sans clé API,
+            l'outil répond par une erreur sans appel réseau)
+        timeout: Délai maximum (secondes)
+        idle: Pause entre `initialize` et l'appel d'outil (secondes), comme
+            un client qui attend la première question de l'utilisateur
+    
+    Returns:
+        Durées (ms) jusqu'à la réponse à `initialize` et à l'appel d'outil
+        depuis le lancement, et durée de l'appel d'outil seul
+    """
+    env = env if env is not None else {**os.environ, "CFNEWS_API_KEY": ""}
+    start = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py"),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        env=env
+    )
+    
+    async def send(message: Dict[str, Any]) -> None:
+        process.stdin.write(json.dumps({"jsonrpc": "2.0", **message}).encode() + b"\n")
+        await process.stdin.drain()
+    
+    async def receive(request_id: int) -> Dict[str, Any]:
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                raise RuntimeError("Le serveur s'est arrêté avant de répondre")
+            message = json.loads(line)
+            if message.get("id") == request_id:
+                return message
+    
+    try:
+        await send({"id": 1, "method": "initialize", "params": {
+            "protocolVersion": "2025-06-18",
+            "capabilities": {},
+            "clientInfo": {"name": "cfnews-benchmark", "version": "1.0"}
+        }})
+        await asyncio.wait_for(receive(1), timeout)
+        initialized = time.perf_counter() - start
+        await send({"method": "notifications/initialized"})
+        await asyncio.sleep(idle)
+        called = time.perf_counter()
+        await send({"id": 2, "method": "tools/call", "params": {"name": tool, "arguments": arguments or {}}})
+        await asyncio.wait_for(receive(2), timeout)
+        responded = time.perf_counter()
+    finally:
+        if process.returncode is None:
+            process.kill()
+        await process.wait()
+    return {
+        "initialize_ms": initialized * 1000,
+        "first_response_ms": (responded - start) * 1000,
+        "tool_call_ms": (responded - called) * 1000
+    }
+
+
+async def bench_startup(args: argparse.Namespace) -> Dict[str, Any]:
+    """Démarrage à froid: temps d'import et premier appel d'outil en stdio."""
+    imports = import_times(args.repeat)
+    print(f"Import de server.py: {imports['import_ms']:.1f} ms (médiane sur {args.repeat})")
+    print(f"{'paquet':<28} {'ms':>8}")
+    for package, ms in imports["packages"].items():
+        print(f"{package:<28} {ms:>8.2f}")
+    
+    runs = [await time_to_first_response(idle=args.idle) for _ in range(args.repeat)]
+    result = {
+        **imports,
+        **{key: statistics.median(run[key] for run in runs) for key in runs[0]},
+    }
+    print(f"\nstdio: initialize {result['initialize_ms']:.0f} ms, "
+          f"premier appel d'outil {result['first_response_ms']:.0f} ms "
+          f"(appel seul {result['tool_call_ms']:.0f} ms, pause {args.idle * 1000:.0f} ms)")
+    return result
+
+
+def main() -> int:
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command")
+
+    tools = commands.add_parser("tools", help="Latence et débit des outils MCP (défaut)")
+    tools.add_argument("--iterations", type=int, default=200, help="Appels par outil")
+    tools.add_argument("--concurrency", type=int, default=8, help="Appels simultanés")
+    tools.add_argument("--latency", type=float, default=0.0, help="Latence amont simulée (ms)")
+    tools.add_argument("--jitter", type=float, default=0.0, help="Gigue amont simulée (ms)")
+    tools.add_argument("--error-rate", type=float, default=0.0, help="Taux de réponses 503 simulées")
+    tools.add_argument("--total-items", type=int, default=250, help="Résultats par recherche")
+    tools.add_argument("--text-size", type=int, default=200, help="Taille des champs texte (caractères)")
+    tools.add_argument("--cache", action="store_true", help="Active le cache de réponses")
+    tools.add_argument("--prefetch", type=int, default=0,
+                       help="Pages préchargées après chaque page (avec --cache)")
+    tools.add_argument("--only", nargs="+", choices=list(SCENARIOS), help="Scénarios à lancer")
+    tools.add_argument("--json", dest="json_path", help="Écrit les résultats dans ce fichier JSON")
+    tools.set_defaults(func=bench_tools)
+
+    codec = commands.add_parser("json", help="Décodage/encodage JSON: stdlib contre orjson")
+    codec.add_argument("--repeat", type=int, default=50, help="Répétitions par mesure")
+    codec.add_argument("--text-size", type=int, default=2000, help="Taille des champs texte (caractères)")
+    codec.add_argument("--portfolio-size", type=int, default=500, help="Participations du portefeuille")
+    codec.add_argument("--json", dest="json_path", help="Écrit les résultats dans ce fichier JSON")
+    codec.set_defaults(func=bench_json)
+
+    startup = commands.add_parser("startup", help="Démarrage à froid (imports, premier appel stdio)")
+    startup.add_argument("--repeat", type=int, default=5, help="Processus lancés par mesure")
+    startup.add_argument("--idle", type=float, default=0.0,
+                         help="Pause entre initialize et l'appel d'outil (secondes)")
+    startup.add_argument("--json", dest="json_path", help="Écrit les résultats dans ce fichier JSON")
+    startup.set_defaults(func=bench_startup)
+
+    argv = sys.argv[1:]
+    if not argv or argv[0].startswith("-") and argv[0] not in ("-h", "--help"):
+        argv = ["tools", *argv]
+    args = parser.parse_args(argv)
+    os.environ.setdefault("CFNEWS_API_KEY", "benchmark")
+
+    results = asyncio.run(args.func(args))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
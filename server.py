@@ -1,24 +1,251 @@
 """Serveur MCP pour l'API CFNEWS."""
+import asyncio
+import contextvars
+import functools
+import importlib
+import inspect
+import logging
 import os
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Tuple, Union, AsyncIterator, Awaitable, Callable, TYPE_CHECKING
+from datetime import datetime, date, timedelta
 import json
 
-from fastmcp import FastMCP
+import httpx
+
+from fastmcp import FastMCP, Context
 from dotenv import load_dotenv
+from starlette.requests import Request
+from starlette.responses import Response
 
 from utils.cfnews_client import CFNewsClient, CFNewsAPIError
+from utils import budget, json_codec, metrics, tracing
+from utils.cache import ResponseCache
+from utils.cursors import Cursor, CursorStore
+from utils.entities import ENTITY_TYPES, EntityStore, resolve_type
+from utils.prefetch import Prefetcher
+from utils.resilience import RetryPolicy, TokenBucket, CircuitBreaker
+from utils.watches import WatchPoller
+from utils.taxonomy import (
+    TaxonomyError, OPERATION_TYPES, OPERATION_SUBTYPES, SECTORS, REGIONS,
+    NATIONALITIES, VEHICLE_SEGMENTS, VEHICLE_TYPES, VEHICLE_STATUSES,
+    ACTOR_TYPES, COMPANY_TYPES, PEOPLE_ORGANIZATION_TYPES, PEOPLE_TITLES, KEYWORDS
+)
+
+# Modules importés à la demande (cache disque, miroir, statistiques): le
+# processus stdio, relancé à chaque session, démarre sans eux
+if TYPE_CHECKING:
+    from utils.disk_cache import SQLiteCache
+    from utils.mirror import Mirror, MirrorSync
 
 # Charger les variables d'environnement
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+# Modules importés par FastMCP au premier appel d'outil (état de session):
+# importés en tâche de fond au démarrage plutôt que sur le chemin de la
+# première réponse
+PRELOAD_MODULES = ("key_value.aio.adapters.pydantic", "key_value.aio.stores.memory")
+
+
+def preload_modules() -> None:
+    """Importe PRELOAD_MODULES (ignore ceux qui n'existent pas dans la version installée)."""
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Crée le client au démarrage du serveur et préchauffe sa connexion.
+    
+    Le préchauffage (connexion, imports paresseux de FastMCP) se fait en
+    tâche de fond: la réponse à `initialize` ne l'attend pas, et le premier
+    appel d'outil ne paie ni la création du client ni la résolution DNS et
+    la poignée de main TLS.
+    """
+    global client
+    tasks = []
+    if os.getenv("CFNEWS_PRELOAD", "true").lower() not in ("0", "false", "no"):
+        tasks.append(asyncio.create_task(asyncio.to_thread(preload_modules)))
+    if os.getenv("CFNEWS_API_KEY"):
+        api_client = get_client()
+        if os.getenv("CFNEWS_WARMUP", "true").lower() not in ("0", "false", "no"):
+            tasks.append(asyncio.create_task(api_client.warmup()))
+        local_mirror = get_mirror()
+        if local_mirror is not None:
+            tasks.append(asyncio.create_task(build_mirror_sync(api_client, local_mirror).run()))
+        if WATCH_INTERVAL > 0:
+            tasks.append(asyncio.create_task(watches.run()))
+    try:
+        yield {}
+    finally:
+        for task in tasks:
+            task.cancel()
+        if client is not None:
+            await client.close()
+            client = None
+
+
 # Créer le serveur MCP
-mcp = FastMCP("CFNEWS")
+mcp = FastMCP("CFNEWS", lifespan=lifespan)
 
 # Client API global
 client: Optional[CFNewsClient] = None
 
 
+# Profilage échantillonné des appels d'outils (CFNEWS_PROFILE_DIR)
+profiler = tracing.Profiler.from_env()
+
+TRACE_DOC = "        trace: Ajoute la durée de chaque phase (filtres, réseau, JSON...) sous `_timings`\n"
+BUDGET_DOC = (
+    "        max_bytes: Taille maximum de la réponse en octets (textes longs tronqués,\n"
+    "            items en trop retirés et comptés dans `omitted`)\n"
+    "        max_tokens: Taille maximum de la réponse en tokens (estimation: ~4 octets par token)\n"
+)
+
+# Budget de taille par défaut des réponses (octets, 0 = aucun)
+MAX_RESPONSE_BYTES = int(os.getenv("CFNEWS_MAX_RESPONSE_BYTES", 0))
+
+
+def instrumented(
+    tool: Optional[Callable[..., Awaitable[str]]] = None,
+    *,
+    extras: bool = True
+) -> Any:
+    """
+    Mesure un outil MCP: appels par résultat, durée et taille de réponse.
+    
+    Ajoute aussi le paramètre `trace` à l'outil: en mode trace (par appel,
+    ou pour tous avec CFNEWS_TRACE=true), la durée de chaque phase est
+    renvoyée sous la clé `_timings` de la réponse. Les appels échantillonnés
+    par le profileur sont écrits dans CFNEWS_PROFILE_DIR.
+    
+    Les paramètres `max_bytes` / `max_tokens` (ou CFNEWS_MAX_RESPONSE_BYTES)
+    fixent un budget de taille appliqué à l'encodage de la réponse (voir
+    utils/budget.py).
+    
+    `@instrumented(extras=False)` mesure l'outil sans lui ajouter ces
+    paramètres (outils à réponse courte, sans phases à détailler).
+    """
+    if tool is None:
+        return functools.partial(instrumented, extras=extras)
+    name = tool.__name__
+    
+    @functools.wraps(tool)
+    async def wrapper(
+        *args: Any,
+        trace: bool = False,
+        max_bytes: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> str:
+        start = time.perf_counter()
+        outcome = "error"
+        token = tracing.begin() if trace or tracing.enabled_by_env() else None
+        limit = budget.limit(max_bytes or MAX_RESPONSE_BYTES, max_tokens)
+        budget_token = budget.begin(limit) if limit is not None else None
+        profile = profiler.start() if profiler is not None else None
+        try:
+            result = await tool(*args, **kwargs)
+            outcome = "error" if result.startswith('{"error"') else "ok"
+            if token is not None:
+                result = with_timings(result, tracing.current().timings())
+            metrics.TOOL_RESPONSE_BYTES.observe(response_bytes(result), name)
+            return result
+        finally:
+            if profile is not None:
+                logger.info("Profil de %s écrit dans %s", name, profiler.stop(profile, name))
+            if token is not None:
+                tracing.end(token)
+            if budget_token is not None:
+                budget.end(budget_token)
+            metrics.TOOL_LATENCY.observe(time.perf_counter() - start, name)
+            metrics.TOOL_CALLS.inc(name, outcome)
+    
+    if not extras:
+        return wrapper
+    extra = {"trace": (bool, False), "max_bytes": (Optional[int], None), "max_tokens": (Optional[int], None)}
+    signature = inspect.signature(tool)
+    wrapper.__signature__ = signature.replace(parameters=[
+        *signature.parameters.values(),
+        *(
+            inspect.Parameter(param, inspect.Parameter.KEYWORD_ONLY, default=default, annotation=annotation)
+            for param, (annotation, default) in extra.items()
+        )
+    ])
+    wrapper.__annotations__ = {
+        **tool.__annotations__,
+        **{param: annotation for param, (annotation, _) in extra.items()}
+    }
+    if tool.__doc__ and "\n    \n    Returns:" in tool.__doc__:
+        wrapper.__doc__ = tool.__doc__.replace(
+            "\n    \n    Returns:", "\n" + TRACE_DOC + BUDGET_DOC + "    \n    Returns:", 1
+        )
+    return wrapper
+
+
+def with_timings(result: str, timings: Dict[str, Any]) -> str:
+    """Ajoute `_timings` à une réponse JSON (objet) en conservant son indentation."""
+    data = json_codec.loads(result)
+    if not isinstance(data, dict):
+        return result
+    data["_timings"] = timings
+    return decoded(json_codec.dumps_bytes(data, indent="\n" in result))
+
+
+def collect_client_metrics() -> List[str]:
+    """Statistiques du client, du cache et du miroir, lues au moment de la collecte."""
+    lines: List[str] = []
+    if client is not None:
+        stats = client.stats()
+        lines += metrics.gauge_lines("cfnews_coalesced_requests_total", "Requêtes servies par une requête en vol", stats["coalesced"], "counter")
+        lines += metrics.gauge_lines("cfnews_upstream_retries_total", "Nouvelles tentatives vers l'API CFNEWS", stats["retries"], "counter")
+        lines += metrics.gauge_lines("cfnews_cache_revalidations_total", "Réponses expirées revalidées par un 304", stats["revalidated"], "counter")
+        if stats["circuit"] is not None:
+            lines += metrics.gauge_lines("cfnews_circuit_open", "Disjoncteur ouvert (1) ou fermé (0)", int(stats["circuit"] != "closed"))
+        cache = stats["cache"]
+        if cache is not None:
+            for key in ("hits", "misses", "evictions"):
+                lines += metrics.gauge_lines(f"cfnews_cache_{key}_total", f"Cache de réponses: {key}", cache[key], "counter")
+            lines += metrics.gauge_lines("cfnews_cache_entries", "Entrées du cache de réponses", cache["entries"])
+            lines += metrics.gauge_lines("cfnews_cache_bytes", "Taille du cache de réponses (octets)", cache["bytes"])
+        entities = stats["entities"]
+        if entities is not None:
+            for key in ("hits", "misses", "evictions"):
+                lines += metrics.gauge_lines(f"cfnews_entity_{key}_total", f"Entités par ID: {key}", entities[key], "counter")
+            lines += metrics.gauge_lines("cfnews_entities", "Entités en mémoire", entities["entries"])
+        prefetch = stats["prefetch"]
+        if prefetch is not None:
+            for key in ("issued", "skipped", "failed", "hits", "expired"):
+                lines += metrics.gauge_lines(f"cfnews_prefetch_{key}_total", f"Préchargement de pages: {key}", prefetch[key], "counter")
+            lines += metrics.gauge_lines("cfnews_prefetch_hit_rate", "Part des pages préchargées ensuite demandées", prefetch["hit_rate"])
+    lines += metrics.gauge_lines("cfnews_cursors", "Curseurs de recherche ouverts", len(cursors))
+    watch_stats = watches.stats()
+    lines += metrics.gauge_lines("cfnews_watches", "Veilles enregistrées", watch_stats["watches"])
+    for key in ("polls", "requests", "new_items", "errors"):
+        lines += metrics.gauge_lines(f"cfnews_watch_{key}_total", f"Relève des veilles: {key}", watch_stats[key], "counter")
+    if mirror is not None:
+        lines += metrics.gauge_lines("cfnews_mirror_hits_total", "Recherches servies par le miroir local", mirror.hits, "counter")
+        lines += metrics.gauge_lines("cfnews_mirror_fallbacks_total", "Recherches non couvertes par le miroir", mirror.fallbacks, "counter")
+    return lines
+
+
+metrics.REGISTRY.add_collector(collect_client_metrics)
+
+
+@mcp.custom_route("/metrics", methods=["GET"], include_in_schema=False)
+async def metrics_endpoint(request: Request) -> Response:
+    """Expose les métriques au format Prometheus (servi par run_server.py)."""
+    return Response(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
 def get_client() -> CFNewsClient:
     """Récupère ou initialise le client API."""
     global client
@@ -26,46 +253,599 @@ def get_client() -> CFNewsClient:
         api_key = os.getenv("CFNEWS_API_KEY")
         if not api_key:
             raise ValueError("CFNEWS_API_KEY non définie dans les variables d'environnement")
-        client = CFNewsClient(api_key)
+        client = CFNewsClient(
+            api_key,
+            timeout=httpx.Timeout(
+                float(os.getenv("CFNEWS_READ_TIMEOUT", 30)),
+                connect=float(os.getenv("CFNEWS_CONNECT_TIMEOUT", 5)),
+                pool=float(os.getenv("CFNEWS_POOL_TIMEOUT", 10))
+            ),
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("CFNEWS_HTTP_MAX_CONNECTIONS", 100)),
+                max_keepalive_connections=int(os.getenv("CFNEWS_HTTP_MAX_KEEPALIVE", 20)),
+                keepalive_expiry=float(os.getenv("CFNEWS_HTTP_KEEPALIVE_EXPIRY", 60))
+            ),
+            http2=os.getenv("CFNEWS_HTTP2", "false").lower() in ("1", "true", "yes"),
+            cache=build_cache(),
+            cache_ttls=cache_ttls_from_env(),
+            retry=RetryPolicy(
+                max_attempts=int(os.getenv("CFNEWS_RETRY_ATTEMPTS", 3)),
+                base_delay=float(os.getenv("CFNEWS_RETRY_BASE_DELAY", 0.5)),
+                max_retry_after=float(os.getenv("CFNEWS_RETRY_MAX_WAIT", 30))
+            ),
+            rate_limiter=build_rate_limiter(),
+            circuit_breaker=CircuitBreaker(
+                failure_threshold=int(os.getenv("CFNEWS_CIRCUIT_THRESHOLD", 5)),
+                reset_timeout=float(os.getenv("CFNEWS_CIRCUIT_RESET", 30))
+            ),
+            prefetcher=build_prefetcher(),
+            entities=build_entity_store()
+        )
     return client
 
 
-def format_response(data: Dict[str, Any], max_items: int = 10) -> str:
+# Miroir local des opérations et actualités (CFNEWS_MIRROR_PATH)
+mirror: Optional["Mirror"] = None
+
+# Âge maximum (secondes) de la dernière synchronisation pour répondre depuis le miroir
+MIRROR_MAX_AGE = float(os.getenv("CFNEWS_MIRROR_MAX_AGE", 3600))
+
+
+def get_mirror() -> Optional["Mirror"]:
+    """Récupère ou ouvre le miroir local (None si CFNEWS_MIRROR_PATH n'est pas défini)."""
+    global mirror
+    if mirror is None and os.getenv("CFNEWS_MIRROR_PATH"):
+        from utils.mirror import Mirror
+        mirror = Mirror(os.getenv("CFNEWS_MIRROR_PATH"))
+    return mirror
+
+
+def build_mirror_sync(api_client: CFNewsClient, local_mirror: "Mirror") -> "MirrorSync":
+    """Synchronisation du miroir configurée à partir des variables d'environnement."""
+    from utils.mirror import MirrorSync
+    since = os.getenv("CFNEWS_MIRROR_SINCE")
+    return MirrorSync(
+        api_client,
+        local_mirror,
+        since=date.fromisoformat(since) if since else date.today() - timedelta(days=365),
+        overlap_days=int(os.getenv("CFNEWS_MIRROR_OVERLAP_DAYS", 7)),
+        interval=float(os.getenv("CFNEWS_MIRROR_INTERVAL", 900))
+    )
+
+
+def build_rate_limiter() -> Optional[TokenBucket]:
+    """Limiteur de débit dimensionné sur le quota CFNEWS (CFNEWS_RATE_LIMIT req/s)."""
+    rate = float(os.getenv("CFNEWS_RATE_LIMIT", 0))
+    if rate <= 0:
+        return None
+    burst = os.getenv("CFNEWS_RATE_BURST")
+    return TokenBucket(rate, float(burst) if burst else None)
+
+
+def build_entity_store() -> Optional[EntityStore]:
+    """Entités vues dans les réponses (CFNEWS_ENTITY_MAX_ENTRIES, 0 = désactivé)."""
+    max_entries = int(os.getenv("CFNEWS_ENTITY_MAX_ENTRIES", 20000))
+    if max_entries <= 0:
+        return None
+    return EntityStore(max_entries, ttl=float(os.getenv("CFNEWS_ENTITY_TTL", 3600)))
+
+
+def build_prefetcher() -> Optional[Prefetcher]:
+    """Préchargement des pages suivantes (CFNEWS_PREFETCH_DEPTH pages, 0 = désactivé)."""
+    depth = int(os.getenv("CFNEWS_PREFETCH_DEPTH", 1))
+    if depth <= 0:
+        return None
+    return Prefetcher(depth, max_inflight=int(os.getenv("CFNEWS_PREFETCH_MAX_INFLIGHT", 4)))
+
+
+def build_cache() -> Optional[Union[ResponseCache, "SQLiteCache"]]:
     """
-    Formate la réponse de l'API pour le LLM.
+    Construit le cache de réponses à partir des variables d'environnement.
+    
+    Si CFNEWS_CACHE_PATH est défini, le cache est persistant (SQLite) et
+    partagé entre processus; sinon il est en mémoire.
+    """
+    if os.getenv("CFNEWS_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    cache_path = os.getenv("CFNEWS_CACHE_PATH")
+    if cache_path:
+        from utils.disk_cache import SQLiteCache
+        return SQLiteCache(
+            cache_path,
+            max_entries=int(os.getenv("CFNEWS_CACHE_MAX_ENTRIES", 10000)),
+            max_bytes=int(os.getenv("CFNEWS_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+        )
+    return ResponseCache(
+        max_entries=int(os.getenv("CFNEWS_CACHE_MAX_ENTRIES", 1024)),
+        max_bytes=int(os.getenv("CFNEWS_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+    )
+
+
+def cache_ttls_from_env() -> Dict[str, float]:
+    """Lit les surcharges de TTL (ex: CFNEWS_CACHE_TTL_ACTUALITE=30)."""
+    ttls = {}
+    for endpoint in CFNewsClient.CACHE_TTLS:
+        value = os.getenv(f"CFNEWS_CACHE_TTL_{endpoint.upper()}")
+        if value is not None:
+            ttls[endpoint] = float(value)
+    return ttls
+
+
+# Champs conservés par défaut en mode compact, par endpoint
+DEFAULT_FIELDS: Dict[str, List[str]] = {
+    "operation": ["id", "name", "date", "type", "amount", "target", "investors"],
+    "vehicule": ["id", "name", "management_company", "type", "segment", "status", "amount_raised", "vintage"],
+    "acteur": ["id", "name", "domain", "nationality", "region", "nb_deals"],
+    "societe": ["id", "name", "activity", "sector", "region", "revenue", "nb_deals"],
+    "people": ["id", "name", "title", "organization", "organization_type", "email"],
+    "mouvement": ["id", "date", "person", "from_organization", "to_organization", "title"],
+    "actualite": ["id", "title", "date", "themes", "summary", "url"],
+}
+
+
+# Dernière réponse sérialisée dans l'appel en cours et sa taille en octets:
+# la métrique de taille la reprend au lieu de réencoder la réponse
+last_encoded: "contextvars.ContextVar[Optional[Tuple[str, int]]]" = contextvars.ContextVar(
+    "cfnews_last_encoded", default=None
+)
+
+
+def decoded(encoded: bytes) -> str:
+    """Décode une réponse sérialisée en retenant sa taille en octets."""
+    text = encoded.decode("utf-8")
+    last_encoded.set((text, len(encoded)))
+    return text
+
+
+def response_bytes(result: str) -> int:
+    """Taille en octets d'une réponse d'outil (sans réencodage si elle sort de dump_json)."""
+    recorded = last_encoded.get()
+    if recorded is not None and recorded[0] is result:
+        return recorded[1]
+    return len(result.encode("utf-8"))
+
+
+@tracing.traced("serialize")
+def dump_json(data: Any, compact: bool = False) -> str:
+    """
+    Sérialise une réponse: sans indentation en mode compact, dans le budget
+    de taille de l'appel en cours s'il y en a un (max_bytes / max_tokens).
+    """
+    max_bytes = budget.current()
+    if max_bytes is None:
+        return decoded(json_codec.dumps_bytes(data, indent=not compact))
+    encoded = budget.dumps_bytes(data, max_bytes, indent=not compact, on_omitted=restore_omitted)
+    if drop_spent_cursors(data):
+        # Réponse plus petite: les mêmes items tiennent dans le budget
+        encoded = budget.dumps_bytes(data, max_bytes, indent=not compact)
+    return decoded(encoded)
+
+
+def drop_spent_cursors(data: Any) -> bool:
+    """
+    Retire les curseurs épuisés d'une réponse (et de ses sous-objets).
+    
+    Sous budget, les recherches gardent un curseur même sur leur dernière
+    page: si le budget en retire des items, le curseur recule et permet de
+    les redemander; sinon il est épuisé et supprimé ici.
+    
+    Returns:
+        True si un curseur a été retiré
+    """
+    if not isinstance(data, dict):
+        return False
+    dropped = False
+    if isinstance(data.get("cursor"), str):
+        state = cursors.get(data["cursor"])
+        if state is None or state.exhausted:
+            cursors.discard(data.pop("cursor"))
+            dropped = True
+    for value in data.values():
+        dropped = drop_spent_cursors(value) or dropped
+    return dropped
+
+
+def restore_omitted(container: Any, omitted: int) -> None:
+    """
+    Items retirés par le budget: le curseur de la réponse reprend au premier
+    d'entre eux, et les nouveaux items d'une veille restent non lus.
+    """
+    if not isinstance(container, dict):
+        return
+    if "cursor" in container:
+        state = cursors.get(container["cursor"])
+        if state is not None:
+            state.rewind(omitted)
+    if "watch_id" in container:
+        watch = watches.get(container["watch_id"])
+        if watch is not None:
+            watch.restore(omitted)
+
+
+def prune_empty(value: Any) -> Any:
+    """Retire récursivement les champs nuls ou vides (None, "", [], {})."""
+    if isinstance(value, dict):
+        pruned = {k: prune_empty(v) for k, v in value.items()}
+        return {k: v for k, v in pruned.items() if v not in (None, "", [], {})}
+    if isinstance(value, list):
+        return [prune_empty(v) for v in value if v not in (None, "", [], {})]
+    return value
+
+
+def project_item(item: Any, fields: List[str], strict: bool = True) -> Any:
+    """
+    Ne garde que les champs demandés d'un item.
+    
+    Args:
+        item: Item de l'API
+        fields: Champs à conserver
+        strict: Si False (projection par défaut), l'item est renvoyé entier
+            quand il ne contient aucun des champs attendus hors `id`
+    """
+    if not isinstance(item, dict):
+        return item
+    projected = {k: item[k] for k in fields if k in item}
+    if not strict and len(projected.keys() - {"id"}) == 0:
+        return item
+    return projected
+
+
+def shape_items(
+    items: List[Any],
+    compact: bool = False,
+    fields: Optional[List[str]] = None,
+    endpoint: Optional[str] = None
+) -> List[Any]:
+    """Projette les items (champs demandés ou projection par défaut) et retire les champs vides."""
+    if fields and "*" not in fields:
+        items = [project_item(item, fields) for item in items]
+    elif compact and not fields and endpoint in DEFAULT_FIELDS:
+        items = [project_item(item, DEFAULT_FIELDS[endpoint], strict=False) for item in items]
+    if compact:
+        items = prune_empty(items)
+    return items
+
+
+@tracing.traced("format")
+def shape_response(
+    data: Dict[str, Any],
+    max_items: int = 10,
+    compact: bool = False,
+    fields: Optional[List[str]] = None,
+    endpoint: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Met en forme la réponse de l'API pour le LLM (voir format_response).
     
     Args:
         data: Données de l'API
         max_items: Nombre maximum d'items à retourner
+        compact: JSON sans indentation, champs vides retirés et projection
+            par défaut de l'endpoint (DEFAULT_FIELDS)
+        fields: Champs à conserver dans chaque item (["*"] pour tous)
+        endpoint: Endpoint interrogé, pour la projection par défaut
     """
     if "items" not in data:
-        return json.dumps(data, ensure_ascii=False, indent=2)
+        return prune_empty(data) if compact else data
+    
+    items = shape_items(data["items"][:max_items], compact, fields, endpoint)
     
     result = {
         "count": data.get("count", 0),
         "total": data.get("total", 0),
         "page": data.get("page", 1),
         "nb_pages": data.get("nb_pages", 1),
-        "items": data["items"][:max_items]
+        "items": items
     }
     
     if data.get("total", 0) > max_items:
         result["note"] = f"Affichage des {max_items} premiers résultats sur {data['total']} au total"
     
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return result
+
+
+def format_response(
+    data: Dict[str, Any],
+    max_items: int = 10,
+    compact: bool = False,
+    fields: Optional[List[str]] = None,
+    endpoint: Optional[str] = None
+) -> str:
+    """
+    Formate la réponse de l'API pour le LLM.
+    
+    Args:
+        data: Données de l'API
+        max_items: Nombre maximum d'items à retourner
+        compact: JSON sans indentation, champs vides retirés et projection
+            par défaut de l'endpoint (DEFAULT_FIELDS)
+        fields: Champs à conserver dans chaque item (["*"] pour tous)
+        endpoint: Endpoint interrogé, pour la projection par défaut
+    """
+    return dump_json(shape_response(data, max_items, compact, fields, endpoint), compact)
+
+
+# Plafond dur du nombre d'items renvoyés en mode fetch_all
+FETCH_ALL_MAX_ITEMS = int(os.getenv("CFNEWS_FETCH_ALL_MAX_ITEMS", 500))
+
+# Nombre maximum de pages récupérées simultanément en mode fetch_all
+FETCH_CONCURRENCY = int(os.getenv("CFNEWS_FETCH_CONCURRENCY", 4))
+
+# Curseurs des recherches (suite servie par next_results)
+cursors = CursorStore(
+    max_entries=int(os.getenv("CFNEWS_CURSOR_MAX_ENTRIES", 256)),
+    ttl=float(os.getenv("CFNEWS_CURSOR_TTL", 1800))
+)
+
+# Délai entre deux relèves des veilles (secondes; 0 = relève seulement à la demande)
+WATCH_INTERVAL = float(os.getenv("CFNEWS_WATCH_INTERVAL", 300))
+
+# Veilles (nouveaux items servis par get_watch_updates), relevées avec le client partagé
+watches = WatchPoller(
+    get_client,
+    interval=WATCH_INTERVAL,
+    page_size=int(os.getenv("CFNEWS_WATCH_PAGE_SIZE", 20)),
+    max_pages=int(os.getenv("CFNEWS_WATCH_MAX_PAGES", 5)),
+    max_pending=int(os.getenv("CFNEWS_WATCH_MAX_PENDING", 500)),
+    max_watches=int(os.getenv("CFNEWS_WATCH_MAX_WATCHES", 100))
+)
+
+
+async def fetch_all_pages(
+    api_client: CFNewsClient,
+    endpoint: str,
+    query_params: Dict[str, Any],
+    max_items: int
+) -> Dict[str, Any]:
+    """
+    Récupère plusieurs pages en parallèle et les fusionne en une réponse.
+    
+    Args:
+        api_client: Client API
+        endpoint: Endpoint à interroger
+        query_params: Paramètres de recherche
+        max_items: Nombre maximum d'items à conserver
+    """
+    max_items = max(1, min(max_items, FETCH_ALL_MAX_ITEMS))
+    items: List[Dict[str, Any]] = []
+    total = 0
+    nb_pages = 1
+    pages = api_client.iter_pages(
+        endpoint, query_params,
+        concurrency=FETCH_CONCURRENCY,
+        max_items=max_items,
+        limit=max_items
+    )
+    async for data in pages:
+        if not items:
+            total = data.get("total", 0)
+            nb_pages = data.get("nb_pages", 1)
+        items.extend(data.get("items") or [])
+        if len(items) >= max_items:
+            break
+    await pages.aclose()
+    
+    return {
+        "count": min(len(items), max_items),
+        "total": total,
+        "page": 1,
+        "nb_pages": nb_pages,
+        "items": items[:max_items]
+    }
+
+
+async def search_result(
+    api_client: CFNewsClient,
+    endpoint: str,
+    query_params: Dict[str, Any],
+    page: int,
+    max_results: int,
+    fetch_all: bool = False,
+    max_items: int = 200,
+    compact: bool = False,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Exécute une recherche (une page, ou toutes en mode fetch_all) et la met en forme.
+    
+    La recherche est servie par le miroir local s'il est à jour
+    (CFNEWS_MIRROR_MAX_AGE) et couvre la période et les filtres demandés.
+    
+    Args:
+        api_client: Client API
+        endpoint: Endpoint à interroger
+        query_params: Paramètres de recherche
+        page: Numéro de page (pages de `max_results` items)
+        max_results: Nombre maximum de résultats à afficher
+        fetch_all: Récupère toutes les pages
+        max_items: Nombre maximum d'items en mode fetch_all
+        compact: Réponse compacte (voir format_response)
+        fields: Champs à conserver dans chaque item
+    """
+    local_mirror = get_mirror()
+    if local_mirror is not None and local_mirror.is_fresh(endpoint, MIRROR_MAX_AGE):
+        if fetch_all:
+            page, max_results = 1, max(1, min(max_items, FETCH_ALL_MAX_ITEMS))
+        result = local_mirror.search(endpoint, query_params, page, max_results)
+        if result is not None:
+            return with_cursor(
+                shape_response(result, max_results, compact, fields, endpoint),
+                endpoint, query_params, result, (page - 1) * max_results, max_results, max_results, compact, fields
+            )
+    
+    if fetch_all:
+        result = await fetch_all_pages(api_client, endpoint, query_params, max_items)
+        return with_cursor(
+            shape_response(result, len(result["items"]), compact, fields, endpoint),
+            endpoint, query_params, result, 0, max(1, min(max_items, FETCH_ALL_MAX_ITEMS)), max_results, compact, fields
+        )
+    
+    result = await api_client.search_window(
+        endpoint, query_params, page, max_results,
+        concurrency=FETCH_CONCURRENCY
+    )
+    return with_cursor(
+        shape_response(result, max_results, compact, fields, endpoint),
+        endpoint, query_params, result, (page - 1) * max_results, max_results, max_results, compact, fields
+    )
+
+
+def with_cursor(
+    shaped: Dict[str, Any],
+    endpoint: str,
+    query_params: Dict[str, Any],
+    result: Dict[str, Any],
+    start: int,
+    chunk_size: int,
+    max_results: int,
+    compact: bool,
+    fields: Optional[List[str]]
+) -> Dict[str, Any]:
+    """
+    Ajoute à une réponse de recherche un curseur (`cursor`) vers la suite des résultats.
+    
+    Le curseur garde les items déjà téléchargés au-delà de ceux affichés et
+    continue par pages amont de `chunk_size` items, alignées sur celles de
+    la recherche.
+    
+    Args:
+        shaped: Réponse mise en forme (voir shape_response)
+        endpoint: Endpoint interrogé
+        query_params: Paramètres de recherche
+        result: Réponse brute (items téléchargés à partir de `start`)
+        start: Position du premier item de `result` dans les résultats
+        chunk_size: Taille des pages amont (au plus CFNewsClient.MAX_LIMIT)
+        max_results: Nombre de résultats par défaut de next_results
+        compact: Mise en forme par défaut de next_results
+        fields: Champs par défaut de next_results
+    """
+    if "items" not in shaped:
+        return shaped
+    shown = len(shaped["items"])
+    total = int(result.get("total", 0))
+    exhausted = start + shown >= total
+    # Sous budget, un curseur est gardé sur la dernière page (voir drop_spent_cursors)
+    if exhausted and budget.current() is None:
+        return shaped
+    if "note" in shaped and not exhausted:
+        shaped["note"] += " (suite: next_results avec `cursor`)"
+    shaped["cursor"] = cursors.add(Cursor(
+        endpoint, dict(query_params), offset=start + shown, total=total,
+        chunk_size=min(chunk_size, CFNewsClient.MAX_LIMIT), max_results=max_results,
+        compact=compact, fields=fields,
+        buffer=(result.get("items") or [])[shown:], buffer_start=start + shown
+    ))
+    return shaped
+
+
+async def fetch_chunk(
+    api_client: CFNewsClient,
+    endpoint: str,
+    query_params: Dict[str, Any],
+    page: int,
+    size: int
+) -> Dict[str, Any]:
+    """Page amont `page` de `size` items d'une recherche (miroir local s'il la couvre)."""
+    local_mirror = get_mirror()
+    if local_mirror is not None and local_mirror.is_fresh(endpoint, MIRROR_MAX_AGE):
+        result = local_mirror.search(endpoint, query_params, page, size)
+        if result is not None:
+            return result
+    return await api_client.search(endpoint, page, query_params, limit=size)
+
+
+async def run_search(
+    api_client: CFNewsClient,
+    endpoint: str,
+    query_params: Dict[str, Any],
+    page: int,
+    max_results: int,
+    fetch_all: bool = False,
+    max_items: int = 200,
+    compact: bool = False,
+    fields: Optional[List[str]] = None
+) -> str:
+    """Exécute une recherche et la formate en JSON (voir search_result)."""
+    result = await search_result(
+        api_client, endpoint, query_params, page, max_results,
+        fetch_all, max_items, compact, fields
+    )
+    return dump_json(result, compact)
+
+
+@tracing.traced("filters")
+def operation_filters(
+    company_name: Optional[str] = None,
+    operation_types: Optional[List[str]] = None,
+    operation_subtypes: Optional[List[str]] = None,
+    sectors: Optional[List[str]] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    amount_min: Optional[float] = None,
+    amount_max: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Construit les paramètres de recherche des opérations (voir search_operations).
+    
+    Args:
+        company_name: Nom de la société cible
+        operation_types: Types d'opérations (ex: ["LBO", "Capital Développement"])
+        operation_subtypes: Sous-types (ex: ["LBO bis", "Build-up", "Amorçage"])
+        sectors: Secteurs d'activité (ex: ["Biotechnologies", "Services Financiers"])
+        date_from: Date de début (format DD/MM/YYYY)
+        date_to: Date de fin (format DD/MM/YYYY)
+        amount_min: Montant minimum de l'opération en M€
+        amount_max: Montant maximum de l'opération en M€
+    
+    Raises:
+        TaxonomyError: Libellé inconnu
+    """
+    filters = {}
+    
+    if company_name:
+        filters["op_nom"] = company_name
+    
+    if operation_types:
+        filters["op_type"] = OPERATION_TYPES.resolve_many(operation_types)
+    
+    if operation_subtypes:
+        filters["op_sstype"] = OPERATION_SUBTYPES.resolve_many(operation_subtypes)
+    
+    if sectors:
+        filters["sector"] = SECTORS.resolve_many(sectors)
+    
+    if date_from:
+        filters["depuis"] = date_from
+    
+    if date_to:
+        filters["jusquau"] = date_to
+    
+    if amount_min is not None:
+        filters["Montantmin"] = amount_min
+    
+    if amount_max is not None:
+        filters["Montantmax"] = amount_max
+    
+    return CFNewsClient.operation_params(filters)
 
 
 @mcp.tool()
+@instrumented
 async def search_operations(
     company_name: Optional[str] = None,
     operation_types: Optional[List[str]] = None,
+    operation_subtypes: Optional[List[str]] = None,
     sectors: Optional[List[str]] = None,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
     amount_min: Optional[float] = None,
     amount_max: Optional[float] = None,
     page: int = 1,
-    max_results: int = 10
+    max_results: int = 10,
+    fetch_all: bool = False,
+    max_items: int = 200,
+    compact: bool = False,
+    fields: Optional[List[str]] = None
 ) -> str:
     """
     Recherche des opérations (deals, LBO, M&A, etc.) dans la base CFNEWS.
@@ -73,13 +853,18 @@ async def search_operations(
     Args:
         company_name: Nom de la société cible
         operation_types: Types d'opérations (ex: ["LBO", "Capital Développement"])
+        operation_subtypes: Sous-types (ex: ["LBO bis", "Build-up", "Amorçage"])
         sectors: Secteurs d'activité (ex: ["Biotechnologies", "Services Financiers"])
         date_from: Date de début (format DD/MM/YYYY)
         date_to: Date de fin (format DD/MM/YYYY)
         amount_min: Montant minimum de l'opération en M€
         amount_max: Montant maximum de l'opération en M€
-        page: Numéro de page
+        page: Numéro de page (pages de max_results résultats)
         max_results: Nombre maximum de résultats à afficher
+        fetch_all: Récupère toutes les pages en une fois (ignore page/max_results)
+        max_items: Nombre maximum d'items en mode fetch_all (plafonné côté serveur)
+        compact: Réponse compacte (champs principaux, sans champs vides ni indentation)
+        fields: Champs à renvoyer pour chaque item (["*"] pour tous)
     
     Returns:
         JSON formaté des opérations trouvées
@@ -87,63 +872,84 @@ async def search_operations(
     try:
         api_client = get_client()
         
-        # Construire les filtres
-        filters = {}
-        
-        if company_name:
-            filters["op_nom"] = company_name
-        
-        if operation_types:
-            # Mapping des types d'opérations communs
-            type_mapping = {
-                "LBO": 271,
-                "Capital Développement": 273,
-                "Capital Innovation": 274,
-                "M&A Corporate": 272,
-                "Financement": 29093,
-                "Immobilier": 275,
-                "Infrastructure": 199547,
-                "Restructuration": 14447,
-                "Bourse": 25006
-            }
-            filters["op_type"] = [type_mapping.get(t, t) for t in operation_types]
-        
-        if sectors:
-            # Mapping des secteurs communs
-            sector_mapping = {
-                "Biotechnologies": 124,
-                "Corporate Finance": 19486,
-                "Services Financiers": 305,
-                "Logiciel et services informatiques": 297,
-                "Internet & ecommerce, eservices": 296,
-                "Santé, beauté et services associés": 302
-            }
-            filters["sector"] = [sector_mapping.get(s, s) for s in sectors]
-        
-        if date_from:
-            filters["depuis"] = date_from
-        
-        if date_to:
-            filters["jusquau"] = date_to
+        filters = operation_filters(
+            company_name=company_name,
+            operation_types=operation_types,
+            operation_subtypes=operation_subtypes,
+            sectors=sectors,
+            date_from=date_from,
+            date_to=date_to,
+            amount_min=amount_min,
+            amount_max=amount_max
+        )
         
-        if amount_min is not None:
-            filters["Montantmin"] = amount_min
-        
-        if amount_max is not None:
-            filters["Montantmax"] = amount_max
-        
-        # Effectuer la recherche
-        result = await api_client.get_operations(page=page, filters=filters)
-        
-        return format_response(result, max_results)
+        return await run_search(
+            api_client, "operation", filters,
+            page, max_results, fetch_all, max_items,
+            compact=compact, fields=fields
+        )
     
+    except TaxonomyError as e:
+        return json.dumps({"error": str(e), "suggestions": e.suggestions}, ensure_ascii=False)
     except CFNewsAPIError as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
     except Exception as e:
         return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
 
 
+@tracing.traced("filters")
+def fund_filters(
+    fund_name: Optional[str] = None,
+    management_company: Optional[str] = None,
+    fund_types: Optional[List[str]] = None,
+    segments: Optional[List[str]] = None,
+    status: Optional[List[str]] = None,
+    amount_raised_min: Optional[float] = None,
+    amount_raised_max: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Construit les paramètres de recherche des fonds (voir search_funds).
+    
+    Args:
+        fund_name: Nom du véhicule
+        management_company: Société de gestion
+        fund_types: Types de véhicules (ex: ["FCPR", "FPCI"])
+        segments: Segments (ex: ["LBO", "Capital développement", "Venture Capital"])
+        status: Statuts (ex: ["Closé", "En cours de levée"])
+        amount_raised_min: Montant levé minimum en M€
+        amount_raised_max: Montant levé maximum en M€
+    
+    Raises:
+        TaxonomyError: Libellé inconnu
+    """
+    filters = {}
+    
+    if fund_name:
+        filters["vehicle_nom"] = fund_name
+    
+    if management_company:
+        filters["vehicle_soc_nom"] = management_company
+    
+    if fund_types:
+        filters["vehicle_type"] = VEHICLE_TYPES.resolve_many(fund_types)
+    
+    if segments:
+        filters["vehicle_segment"] = VEHICLE_SEGMENTS.resolve_many(segments)
+    
+    if status:
+        filters["vehicle_status"] = VEHICLE_STATUSES.resolve_many(status)
+    
+    if amount_raised_min is not None:
+        filters["Montantmin"] = amount_raised_min
+    
+    if amount_raised_max is not None:
+        filters["Montantmax"] = amount_raised_max
+    
+    return filters
+
+
 @mcp.tool()
+@instrumented
 async def search_funds(
     fund_name: Optional[str] = None,
     management_company: Optional[str] = None,
@@ -153,7 +959,11 @@ async def search_funds(
     amount_raised_min: Optional[float] = None,
     amount_raised_max: Optional[float] = None,
     page: int = 1,
-    max_results: int = 10
+    max_results: int = 10,
+    fetch_all: bool = False,
+    max_items: int = 200,
+    compact: bool = False,
+    fields: Optional[List[str]] = None
 ) -> str:
     """
     Recherche des véhicules d'investissement (fonds) dans CFNEWS.
@@ -166,8 +976,12 @@ async def search_funds(
         status: Statuts (ex: ["Closé", "En cours de levée"])
         amount_raised_min: Montant levé minimum en M€
         amount_raised_max: Montant levé maximum en M€
-        page: Numéro de page
+        page: Numéro de page (pages de max_results résultats)
         max_results: Nombre maximum de résultats
+        fetch_all: Récupère toutes les pages en une fois (ignore page/max_results)
+        max_items: Nombre maximum d'items en mode fetch_all (plafonné côté serveur)
+        compact: Réponse compacte (champs principaux, sans champs vides ni indentation)
+        fields: Champs à renvoyer pour chaque item (["*"] pour tous)
     
     Returns:
         JSON formaté des fonds trouvés
@@ -175,55 +989,73 @@ async def search_funds(
     try:
         api_client = get_client()
         
-        filters = {}
-        
-        if fund_name:
-            filters["vehicle_nom"] = fund_name
-        
-        if management_company:
-            filters["vehicle_soc_nom"] = management_company
-        
-        if fund_types:
-            filters["vehicle_type"] = fund_types
-        
-        if segments:
-            # Mapping des segments communs
-            segment_mapping = {
-                "LBO": 189615,
-                "Capital développement": 189607,
-                "Capital innovation / VC": 189608,
-                "Amorçage": 189606,
-                "Dette": 189609,
-                "Fonds de fonds": 189610
-            }
-            filters["vehicle_segment"] = [segment_mapping.get(s, s) for s in segments]
-        
-        if status:
-            # Mapping des statuts
-            status_mapping = {
-                "Closé": 189639,
-                "En cours de levée": 189636,
-                "1er closing": 189637
-            }
-            filters["vehicle_status"] = [status_mapping.get(s, s) for s in status]
-        
-        if amount_raised_min is not None:
-            filters["Montantmin"] = amount_raised_min
-        
-        if amount_raised_max is not None:
-            filters["Montantmax"] = amount_raised_max
-        
-        result = await api_client.get_vehicules(page=page, filters=filters)
+        filters = fund_filters(
+            fund_name=fund_name,
+            management_company=management_company,
+            fund_types=fund_types,
+            segments=segments,
+            status=status,
+            amount_raised_min=amount_raised_min,
+            amount_raised_max=amount_raised_max
+        )
         
-        return format_response(result, max_results)
+        return await run_search(
+            api_client, "vehicule", filters,
+            page, max_results, fetch_all, max_items,
+            compact=compact, fields=fields
+        )
     
+    except TaxonomyError as e:
+        return json.dumps({"error": str(e), "suggestions": e.suggestions}, ensure_ascii=False)
     except CFNewsAPIError as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
     except Exception as e:
         return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
 
 
+@tracing.traced("filters")
+def actor_filters(
+    actor_name: Optional[str] = None,
+    actor_types: Optional[List[str]] = None,
+    nationalities: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    is_tech_fund: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Construit les paramètres de recherche des acteurs (voir search_actors).
+    
+    Args:
+        actor_name: Nom de l'acteur
+        actor_types: Types d'acteurs (ex: ["Fonds d'investissement", "Avocats", "Banquiers"])
+        nationalities: Nationalités (codes ISO: "FR", "US", "GB", etc.)
+        regions: Régions françaises (ex: ["Île-de-France", "Auvergne-Rhône-Alpes"])
+        is_tech_fund: Filtre pour les fonds TECH uniquement
+    
+    Raises:
+        TaxonomyError: Libellé inconnu
+    """
+    filters = {}
+    
+    if actor_name:
+        filters["acteur_nom"] = actor_name
+    
+    if actor_types:
+        filters["acteur_domaine"] = ACTOR_TYPES.resolve_many(actor_types)
+    
+    if nationalities:
+        filters["acteur_zone"] = NATIONALITIES.resolve_many(nationalities)
+    
+    if regions:
+        filters["acteur_region"] = REGIONS.resolve_many(regions)
+    
+    if is_tech_fund is not None:
+        filters["uniqut_istech"] = "oui" if is_tech_fund else "non"
+    
+    return filters
+
+
 @mcp.tool()
+@instrumented
 async def search_actors(
     actor_name: Optional[str] = None,
     actor_types: Optional[List[str]] = None,
@@ -231,7 +1063,11 @@ async def search_actors(
     regions: Optional[List[str]] = None,
     is_tech_fund: Optional[bool] = None,
     page: int = 1,
-    max_results: int = 10
+    max_results: int = 10,
+    fetch_all: bool = False,
+    max_items: int = 200,
+    compact: bool = False,
+    fields: Optional[List[str]] = None
 ) -> str:
     """
     Recherche des acteurs du corporate finance (fonds, avocats, banquiers, conseils).
@@ -242,8 +1078,12 @@ async def search_actors(
         nationalities: Nationalités (codes ISO: "FR", "US", "GB", etc.)
         regions: Régions françaises (ex: ["Île-de-France", "Auvergne-Rhône-Alpes"])
         is_tech_fund: Filtre pour les fonds TECH uniquement
-        page: Numéro de page
+        page: Numéro de page (pages de max_results résultats)
         max_results: Nombre maximum de résultats
+        fetch_all: Récupère toutes les pages en une fois (ignore page/max_results)
+        max_items: Nombre maximum d'items en mode fetch_all (plafonné côté serveur)
+        compact: Réponse compacte (champs principaux, sans champs vides ni indentation)
+        fields: Champs à renvoyer pour chaque item (["*"] pour tous)
     
     Returns:
         JSON formaté des acteurs trouvés
@@ -251,64 +1091,40 @@ async def search_actors(
     try:
         api_client = get_client()
         
-        filters = {}
-        
-        if actor_name:
-            filters["acteur_nom"] = actor_name
-        
-        if actor_types:
-            # Mapping des types d'acteurs
-            type_mapping = {
-                "Fonds d'investissement": 187,
-                "Avocats": 188,
-                "Banquiers": 189,
-                "Conseils": 190,
-                "Asset Managers": 451255,
-                "Investisseurs institutionnels": 191
-            }
-            filters["acteur_domaine"] = [type_mapping.get(t, t) for t in actor_types]
-        
-        if nationalities:
-            filters["acteur_zone"] = nationalities
-        
-        if regions:
-            # Mapping des régions
-            region_mapping = {
-                "Île-de-France": 132336,
-                "Auvergne-Rhône-Alpes": 132360,
-                "Occitanie": 132354,
-                "Grand Est": 132334,
-                "Hauts-de-France": 132355
-            }
-            filters["acteur_region"] = [region_mapping.get(r, r) for r in regions]
-        
-        if is_tech_fund is not None:
-            filters["uniqut_istech"] = "oui" if is_tech_fund else "non"
-        
-        result = await api_client.get_acteurs(page=page, filters=filters)
+        filters = actor_filters(
+            actor_name=actor_name,
+            actor_types=actor_types,
+            nationalities=nationalities,
+            regions=regions,
+            is_tech_fund=is_tech_fund
+        )
         
-        return format_response(result, max_results)
+        return await run_search(
+            api_client, "acteur", filters,
+            page, max_results, fetch_all, max_items,
+            compact=compact, fields=fields
+        )
     
+    except TaxonomyError as e:
+        return json.dumps({"error": str(e), "suggestions": e.suggestions}, ensure_ascii=False)
     except CFNewsAPIError as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
     except Exception as e:
         return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
 
 
-@mcp.tool()
-async def search_companies(
+@tracing.traced("filters")
+def company_filters(
     company_name: Optional[str] = None,
     company_types: Optional[List[str]] = None,
     sectors: Optional[List[str]] = None,
     regions: Optional[List[str]] = None,
     revenue_min: Optional[float] = None,
     revenue_max: Optional[float] = None,
-    is_tech: Optional[bool] = None,
-    page: int = 1,
-    max_results: int = 10
-) -> str:
+    is_tech: Optional[bool] = None
+) -> Dict[str, Any]:
     """
-    Recherche des sociétés dans la base CFNEWS.
+    Construit les paramètres de recherche des sociétés (voir search_companies).
     
     Args:
         company_name: Nom de la société
@@ -318,64 +1134,154 @@ async def search_companies(
         revenue_min: CA minimum en M€
         revenue_max: CA maximum en M€
         is_tech: Filtre entreprises TECH uniquement
-        page: Numéro de page
-        max_results: Nombre maximum de résultats
     
-    Returns:
-        JSON formaté des sociétés trouvées
+    Raises:
+        TaxonomyError: Libellé inconnu
     """
-    try:
-        api_client = get_client()
-        
-        filters = {}
-        
-        if company_name:
-            filters["soc_nom"] = company_name
-        
-        if company_types:
-            type_mapping = {
-                "Familiale": 260,
-                "Sté sous LBO": 20104,
-                "Cotée": 18904,
-                "Indépendante": 259
-            }
-            filters["soc_activity"] = [type_mapping.get(t, t) for t in company_types]
-        
-        if sectors:
-            sector_mapping = {
-                "Biotechnologies": 124,
-                "Services Financiers": 305,
-                "Logiciel et services informatiques": 297
-            }
-            filters["sector"] = [sector_mapping.get(s, s) for s in sectors]
-        
-        if regions:
-            region_mapping = {
-                "Île-de-France": 132336,
-                "Auvergne-Rhône-Alpes": 132360
-            }
-            filters["soc_region"] = [region_mapping.get(r, r) for r in regions]
-        
-        if revenue_min is not None:
-            filters["soc_camin"] = revenue_min
-        
-        if revenue_max is not None:
-            filters["soc_camax"] = revenue_max
-        
-        if is_tech is not None:
-            filters["uniqut_istech"] = "oui" if is_tech else "non"
+    filters = {}
+    
+    if company_name:
+        filters["soc_nom"] = company_name
+    
+    if company_types:
+        filters["soc_activity"] = COMPANY_TYPES.resolve_many(company_types)
+    
+    if sectors:
+        filters["sector"] = SECTORS.resolve_many(sectors)
+    
+    if regions:
+        filters["soc_region"] = REGIONS.resolve_many(regions)
+    
+    if revenue_min is not None:
+        filters["soc_camin"] = revenue_min
+    
+    if revenue_max is not None:
+        filters["soc_camax"] = revenue_max
+    
+    if is_tech is not None:
+        filters["uniqut_istech"] = "oui" if is_tech else "non"
+    
+    return filters
+
+
+@mcp.tool()
+@instrumented
+async def search_companies(
+    company_name: Optional[str] = None,
+    company_types: Optional[List[str]] = None,
+    sectors: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    revenue_min: Optional[float] = None,
+    revenue_max: Optional[float] = None,
+    is_tech: Optional[bool] = None,
+    page: int = 1,
+    max_results: int = 10,
+    fetch_all: bool = False,
+    max_items: int = 200,
+    compact: bool = False,
+    fields: Optional[List[str]] = None
+) -> str:
+    """
+    Recherche des sociétés dans la base CFNEWS.
+    
+    Args:
+        company_name: Nom de la société
+        company_types: Types (ex: ["Familiale", "Sté sous LBO", "Cotée"])
+        sectors: Secteurs d'activité
+        regions: Régions françaises
+        revenue_min: CA minimum en M€
+        revenue_max: CA maximum en M€
+        is_tech: Filtre entreprises TECH uniquement
+        page: Numéro de page (pages de max_results résultats)
+        max_results: Nombre maximum de résultats
+        fetch_all: Récupère toutes les pages en une fois (ignore page/max_results)
+        max_items: Nombre maximum d'items en mode fetch_all (plafonné côté serveur)
+        compact: Réponse compacte (champs principaux, sans champs vides ni indentation)
+        fields: Champs à renvoyer pour chaque item (["*"] pour tous)
+    
+    Returns:
+        JSON formaté des sociétés trouvées
+    """
+    try:
+        api_client = get_client()
         
-        result = await api_client.get_societes(page=page, filters=filters)
+        filters = company_filters(
+            company_name=company_name,
+            company_types=company_types,
+            sectors=sectors,
+            regions=regions,
+            revenue_min=revenue_min,
+            revenue_max=revenue_max,
+            is_tech=is_tech
+        )
         
-        return format_response(result, max_results)
+        return await run_search(
+            api_client, "societe", filters,
+            page, max_results, fetch_all, max_items,
+            compact=compact, fields=fields
+        )
     
+    except TaxonomyError as e:
+        return json.dumps({"error": str(e), "suggestions": e.suggestions}, ensure_ascii=False)
     except CFNewsAPIError as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
     except Exception as e:
         return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
 
 
+@tracing.traced("filters")
+def people_filters(
+    name: Optional[str] = None,
+    organization: Optional[str] = None,
+    titles: Optional[List[str]] = None,
+    organization_types: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    executives_only: bool = False,
+    with_email: bool = False
+) -> Dict[str, Any]:
+    """
+    Construit les paramètres de recherche des personnalités (voir search_people).
+    
+    Args:
+        name: Nom ou prénom de la personne
+        organization: Organisation actuelle
+        titles: Titres/fonctions (ex: ["Directeur général", "Associé(e)"])
+        organization_types: Types d'organisation (ex: ["Fonds", "Avocats"])
+        regions: Régions de l'organisation
+        executives_only: Filtre cadres dirigeants/CODIR uniquement
+        with_email: Filtre uniquement avec email renseigné
+    
+    Raises:
+        TaxonomyError: Libellé inconnu
+    """
+    filters = {}
+    
+    if name:
+        filters["people_nom"] = name
+    
+    if organization:
+        filters["people_societe"] = organization
+    
+    if titles:
+        filters["people_titres"] = PEOPLE_TITLES.resolve_many(titles)
+    
+    if organization_types:
+        filters["people_type_organisation"] = PEOPLE_ORGANIZATION_TYPES.resolve_many(organization_types)
+    
+    if regions:
+        filters["people_region"] = REGIONS.resolve_many(regions)
+    
+    if executives_only:
+        filters["ciblage_dirigeants"] = "Dirigeants"
+    
+    if with_email:
+        filters["uniqut_avec_email"] = "oui"
+    
+    return filters
+
+
 @mcp.tool()
+@instrumented
 async def search_people(
     name: Optional[str] = None,
     organization: Optional[str] = None,
@@ -385,7 +1291,11 @@ async def search_people(
     executives_only: bool = False,
     with_email: bool = False,
     page: int = 1,
-    max_results: int = 10
+    max_results: int = 10,
+    fetch_all: bool = False,
+    max_items: int = 200,
+    compact: bool = False,
+    fields: Optional[List[str]] = None
 ) -> str:
     """
     Recherche des personnalités dans le bottin CFNEWS.
@@ -398,8 +1308,12 @@ async def search_people(
         regions: Régions de l'organisation
         executives_only: Filtre cadres dirigeants/CODIR uniquement
         with_email: Filtre uniquement avec email renseigné
-        page: Numéro de page
+        page: Numéro de page (pages de max_results résultats)
         max_results: Nombre maximum de résultats
+        fetch_all: Récupère toutes les pages en une fois (ignore page/max_results)
+        max_items: Nombre maximum d'items en mode fetch_all (plafonné côté serveur)
+        compact: Réponse compacte (champs principaux, sans champs vides ni indentation)
+        fields: Champs à renvoyer pour chaque item (["*"] pour tous)
     
     Returns:
         JSON formaté des personnalités trouvées
@@ -407,57 +1321,73 @@ async def search_people(
     try:
         api_client = get_client()
         
-        filters = {}
-        
-        if name:
-            filters["people_nom"] = name
-        
-        if organization:
-            filters["people_societe"] = organization
-        
-        if titles:
-            # Quelques mappings de titres courants
-            title_mapping = {
-                "Directeur général": 8416,
-                "Associé(e)": 8410,
-                "Partner": 8408,
-                "Directeur": 8406
-            }
-            filters["people_titres"] = [title_mapping.get(t, t) for t in titles]
-        
-        if organization_types:
-            type_mapping = {
-                "Fonds": 308,
-                "Avocats": 207,
-                "Banquiers": 226,
-                "Conseils": 230
-            }
-            filters["people_type_organisation"] = [type_mapping.get(t, t) for t in organization_types]
-        
-        if regions:
-            region_mapping = {
-                "Île-de-France": 132336,
-                "Auvergne-Rhône-Alpes": 132360
-            }
-            filters["people_region"] = [region_mapping.get(r, r) for r in regions]
-        
-        if executives_only:
-            filters["ciblage_dirigeants"] = "Dirigeants"
+        filters = people_filters(
+            name=name,
+            organization=organization,
+            titles=titles,
+            organization_types=organization_types,
+            regions=regions,
+            executives_only=executives_only,
+            with_email=with_email
+        )
         
-        if with_email:
-            filters["uniqut_avec_email"] = "oui"
-        
-        result = await api_client.get_people(page=page, filters=filters)
-        
-        return format_response(result, max_results)
+        return await run_search(
+            api_client, "people", filters,
+            page, max_results, fetch_all, max_items,
+            compact=compact, fields=fields
+        )
     
+    except TaxonomyError as e:
+        return json.dumps({"error": str(e), "suggestions": e.suggestions}, ensure_ascii=False)
     except CFNewsAPIError as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
     except Exception as e:
         return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
 
 
+@tracing.traced("filters")
+def news_filters(
+    title: Optional[str] = None,
+    themes: Optional[List[str]] = None,
+    keywords: Optional[List[str]] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Construit les paramètres de recherche des actualités (voir search_news).
+    
+    Args:
+        title: Mots dans le titre
+        themes: Thèmes (ex: ["LBO", "Levée de Fonds", "M&A"])
+        keywords: Mots-clés (ex: ["capital investissement", "fintech"])
+        date_from: Date de début de publication (YYYY-MM-DD)
+        date_to: Date de fin de publication (YYYY-MM-DD)
+    
+    Raises:
+        TaxonomyError: Libellé inconnu
+    """
+    filters = {}
+    
+    if title:
+        filters["title"] = title
+    
+    if themes:
+        filters["theme"] = themes
+    
+    if keywords:
+        filters["keyword"] = KEYWORDS.resolve_many(keywords)
+    
+    if date_from:
+        filters["date_start"] = date_from
+    
+    if date_to:
+        filters["date_end"] = date_to
+    
+    return filters
+
+
 @mcp.tool()
+@instrumented
 async def search_news(
     title: Optional[str] = None,
     themes: Optional[List[str]] = None,
@@ -465,7 +1395,11 @@ async def search_news(
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
     page: int = 1,
-    max_results: int = 10
+    max_results: int = 10,
+    fetch_all: bool = False,
+    max_items: int = 200,
+    compact: bool = False,
+    fields: Optional[List[str]] = None
 ) -> str:
     """
     Recherche des actualités CFNEWS.
@@ -476,8 +1410,12 @@ async def search_news(
         keywords: Mots-clés (ex: ["capital investissement", "fintech"])
         date_from: Date de début de publication (YYYY-MM-DD)
         date_to: Date de fin de publication (YYYY-MM-DD)
-        page: Numéro de page
+        page: Numéro de page (pages de max_results résultats)
         max_results: Nombre maximum de résultats
+        fetch_all: Récupère toutes les pages en une fois (ignore page/max_results)
+        max_items: Nombre maximum d'items en mode fetch_all (plafonné côté serveur)
+        compact: Réponse compacte (champs principaux, sans champs vides ni indentation)
+        fields: Champs à renvoyer pour chaque item (["*"] pour tous)
     
     Returns:
         JSON formaté des actualités trouvées
@@ -485,26 +1423,266 @@ async def search_news(
     try:
         api_client = get_client()
         
-        filters = {}
+        filters = news_filters(
+            title=title,
+            themes=themes,
+            keywords=keywords,
+            date_from=date_from,
+            date_to=date_to
+        )
+        
+        return await run_search(
+            api_client, "actualite", filters,
+            page, max_results, fetch_all, max_items,
+            compact=compact, fields=fields
+        )
+    
+    except TaxonomyError as e:
+        return json.dumps({"error": str(e), "suggestions": e.suggestions}, ensure_ascii=False)
+    except CFNewsAPIError as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
+
+
+# Nombre maximum d'opérations agrégées par deal_statistics
+STATS_MAX_ITEMS = int(os.getenv("CFNEWS_STATS_MAX_ITEMS", 5000))
+
+# Colonnes des dernières recherches de deal_statistics (clé: filtres + max_items),
+# réutilisées pendant le TTL des opérations au lieu d'être recollectées
+stats_columns = ResponseCache(max_entries=int(os.getenv("CFNEWS_STATS_CACHE_ENTRIES", 16)))
+
+
+async def collect_operations(
+    api_client: CFNewsClient,
+    query_params: Dict[str, Any],
+    max_items: int
+) -> Dict[str, Any]:
+    """
+    Récupère jusqu'à `max_items` opérations, depuis le miroir local s'il couvre
+    la recherche, sinon par pages de MAX_LIMIT récupérées en parallèle.
+    
+    Returns:
+        {"items", "total", "source"}
+    """
+    local_mirror = get_mirror()
+    if local_mirror is not None and local_mirror.is_fresh("operation", MIRROR_MAX_AGE):
+        result = local_mirror.search("operation", query_params, 1, max_items)
+        if result is not None:
+            return {"items": result["items"], "total": result["total"], "source": "mirror"}
+    
+    items: List[Dict[str, Any]] = []
+    total = 0
+    pages = api_client.iter_pages(
+        "operation", query_params,
+        concurrency=FETCH_CONCURRENCY,
+        max_items=max_items,
+        limit=api_client.MAX_LIMIT
+    )
+    async for data in pages:
+        total = total or data.get("total", 0)
+        items.extend(data.get("items") or [])
+    await pages.aclose()
+    return {"items": items[:max_items], "total": total, "source": "api"}
+
+
+@mcp.tool()
+@instrumented
+async def deal_statistics(
+    group_by: Optional[List[str]] = None,
+    operation_types: Optional[List[str]] = None,
+    operation_subtypes: Optional[List[str]] = None,
+    sectors: Optional[List[str]] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    amount_min: Optional[float] = None,
+    amount_max: Optional[float] = None,
+    max_items: int = 2000
+) -> str:
+    """
+    Statistiques agrégées sur les opérations (nombre, somme et médiane des montants)
+    par type, secteur, région et/ou période.
+    
+    Args:
+        group_by: Dimensions de regroupement parmi "type", "sector", "region",
+            "year", "quarter", "month" (ex: ["sector", "quarter"])
+        operation_types: Types d'opérations (ex: ["LBO", "Capital Développement"])
+        operation_subtypes: Sous-types (ex: ["LBO bis", "Build-up", "Amorçage"])
+        sectors: Secteurs d'activité (ex: ["Biotechnologies", "Services Financiers"])
+        date_from: Date de début (format DD/MM/YYYY)
+        date_to: Date de fin (format DD/MM/YYYY)
+        amount_min: Montant minimum de l'opération en M€
+        amount_max: Montant maximum de l'opération en M€
+        max_items: Nombre maximum d'opérations agrégées (plafonné côté serveur)
+    
+    Returns:
+        JSON du tableau agrégé (une ligne par groupe)
+    """
+    try:
+        api_client = get_client()
+        
+        from utils.columnar import DealColumns, GROUP_BY
+        
+        group_by = group_by or []
+        unknown = [name for name in group_by if name not in GROUP_BY]
+        if unknown:
+            return json.dumps({
+                "error": f"Dimension inconnue: {', '.join(unknown)} (attendu: {', '.join(GROUP_BY)})"
+            }, ensure_ascii=False)
         
-        if title:
-            filters["title"] = title
+        filters = operation_filters(
+            operation_types=operation_types,
+            operation_subtypes=operation_subtypes,
+            sectors=sectors,
+            date_from=date_from,
+            date_to=date_to,
+            amount_min=amount_min,
+            amount_max=amount_max
+        )
         
-        if themes:
-            filters["theme"] = themes
+        max_items = max(1, min(max_items, STATS_MAX_ITEMS))
+        key = json.dumps([filters, max_items], sort_keys=True, default=str)
+        collected = stats_columns.get(key)
+        if collected is None:
+            collected = await collect_operations(api_client, filters, max_items)
+            collected["columns"] = DealColumns(collected.pop("items"))
+            stats_columns.set(
+                key, collected,
+                ttl=api_client.cache_ttls.get("operation", api_client.DEFAULT_CACHE_TTL),
+                size=sum(column.nbytes for column in collected["columns"].columns.values())
+            )
+        columns = collected["columns"]
         
-        if keywords:
-            filters["keyword"] = keywords
+        result = {
+            "operations": len(columns),
+            "total": collected["total"],
+            "source": collected["source"],
+            "group_by": group_by,
+            "groups": columns.aggregate(group_by)
+        }
+        if columns.warnings:
+            result["warnings"] = columns.warnings
+        if collected["total"] > len(columns):
+            result["note"] = (
+                f"Statistiques calculées sur les {len(columns)} opérations les plus récentes "
+                f"sur {collected['total']} au total"
+            )
+        return dump_json(result, compact=True)
+    
+    except TaxonomyError as e:
+        return json.dumps({"error": str(e), "suggestions": e.suggestions}, ensure_ascii=False)
+    except CFNewsAPIError as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
+
+
+# Entités interrogeables par batch_search: nom -> (endpoint, construction des filtres)
+SEARCH_ENTITIES: Dict[str, Any] = {
+    "operations": ("operation", operation_filters),
+    "funds": ("vehicule", fund_filters),
+    "actors": ("acteur", actor_filters),
+    "companies": ("societe", company_filters),
+    "people": ("people", people_filters),
+    "news": ("actualite", news_filters),
+}
+
+# Nombre maximum de requêtes par appel à batch_search
+BATCH_MAX_QUERIES = int(os.getenv("CFNEWS_BATCH_MAX_QUERIES", 20))
+
+# Nombre maximum de requêtes d'un lot exécutées simultanément
+BATCH_CONCURRENCY = int(os.getenv("CFNEWS_BATCH_CONCURRENCY", 5))
+
+
+async def run_batch_query(
+    api_client: CFNewsClient,
+    spec: Dict[str, Any],
+    semaphore: asyncio.Semaphore,
+    compact: bool,
+    fields: Optional[List[str]]
+) -> Dict[str, Any]:
+    """
+    Exécute une requête d'un lot; les erreurs sont renvoyées dans le résultat.
+    
+    Args:
+        api_client: Client API
+        spec: Requête ({"entity", "filters", "max_results", "page"})
+        semaphore: Borne du nombre de requêtes simultanées
+        compact: Réponse compacte (voir format_response)
+        fields: Champs à conserver dans chaque item
+    """
+    entity = spec.get("entity")
+    if entity not in SEARCH_ENTITIES:
+        return {"error": f"Entité inconnue: {entity!r} (attendu: {', '.join(SEARCH_ENTITIES)})"}
+    endpoint, build_filters = SEARCH_ENTITIES[entity]
+    
+    try:
+        filters = build_filters(**(spec.get("filters") or {}))
+        async with semaphore:
+            return await search_result(
+                api_client, endpoint, filters,
+                int(spec.get("page", 1)), int(spec.get("max_results", 10)),
+                compact=compact, fields=spec.get("fields", fields)
+            )
+    except TaxonomyError as e:
+        return {"error": str(e), "suggestions": e.suggestions}
+    except TypeError as e:
+        return {"error": f"Filtres invalides pour {entity}: {str(e)}"}
+    except CFNewsAPIError as e:
+        return {"error": str(e)}
+    except Exception as e:
+        return {"error": f"Erreur inattendue: {str(e)}"}
+
+
+@mcp.tool()
+@instrumented
+async def batch_search(
+    queries: List[Dict[str, Any]],
+    compact: bool = False,
+    fields: Optional[List[str]] = None
+) -> str:
+    """
+    Exécute plusieurs recherches en parallèle en un seul appel (comparaison de
+    fonds, de secteurs, etc.).
+    
+    Args:
+        queries: Liste de requêtes {"key": "nom", "entity": "operations",
+            "filters": {...}, "max_results": 10, "page": 1}. `entity` parmi
+            operations, funds, actors, companies, people, news; `filters`
+            reprend les paramètres de l'outil search_* correspondant (ex:
+            {"sectors": ["Biotechnologies"], "operation_types": ["LBO"]}).
+            `key` est facultatif (index de la requête par défaut).
+        compact: Réponse compacte (champs principaux, sans champs vides ni indentation)
+        fields: Champs à renvoyer pour chaque item (["*"] pour tous)
+    
+    Returns:
+        JSON des résultats indexés par requête (erreurs propres à chaque requête)
+    """
+    try:
+        api_client = get_client()
         
-        if date_from:
-            filters["date_start"] = date_from
+        if not queries:
+            return json.dumps({"error": "Aucune requête fournie"}, ensure_ascii=False)
+        if len(queries) > BATCH_MAX_QUERIES:
+            return json.dumps({
+                "error": f"Trop de requêtes: {len(queries)} (maximum {BATCH_MAX_QUERIES})"
+            }, ensure_ascii=False)
         
-        if date_to:
-            filters["date_end"] = date_to
+        keys = [str(spec.get("key", i)) for i, spec in enumerate(queries)]
+        if len(set(keys)) != len(keys):
+            return json.dumps({"error": "Les clés des requêtes doivent être uniques"}, ensure_ascii=False)
         
-        result = await api_client.get_actualites(page=page, filters=filters)
+        semaphore = asyncio.Semaphore(max(1, BATCH_CONCURRENCY))
+        results = await asyncio.gather(*(
+            run_batch_query(api_client, spec, semaphore, compact, fields)
+            for spec in queries
+        ))
         
-        return format_response(result, max_results)
+        return dump_json({
+            "count": len(results),
+            "errors": sum(1 for result in results if "error" in result),
+            "results": dict(zip(keys, results))
+        }, compact)
     
     except CFNewsAPIError as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
@@ -512,10 +1690,31 @@ async def search_news(
         return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
 
 
+def shape_portfolio(
+    result: Dict[str, Any],
+    compact: bool = False,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Met en forme un portefeuille (projection des participations, champs vides retirés).
+    
+    Args:
+        result: Portefeuille renvoyé par l'API
+        compact: Retire les champs vides
+        fields: Champs à conserver pour chaque participation
+    """
+    if fields and "*" not in fields and isinstance(result.get("items"), list):
+        result = {**result, "items": [project_item(item, fields) for item in result["items"]]}
+    return prune_empty(result) if compact else result
+
+
 @mcp.tool()
+@instrumented
 async def get_fund_portfolio(
     fund_id: int,
-    portfolio_type: str = "current"
+    portfolio_type: str = "current",
+    compact: bool = False,
+    fields: Optional[List[str]] = None
 ) -> str:
     """
     Récupère le portefeuille d'un fonds d'investissement.
@@ -523,6 +1722,8 @@ async def get_fund_portfolio(
     Args:
         fund_id: ID du fonds (récupéré via search_actors)
         portfolio_type: Type de portefeuille ("current" pour actuel, "exits" pour sorties)
+        compact: Réponse compacte (sans champs vides ni indentation)
+        fields: Champs à renvoyer pour chaque participation (["*"] pour tous)
     
     Returns:
         JSON formaté du portefeuille
@@ -539,7 +1740,649 @@ async def get_fund_portfolio(
                 "error": "portfolio_type doit être 'current' ou 'exits'"
             }, ensure_ascii=False)
         
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return dump_json(shape_portfolio(result, compact, fields), compact)
+    
+    except CFNewsAPIError as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
+
+
+# Portefeuilles récupérés par get_funds_portfolios, selon portfolio_type
+PORTFOLIO_TYPES: Dict[str, List[str]] = {
+    "current": ["current"],
+    "exits": ["exits"],
+    "both": ["current", "exits"],
+}
+
+# Nombre maximum de fonds par appel à get_funds_portfolios
+PORTFOLIO_MAX_FUNDS = int(os.getenv("CFNEWS_PORTFOLIO_MAX_FUNDS", 30))
+
+# Nombre maximum de portefeuilles récupérés simultanément
+PORTFOLIO_CONCURRENCY = int(os.getenv("CFNEWS_PORTFOLIO_CONCURRENCY", 8))
+
+
+async def fetch_portfolio(
+    api_client: CFNewsClient,
+    fund_id: int,
+    kind: str,
+    semaphore: asyncio.Semaphore
+) -> Dict[str, Any]:
+    """
+    Récupère un portefeuille ("current" ou "exits"); les erreurs sont renvoyées
+    dans le résultat.
+    """
+    try:
+        async with semaphore:
+            if kind == "current":
+                return await api_client.get_actor_portfolio_current(fund_id)
+            return await api_client.get_actor_portfolio_exits(fund_id)
+    except CFNewsAPIError as e:
+        return {"error": str(e)}
+
+
+def portfolio_overlap(portfolios: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Sociétés présentes dans le portefeuille de plusieurs fonds.
+    
+    Args:
+        portfolios: Portefeuilles par fonds ({fund_id: {"current": ..., "exits": ...}})
+    
+    Returns:
+        Participations communes ({"id", "name", "funds"}), les plus partagées d'abord
+    """
+    holders: Dict[Any, Dict[str, Any]] = {}
+    for fund_id, kinds in portfolios.items():
+        for portfolio in kinds.values():
+            for item in portfolio.get("items") or []:
+                if not isinstance(item, dict) or item.get("id") is None:
+                    continue
+                entry = holders.setdefault(item["id"], {"id": item["id"], "name": item.get("name"), "funds": []})
+                if fund_id not in entry["funds"]:
+                    entry["funds"].append(fund_id)
+    shared = [entry for entry in holders.values() if len(entry["funds"]) > 1]
+    return sorted(shared, key=lambda entry: (-len(entry["funds"]), str(entry["name"])))
+
+
+@mcp.tool()
+@instrumented
+async def get_funds_portfolios(
+    fund_ids: List[int],
+    portfolio_type: str = "both",
+    overlap: bool = False,
+    compact: bool = False,
+    fields: Optional[List[str]] = None
+) -> str:
+    """
+    Récupère en parallèle les portefeuilles de plusieurs fonds (comparaison de
+    fonds, co-investissements).
+    
+    Args:
+        fund_ids: IDs des fonds (récupérés via search_actors)
+        portfolio_type: "current" (actuel), "exits" (sorties) ou "both" (les deux)
+        overlap: Calcule les participations communes à plusieurs fonds
+        compact: Réponse compacte (sans champs vides ni indentation)
+        fields: Champs à renvoyer pour chaque participation (["*"] pour tous)
+    
+    Returns:
+        JSON des portefeuilles par fonds (erreurs propres à chaque fonds)
+    """
+    try:
+        api_client = get_client()
+        
+        if portfolio_type not in PORTFOLIO_TYPES:
+            return json.dumps({
+                "error": "portfolio_type doit être 'current', 'exits' ou 'both'"
+            }, ensure_ascii=False)
+        fund_ids = list(dict.fromkeys(fund_ids))
+        if not fund_ids:
+            return json.dumps({"error": "Aucun fonds fourni"}, ensure_ascii=False)
+        if len(fund_ids) > PORTFOLIO_MAX_FUNDS:
+            return json.dumps({
+                "error": f"Trop de fonds: {len(fund_ids)} (maximum {PORTFOLIO_MAX_FUNDS})"
+            }, ensure_ascii=False)
+        
+        kinds = PORTFOLIO_TYPES[portfolio_type]
+        semaphore = asyncio.Semaphore(max(1, PORTFOLIO_CONCURRENCY))
+        fetched = await asyncio.gather(*(
+            fetch_portfolio(api_client, fund_id, kind, semaphore)
+            for fund_id in fund_ids for kind in kinds
+        ))
+        
+        portfolios: Dict[int, Dict[str, Any]] = {}
+        for i, fund_id in enumerate(fund_ids):
+            portfolios[fund_id] = dict(zip(kinds, fetched[i * len(kinds):(i + 1) * len(kinds)]))
+        
+        result: Dict[str, Any] = {}
+        if overlap:
+            result["overlap"] = portfolio_overlap(portfolios)
+        result["funds"] = {
+            fund_id: {kind: shape_portfolio(portfolio, compact, fields) for kind, portfolio in fund.items()}
+            for fund_id, fund in portfolios.items()
+        }
+        result["errors"] = sum(1 for portfolio in fetched if "error" in portfolio)
+        return dump_json(result, compact)
+    
+    except CFNewsAPIError as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
+
+
+@mcp.tool()
+@instrumented
+async def next_results(
+    cursor: str,
+    max_results: Optional[int] = None,
+    compact: Optional[bool] = None,
+    fields: Optional[List[str]] = None
+) -> str:
+    """
+    Renvoie les résultats suivants d'une recherche à partir de son curseur.
+    
+    Les outils search_* et batch_search renvoient un `cursor` tant qu'il
+    reste des résultats: la suite est servie depuis les items déjà
+    téléchargés, et l'API n'est rappelée que pour les pages manquantes.
+    
+    Args:
+        cursor: Curseur renvoyé par la recherche (ou le précédent next_results)
+        max_results: Nombre de résultats (défaut: celui de la recherche)
+        compact: Réponse compacte (défaut: celui de la recherche)
+        fields: Champs à renvoyer pour chaque item (défaut: ceux de la recherche)
+    
+    Returns:
+        JSON des résultats suivants, avec `offset` (position du premier) et
+        `cursor` tant qu'il en reste
+    """
+    try:
+        state = cursors.get(cursor)
+        if state is None:
+            return json.dumps({"error": "Curseur inconnu ou expiré: relancez la recherche"}, ensure_ascii=False)
+        api_client = get_client()
+        compact = state.compact if compact is None else compact
+        fields = state.fields if fields is None else fields
+        count = max(1, min(max_results or state.max_results, FETCH_ALL_MAX_ITEMS))
+        semaphore = asyncio.Semaphore(max(1, FETCH_CONCURRENCY))
+        
+        async def fetch(page: int, size: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await fetch_chunk(api_client, state.endpoint, state.query_params, page, size)
+        
+        async with state.lock:
+            offset = state.offset
+            items = await state.read(count, fetch)
+        
+        result: Dict[str, Any] = {
+            "count": len(items),
+            "total": state.total,
+            "offset": offset,
+            "items": shape_items(items, compact, fields, state.endpoint)
+        }
+        # Sous budget, le curseur est gardé jusqu'à l'encodage (voir drop_spent_cursors)
+        if state.exhausted and budget.current() is None:
+            cursors.discard(cursor)
+        else:
+            result["cursor"] = cursor
+        return dump_json(result, compact)
+    
+    except CFNewsAPIError as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
+
+
+@mcp.tool()
+@instrumented
+async def get_entity(
+    entity_type: str,
+    entity_id: int,
+    refresh: bool = False,
+    compact: bool = False,
+    fields: Optional[List[str]] = None
+) -> str:
+    """
+    Récupère une opération, société, acteur ou personne par son ID.
+    
+    Les entités déjà renvoyées par les recherches (y compris la cible et les
+    investisseurs des opérations) sont servies depuis la mémoire, sans appel
+    à l'API: inutile de relancer une recherche pour revoir un résultat.
+    L'API n'offrant pas de lecture par ID, une entité jamais vue doit
+    d'abord être trouvée par une recherche.
+    
+    Args:
+        entity_type: "operation", "company", "actor" ou "person"
+        entity_id: ID de l'entité (champ `id` des résultats de recherche)
+        refresh: Recherche l'entité complète par son nom (ex: entité partielle)
+        compact: Réponse compacte (sans champs vides ni indentation)
+        fields: Champs à renvoyer (défaut: tous)
+    
+    Returns:
+        JSON de l'entité, avec `partial: true` si seuls les champs vus dans
+        une autre entité sont connus
+    """
+    try:
+        endpoint = resolve_type(entity_type)
+        if endpoint is None:
+            return json.dumps({
+                "error": f"Type d'entité inconnu: {entity_type} (attendu: {', '.join(ENTITY_TYPES)})"
+            }, ensure_ascii=False)
+        api_client = get_client()
+        
+        record = None
+        if api_client.entities is not None and not refresh:
+            record = api_client.entities.get(endpoint, entity_id)
+        if record is not None:
+            item, partial = record.item(), record.partial
+        else:
+            item, partial = await lookup_entity(api_client, endpoint, entity_id, refresh=True)
+        
+        result: Dict[str, Any] = {"type": entity_type, "id": entity_id}
+        if partial:
+            result["partial"] = True
+        result["item"] = shape_items([item], compact, fields or ["*"], endpoint)[0]
+        return dump_json(result, compact)
+    
+    except (CFNewsAPIError, LookupError) as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
+
+
+# Recherche d'une étape du plan: (dépendances, fonction(résultats des étapes) -> résultat)
+Lookup = Tuple[Tuple[str, ...], Callable[[Dict[str, Any]], Awaitable[Any]]]
+
+
+async def run_lookups(lookups: Dict[str, Lookup]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Exécute un plan de recherches dépendantes.
+    
+    Chaque étape démarre dès que ses dépendances sont terminées: les branches
+    indépendantes s'exécutent en parallèle. Une étape en échec n'interrompt
+    que les étapes qui en dépendent.
+    
+    Args:
+        lookups: Étapes par nom (dépendances, recherche)
+    
+    Returns:
+        Résultats et erreurs par étape
+    """
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    tasks: Dict[str, "asyncio.Task[None]"] = {}
+    
+    async def run(name: str) -> None:
+        deps, lookup = lookups[name]
+        await asyncio.gather(*(tasks[dep] for dep in deps))
+        failed = [dep for dep in deps if dep in errors]
+        if failed:
+            errors[name] = f"Non exécuté: échec de {', '.join(failed)}"
+            return
+        try:
+            results[name] = await lookup(results)
+        except (CFNewsAPIError, LookupError) as e:
+            errors[name] = str(e)
+        except Exception as e:
+            errors[name] = f"Erreur inattendue: {str(e)}"
+    
+    for name in lookups:
+        tasks[name] = asyncio.create_task(run(name))
+    await asyncio.gather(*tasks.values())
+    return results, errors
+
+
+async def lookup_entity(
+    api_client: CFNewsClient,
+    endpoint: str,
+    entity_id: int,
+    embedded: Optional[Dict[str, Any]] = None,
+    refresh: bool = False
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Entité complète si possible, sinon ce qu'on en connaît.
+    
+    L'entité est servie depuis la mémoire si elle y est entière; sinon elle
+    est recherchée par son nom (connu par l'entité partielle en mémoire ou
+    par `embedded`, ex: cible d'une opération). À défaut, l'entité partielle
+    est renvoyée.
+    
+    Args:
+        api_client: Client API
+        endpoint: Endpoint de l'entité
+        entity_id: ID de l'entité
+        embedded: Entité partielle connue par ailleurs
+        refresh: Ignore l'entité complète en mémoire
+    
+    Returns:
+        (item, partiel)
+    
+    Raises:
+        LookupError: Entité inconnue de la mémoire et introuvable par recherche
+    """
+    known = dict(embedded or {})
+    record = api_client.entities.get(endpoint, entity_id) if api_client.entities is not None else None
+    if record is not None:
+        if not record.partial and not refresh:
+            return record.item(), False
+        known = {**known, **record.item()}
+    item = await api_client.get_entity(endpoint, entity_id, known.get("name"))
+    if item is not None:
+        return item, False
+    if known:
+        return known, True
+    raise LookupError(
+        f"{endpoint} {entity_id} absent de la mémoire locale: l'API n'offre pas de lecture par ID, "
+        "trouvez d'abord l'entité par une recherche"
+    )
+
+
+# Nombre maximum d'opérations, d'actualités et de participations d'un dossier
+DOSSIER_MAX_OPERATIONS = int(os.getenv("CFNEWS_DOSSIER_MAX_OPERATIONS", 5))
+DOSSIER_MAX_NEWS = int(os.getenv("CFNEWS_DOSSIER_MAX_NEWS", 20))
+DOSSIER_MAX_PORTFOLIO = int(os.getenv("CFNEWS_DOSSIER_MAX_PORTFOLIO", 50))
+
+
+@mcp.tool()
+@instrumented
+async def deal_dossier(
+    operation_id: Optional[int] = None,
+    company_name: Optional[str] = None,
+    news_results: int = 5,
+    portfolio_results: int = 10,
+    compact: bool = False
+) -> str:
+    """
+    Constitue en un seul appel le dossier d'une opération: l'opération, la
+    société cible, les investisseurs, le portefeuille actuel de l'investisseur
+    chef de file et les actualités sur la cible.
+    
+    Les recherches indépendantes sont lancées en parallèle (l'équivalent de
+    search_operations, search_companies, get_entity, get_fund_portfolio et
+    search_news enchaînés), en réutilisant le cache et les entités déjà vues.
+    
+    Args:
+        operation_id: ID de l'opération (prioritaire sur company_name)
+        company_name: Nom de la société cible (dossier de sa dernière opération)
+        news_results: Nombre d'actualités
+        portfolio_results: Nombre de participations du chef de file
+        compact: Réponse compacte (champs principaux, sans champs vides ni indentation)
+    
+    Returns:
+        JSON du dossier (`operation`, `other_operations`, `target`,
+        `investors`, `lead_investor`, `news`), avec `errors` pour les
+        parties qui n'ont pas pu être récupérées
+    """
+    try:
+        if operation_id is None and not company_name:
+            return json.dumps({"error": "operation_id ou company_name requis"}, ensure_ascii=False)
+        api_client = get_client()
+        news_results = max(1, min(news_results, DOSSIER_MAX_NEWS))
+        portfolio_results = max(1, min(portfolio_results, DOSSIER_MAX_PORTFOLIO))
+        # Sans ID, la cible et les actualités se cherchent par nom, en même temps que l'opération
+        by_name = () if operation_id is None else ("operation",)
+        
+        async def operation(done: Dict[str, Any]) -> Dict[str, Any]:
+            if operation_id is not None:
+                item, _ = await lookup_entity(api_client, "operation", operation_id)
+                return {"item": item, "others": []}
+            found = await search_result(
+                api_client, "operation", operation_filters(company_name=company_name),
+                1, DOSSIER_MAX_OPERATIONS, compact=compact, fields=["*"]
+            )
+            if not found["items"]:
+                raise LookupError(f"Aucune opération trouvée pour {company_name}")
+            return {"item": found["items"][0], "others": found["items"][1:]}
+        
+        def target_name(done: Dict[str, Any]) -> Optional[str]:
+            if operation_id is None:
+                return company_name
+            target = done["operation"]["item"].get("target")
+            return target.get("name") if isinstance(target, dict) else None
+        
+        async def target(done: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], bool]]:
+            if operation_id is not None:
+                embedded = done["operation"]["item"].get("target")
+                if isinstance(embedded, dict) and isinstance(embedded.get("id"), int):
+                    try:
+                        return await lookup_entity(api_client, "societe", embedded["id"], embedded)
+                    except CFNewsAPIError:
+                        # Recherche en échec: on garde ce qu'en dit l'opération
+                        return dict(embedded), True
+            name = target_name(done)
+            if not name:
+                return None
+            found = await search_result(
+                api_client, "societe", company_filters(company_name=name), 1, 5, compact=compact, fields=["*"]
+            )
+            exact = [item for item in found["items"] if str(item.get("name", "")).lower() == name.lower()]
+            item = (exact or found["items"] or [None])[0]
+            return (item, False) if item is not None else None
+        
+        def operation_investors(done: Dict[str, Any]) -> List[Dict[str, Any]]:
+            investors = done["operation"]["item"].get("investors") or []
+            return [investor for investor in investors if isinstance(investor, dict) and investor.get("id") is not None]
+        
+        async def investors(done: Dict[str, Any]) -> List[Dict[str, Any]]:
+            embedded = operation_investors(done)
+            known = [{k: v for k, v in investor.items() if k != "lead"} for investor in embedded]
+            found = await asyncio.gather(
+                *(lookup_entity(api_client, "acteur", investor["id"], investor) for investor in known),
+                return_exceptions=True
+            )
+            result = []
+            for investor, item, lookup in zip(embedded, known, found):
+                lead = bool(investor.get("lead"))
+                if isinstance(lookup, BaseException):
+                    # Recherche en échec: on garde ce qu'en dit l'opération
+                    result.append({"item": item, "lead": lead, "partial": True})
+                else:
+                    result.append({"item": lookup[0], "lead": lead, "partial": lookup[1]})
+            return result
+        
+        async def lead_investor(done: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            embedded = operation_investors(done)
+            lead = next((investor for investor in embedded if investor.get("lead")), None)
+            if lead is None and embedded:
+                lead = embedded[0]
+            if lead is None:
+                return None
+            portfolio = await api_client.get_actor_portfolio_current(lead["id"])
+            return {
+                "id": lead["id"],
+                "name": lead.get("name"),
+                "portfolio": {
+                    "total": portfolio.get("total", len(portfolio.get("items") or [])),
+                    "items": (portfolio.get("items") or [])[:portfolio_results]
+                }
+            }
+        
+        async def news(done: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            name = target_name(done)
+            if not name:
+                return None
+            return await search_result(
+                api_client, "actualite", news_filters(title=name), 1, news_results, compact=compact
+            )
+        
+        results, errors = await run_lookups({
+            "operation": ((), operation),
+            "target": (by_name, target),
+            "investors": (("operation",), investors),
+            "lead_investor": (("operation",), lead_investor),
+            "news": (by_name, news),
+        })
+        
+        dossier: Dict[str, Any] = {}
+        if "operation" in results:
+            found = results["operation"]
+            dossier["operation"] = shape_items([found["item"]], compact, ["*"], "operation")[0]
+            if found["others"]:
+                dossier["other_operations"] = shape_items(found["others"], compact, None, "operation")
+        if results.get("target") is not None:
+            item, partial = results["target"]
+            # Copie: l'item peut être celui du cache de réponses ou d'une opération en cache
+            dossier["target"] = {**shape_items([item], compact, ["*"], "societe")[0]}
+            if partial:
+                dossier["target"]["partial"] = True
+        if "investors" in results:
+            dossier["investors"] = []
+            for investor in results["investors"]:
+                item = {**shape_items([investor["item"]], compact, None, "acteur")[0], "lead": investor["lead"]}
+                if investor["partial"]:
+                    item["partial"] = True
+                dossier["investors"].append(item)
+        if results.get("lead_investor") is not None:
+            dossier["lead_investor"] = prune_empty(results["lead_investor"]) if compact else results["lead_investor"]
+        if results.get("news") is not None:
+            dossier["news"] = results["news"]
+        if errors:
+            dossier["errors"] = errors
+        return dump_json(dossier, compact)
+    
+    except CFNewsAPIError as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
+
+
+# Recherches pouvant faire l'objet d'une veille (résultats triés par date décroissante)
+WATCH_ENTITIES = ("operations", "news")
+
+
+def watch_uri(watch_id: str) -> str:
+    """URI de la ressource MCP d'une veille."""
+    return f"cfnews://watches/{watch_id}"
+
+
+@mcp.tool()
+@instrumented
+async def create_watch(
+    entity: str,
+    filters: Optional[Dict[str, Any]] = None,
+    label: Optional[str] = None,
+    notify: bool = False,
+    ctx: Optional[Context] = None
+) -> str:
+    """
+    Enregistre une veille sur une recherche d'opérations ou d'actualités
+    (ex: "préviens-moi des nouveaux LBO en biotech").
+    
+    La recherche est relevée en tâche de fond: get_watch_updates renvoie
+    ensuite uniquement les items publiés depuis la création de la veille
+    (ou depuis la dernière lecture), sans relancer la recherche complète.
+    
+    Args:
+        entity: "operations" ou "news"
+        filters: Paramètres de l'outil search_* correspondant
+            (ex: {"operation_types": ["LBO"], "sectors": ["Biotechnologies"]})
+        label: Nom libre de la veille
+        notify: Notifie le client MCP (resources/updated sur
+            cfnews://watches/{watch_id}) quand de nouveaux items arrivent
+    
+    Returns:
+        JSON avec `watch_id` (à passer à get_watch_updates)
+    """
+    try:
+        if entity not in WATCH_ENTITIES:
+            return json.dumps({
+                "error": f"Entité inconnue: {entity!r} (attendu: {', '.join(WATCH_ENTITIES)})"
+            }, ensure_ascii=False)
+        endpoint, build_filters = SEARCH_ENTITIES[entity]
+        try:
+            query_params = build_filters(**(filters or {}))
+        except TaxonomyError as e:
+            return json.dumps({"error": str(e), "suggestions": e.suggestions}, ensure_ascii=False)
+        except TypeError as e:
+            return json.dumps({"error": f"Filtres invalides pour {entity}: {str(e)}"}, ensure_ascii=False)
+        
+        try:
+            watch = watches.add(entity, endpoint, query_params, label)
+        except ValueError as e:
+            return json.dumps({"error": str(e)}, ensure_ascii=False)
+        if notify and ctx is not None:
+            session, uri = ctx.session, watch_uri(watch.id)
+            
+            async def notify_session() -> None:
+                await session.send_resource_updated(uri)
+            
+            watch.notify = notify_session
+        
+        # Première relève: point de départ de la veille
+        try:
+            await watches.poll(watch)
+        except Exception:
+            watches.remove(watch.id)
+            raise
+        
+        result: Dict[str, Any] = {
+            **watch.summary(),
+            "resource": watch_uri(watch.id),
+            "notify": watch.notify is not None,
+            "interval": WATCH_INTERVAL
+        }
+        if notify and ctx is None:
+            result["note"] = "Notifications indisponibles hors session MCP"
+        return dump_json(result, True)
+    
+    except CFNewsAPIError as e:
+        return json.dumps({"error": str(e)}, ensure_ascii=False)
+    except Exception as e:
+        return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
+
+
+@mcp.tool()
+@instrumented
+async def get_watch_updates(
+    watch_id: Optional[str] = None,
+    max_results: int = 20,
+    refresh: bool = False,
+    compact: bool = False,
+    fields: Optional[List[str]] = None
+) -> str:
+    """
+    Renvoie les nouveaux items d'une veille depuis la dernière lecture
+    ("quoi de neuf sur X depuis ce matin ?"); les items renvoyés sont
+    marqués comme lus.
+    
+    Args:
+        watch_id: Veille (créée par create_watch); sans ID, liste les veilles
+        max_results: Nombre maximum d'items renvoyés (les plus récents d'abord)
+        refresh: Relève la veille avant de répondre (sinon: dernière relève
+            en tâche de fond)
+        compact: Réponse compacte (champs principaux, sans champs vides ni indentation)
+        fields: Champs à renvoyer pour chaque item (["*"] pour tous)
+    
+    Returns:
+        JSON des nouveaux items, avec `remaining` (items non lus restants)
+    """
+    try:
+        if watch_id is None:
+            return dump_json({
+                "count": len(watches),
+                "watches": [watch.summary() for watch in watches.watches.values()]
+            }, compact)
+        watch = watches.get(watch_id)
+        if watch is None:
+            return json.dumps({"error": f"Veille inconnue: {watch_id}"}, ensure_ascii=False)
+        if refresh:
+            await watches.poll(watch)
+        
+        dropped, overflow = watch.dropped, watch.overflow
+        items = watch.take(max(1, min(max_results, FETCH_ALL_MAX_ITEMS)))
+        result: Dict[str, Any] = {
+            **watch.summary(),
+            "count": len(items),
+            "remaining": len(watch.pending),
+            "items": shape_items(items, compact, fields, watch.endpoint)
+        }
+        del result["pending"]
+        if dropped:
+            result["dropped"] = dropped
+        if overflow:
+            result["note"] = (
+                "Plus de nouveaux items qu'une relève n'en lit (CFNEWS_WATCH_MAX_PAGES): "
+                "relancez la recherche pour la liste complète"
+            )
+        return dump_json(result, compact)
     
     except CFNewsAPIError as e:
         return json.dumps({"error": str(e)}, ensure_ascii=False)
@@ -547,6 +2390,35 @@ async def get_fund_portfolio(
         return json.dumps({"error": f"Erreur inattendue: {str(e)}"}, ensure_ascii=False)
 
 
+@mcp.tool()
+@instrumented(extras=False)
+async def delete_watch(watch_id: str) -> str:
+    """
+    Supprime une veille.
+    
+    Args:
+        watch_id: Veille à supprimer
+    
+    Returns:
+        JSON de confirmation
+    """
+    if not watches.remove(watch_id):
+        return json.dumps({"error": f"Veille inconnue: {watch_id}"}, ensure_ascii=False)
+    return json.dumps({"deleted": watch_id}, ensure_ascii=False)
+
+
+@mcp.resource("cfnews://watches/{watch_id}", mime_type="application/json")
+def watch_resource(watch_id: str) -> str:
+    """Nouveaux items d'une veille, sans les marquer comme lus (voir get_watch_updates)."""
+    watch = watches.get(watch_id)
+    if watch is None:
+        return json.dumps({"error": f"Veille inconnue: {watch_id}"}, ensure_ascii=False)
+    return json_codec.dumps({
+        **watch.summary(),
+        "items": shape_items(watch.pending, True, None, watch.endpoint)
+    })
+
+
 # Point d'entrée pour le mode serveur
 if __name__ == "__main__":
     # Le serveur MCP peut être lancé en mode serveur HTTP
@@ -1,8 +1,32 @@
 """Script de test pour valider le serveur MCP CFNEWS."""
 import asyncio
 import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+from urllib.parse import parse_qs
+import json
+import httpx
 from dotenv import load_dotenv
-from utils.cfnews_client import CFNewsClient, CFNewsAPIError
+from utils.cfnews_client import (
+    CFNewsClient, CFNewsAPIError, CFNewsHTTPError, CFNewsCircuitOpenError
+)
+from utils.cache import ResponseCache
+from utils.disk_cache import SQLiteCache
+from utils.entities import EntityStore
+from utils.columnar import DealColumns
+from utils.cursors import Cursor
+from utils import budget, metrics
+from utils.mirror import Mirror, MirrorSync, MirrorSyncError
+from utils.mock_api import MockCFNewsAPI
+from utils.prefetch import Prefetcher
+from utils.resilience import RetryPolicy, CircuitBreaker
+from utils.watches import WatchPoller
+from utils.taxonomy import TaxonomyError, PEOPLE_TITLES, REGIONS, SECTORS
+from benchmark import time_to_first_response
+import server
 
 load_dotenv()
 
@@ -122,17 +146,481 @@ async def test_filters():
         await client.close()
 
 
-async def main():
+def upstream_sort(request: httpx.Request) -> tuple:
+    """Tri (sort_attribute, sort_type) d'une requête amont, lu dans le paramètre `q`."""
+    query = parse_qs(request.url.params.get("q", ""))
+    return query.get("sort_attribute", [None])[0], query.get("sort_type", [None])[0]
+
+
+async def test_offline():
+    """Teste le client contre l'API simulée (sans clé ni réseau)."""
+    api = MockCFNewsAPI(total_items=95, latency=0.01)
+    client = CFNewsClient("offline", transport=api.transport(), cache=ResponseCache())
+    
+    try:
+        print("\n🔌 Tests hors ligne (API simulée)...")
+        
+        # Cache: la même requête (filtres dans un autre ordre) ne repart pas en amont
+        await client.search("operation", 1, {"op_type": [271], "sector": [124]})
+        await client.search("operation", 1, {"sector": [124], "op_type": [271]})
+        assert api.requests == 1, f"cache: {api.requests} requêtes amont"
+        print("✅ Cache de réponses")
+        
+        # Coalescence: des appels simultanés identiques partagent une requête
+        api.requests = 0
+        await asyncio.gather(*(client.get_actor_portfolio_current(1625) for _ in range(10)))
+        assert api.requests == 1, f"coalescence: {api.requests} requêtes amont"
+        print("✅ Coalescence des requêtes en vol")
+        
+        # Pagination parallèle
+        items = [item async for item in client.iter_items("actualite", concurrency=3)]
+        assert len(items) == 95, f"iter_items: {len(items)} items"
+        assert len({item["id"] for item in items}) == 95, "iter_items: doublons"
+        print("✅ Parcours parallèle des pages")
+        
+        # Fenêtre plus grande que MAX_LIMIT
+        result = await client.search_window("societe", page=1, page_size=150)
+        assert result["count"] == 95 and result["nb_pages"] == 1, result["count"]
+        result = await client.search_window("societe", page=3, page_size=7)
+        assert [item["id"] for item in result["items"]] == list(range(500014, 500021))
+        print("✅ Pages de taille max_results (limit)")
+        
+        # Préchargement: la page 2 est en cache (ou en vol) dès le retour de la page 1
+        eager = CFNewsClient("offline", transport=api.transport(), cache=ResponseCache(), prefetcher=Prefetcher(depth=1))
+        await eager.search_window("acteur", page=1, page_size=10)
+        await eager.search_window("acteur", page=2, page_size=10)
+        stats = eager.stats()["prefetch"]
+        await eager.close()
+        assert stats["issued"] == 2 and stats["hits"] == 1, f"préchargement: {stats}"
+        print("✅ Préchargement de la page suivante")
+        
+        # Cache persistant: un nouveau client (nouveau processus) le retrouve
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.db")
+            threads = set()
+            for _ in range(2):
+                cold = CFNewsClient("offline", transport=api.transport(), cache=SQLiteCache(path))
+                read = cold.cache.get
+                cold.cache.get = lambda key, read=read: threads.add(threading.current_thread().name) or read(key)
+                api.requests = 0
+                body = (await cold.client.get(f"{cold.BASE_URL}/vehicule")).content
+                await cold.get_vehicules(page=1)
+                stored = cold.cache._conn.execute("SELECT value, size FROM responses").fetchone()
+                cold.cache.close()
+                await cold.close()
+            assert api.requests == 1, f"cache disque: {api.requests} requêtes amont"
+            assert stored == (body, len(body)), "corps brut non conservé tel quel"
+            assert threads and all(name.startswith("cfnews-sqlite") for name in threads), threads
+            
+            # Dates d'accès (LRU) écrites par lots plutôt qu'à chaque lecture
+            touched = SQLiteCache(os.path.join(tmp, "touched.db"))
+            touched.set("k", {"n": 1}, ttl=60)
+            accessed = lambda: touched._conn.execute("SELECT accessed_at FROM responses").fetchone()[0]
+            written = accessed()
+            for _ in range(touched.TOUCH_BATCH - 1):
+                touched.get("k")
+            unchanged = accessed() == written
+            touched.get("k")
+            assert unchanged and accessed() > written, "dates d'accès écrites à chaque lecture"
+            touched.close()
+            
+            # Bornes tenues sans recompter le fichier à chaque écriture; erreurs = défaut de cache
+            bounded = SQLiteCache(os.path.join(tmp, "bounded.db"), max_entries=3)
+            for n in range(5):
+                bounded.set(f"k{n}", {"n": n}, ttl=60)
+            kept, evictions, oldest = len(bounded), bounded.evictions, "k0" in bounded
+            bounded.close()
+            assert kept == 3 and evictions == 2 and not oldest, (kept, evictions)
+            assert len(bounded) == 0 and "k4" not in bounded and bounded.stats()["entries"] == 3
+            bounded.clear()
+            assert bounded.errors == 3, bounded.errors
+        print("✅ Cache persistant SQLite")
+        
+        # Revalidation: une entrée expirée est confirmée par un 304 (mémoire et disque),
+        # et retéléchargée si l'API ignore les validateurs
+        with tempfile.TemporaryDirectory() as tmp:
+            for upstream, cache in (
+                (MockCFNewsAPI(), ResponseCache()),
+                (MockCFNewsAPI(), SQLiteCache(os.path.join(tmp, "cache.db"))),
+                (MockCFNewsAPI(validators=False), ResponseCache()),
+            ):
+                fresh = CFNewsClient("offline", transport=upstream.transport(), cache=cache, cache_ttls={"acteur": 0.05})
+                first = await fresh.get_actor_portfolio_current(1625)
+                await asyncio.sleep(0.06)
+                again = await fresh.get_actor_portfolio_current(1625)
+                stats = fresh.stats()
+                await fresh.close()
+                assert again == first and upstream.requests == 2, upstream.requests
+                if upstream.validators:
+                    assert upstream.not_modified == stats["revalidated"] == 1 and stats["bytes_saved"] > 1000, stats
+                else:
+                    assert stats["revalidated"] == stats["bytes_saved"] == 0, stats
+                if isinstance(cache, SQLiteCache):
+                    cache.close()
+        print("✅ Revalidation conditionnelle (ETag / 304)")
+
+        # Résilience: retries sur 503 puis ouverture du disjoncteur
+        down = MockCFNewsAPI(error_rate=1.0)
+        fragile = CFNewsClient(
+            "offline",
+            transport=down.transport(),
+            retry=RetryPolicy(max_attempts=2, base_delay=0.001),
+            circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        )
+        errors = []
+        for page in (1, 2):
+            try:
+                await fragile.search("operation", page)
+            except CFNewsAPIError as e:
+                errors.append(e)
+        await fragile.close()
+        assert down.requests == 2 and fragile.retries == 1, f"retries: {down.requests} requêtes"
+        assert isinstance(errors[0], CFNewsHTTPError) and errors[0].status_code == 503
+        assert isinstance(errors[1], CFNewsCircuitOpenError), type(errors[1])
+        print("✅ Retries et disjoncteur")
+        
+        # Taxonomies: libellés sans accents résolus, inconnus rejetés sans appel amont
+        assert REGIONS.resolve("ile-de-france") == 132336
+        assert SECTORS.resolve_many(["biotechnologies", "Logiciel et services informatique"]) == [124, 297]
+        try:
+            SECTORS.resolve("Aéronautique")
+            raise AssertionError("libellé inconnu accepté")
+        except TaxonomyError:
+            pass
+        # Vocabulaires partiels (mots-clés, titres): libellés inconnus transmis tels quels
+        assert server.news_filters(keywords=["Fintech", "653", "hydrogène"]) == {"keyword": [783, 653, "hydrogène"]}
+        assert PEOPLE_TITLES.resolve_many(["DG", "Directeur commercial"]) == [8416, "Directeur commercial"]
+        server.client, api.requests = client, 0
+        rejected = json.loads(await server.search_actors(nationalities=["Atlantide"]))
+        server.client = None
+        assert "code ISO" in rejected["error"] and api.requests == 0, rejected
+        print("✅ Résolution des taxonomies")
+        
+        # Lot de recherches: une réponse par requête, erreurs isolées
+        server.client, api.requests = client, 0
+        output = await server.batch_search([
+            {"key": "lbo", "entity": "operations", "filters": {"operation_types": ["LBO"]}, "max_results": 3},
+            {"key": "vc", "entity": "funds", "filters": {"segments": ["Venture Capital"]}},
+            {"key": "bad", "entity": "companies", "filters": {"sectors": ["Aéronautique"]}},
+        ])
+        server.client = None
+        result = json.loads(output)
+        assert result["results"]["lbo"]["count"] == 3 and "items" in result["results"]["vc"], output[:200]
+        assert "suggestions" in result["results"]["bad"] and result["errors"] == 1
+        assert api.requests == 2, f"batch_search: {api.requests} requêtes amont"
+        print("✅ Recherches groupées (batch_search)")
+        
+        # Portefeuilles de plusieurs fonds: actuel + sorties en parallèle, participations communes
+        server.client, api.requests = client, 0
+        result = json.loads(await server.get_funds_portfolios([1, 2, 3], portfolio_type="both", overlap=True))
+        server.client = None
+        assert api.requests == 6 and set(result["funds"]) == {"1", "2", "3"}, api.requests
+        assert all(len(entry["funds"]) > 1 for entry in result["overlap"])
+        print("✅ Portefeuilles multi-fonds")
+        
+        # Curseurs: la suite d'une recherche ne retélécharge aucune page amont
+        server.client, api.requests = client, 0
+        first = json.loads(await server.search_companies(max_results=5))
+        following = json.loads(await server.next_results(first["cursor"], max_results=7))
+        fetched = api.requests
+        rest = json.loads(await server.next_results(first["cursor"], max_results=3))
+        server.client = None
+        ids = [item["id"] for item in first["items"] + following["items"] + rest["items"]]
+        assert ids == list(range(500000, 500015)) and following["offset"] == 5, ids
+        assert fetched == api.requests == 3, f"curseur: {api.requests} requêtes amont"
+        assert not server.cursors.get(first["cursor"]).compact and not Cursor("societe", {}, 0, 0, 10).compact
+        print("✅ Curseurs (next_results)")
+        
+        # Budget sur la dernière page: les items retirés restent accessibles par curseur
+        short = MockCFNewsAPI(total_items=12)
+        short_client = CFNewsClient("offline", transport=short.transport())
+        server.client = short_client
+        last = json.loads(await server.search_news(max_results=20, fields=["*"], max_bytes=1500))
+        seen_ids = [item["id"] for item in last["items"]]
+        cursor = last.get("cursor")
+        while cursor:
+            page = json.loads(await server.next_results(cursor, max_results=20, max_bytes=1500))
+            seen_ids += [item["id"] for item in page["items"]]
+            cursor = page.get("cursor")
+        plain = json.loads(await server.search_news(max_results=20))
+        server.client = None
+        await short_client.close()
+        assert last["omitted"] > 0 and seen_ids == list(range(900000, 900012)), seen_ids
+        assert "cursor" not in plain and "cursor" not in page, page.get("_budget")
+        
+        # Budget de taille: textes tronqués, items en trop retirés, curseur repris au premier retiré
+        server.client = client
+        output = await server.search_news(max_results=10, fields=["*"], max_bytes=1500)
+        result = json.loads(output)
+        following = json.loads(await server.next_results(result["cursor"], max_results=1))
+        server.client = None
+        kept = len(result["items"])
+        assert len(output.encode()) <= 1500 and result["omitted"] == 10 - kept > 0, result.get("_budget")
+        assert following["offset"] == kept and budget.estimate_tokens("x" * 400) == 100
+        print("✅ Budget de taille des réponses")
+        
+        # Entités par ID: servies depuis les réponses déjà reçues, recherchées par nom si partielles
+        seen = CFNewsClient("offline", transport=api.transport(), entities=EntityStore())
+        server.client = seen
+        await seen.get_operations(page=1, limit=5)
+        api.requests = 0
+        deal = json.loads(await server.get_entity("operation", 100003))
+        target = json.loads(await server.get_entity("company", deal["item"]["target"]["id"]))
+        assert api.requests == 0 and target["partial"] and deal["item"]["description"], (api.requests, target)
+        company = json.loads(await server.get_entity("company", target["id"], refresh=True))
+        await server.get_entity("company", target["id"])
+        unknown = json.loads(await server.get_entity("company", 500042))
+        server.client = None
+        await seen.close()
+        assert api.requests == 1 and company["item"]["id"] == target["id"] and "partial" not in company, company
+        assert "mémoire locale" in unknown["error"], unknown
+        print("✅ Entités par ID (get_entity)")
+        
+        # Dossier d'opération: recherches indépendantes en parallèle (un aller-retour)
+        slow = MockCFNewsAPI(total_items=50, latency=0.1)
+        dossier_client = CFNewsClient("offline", transport=slow.transport(), entities=EntityStore())
+        server.client = dossier_client
+        await dossier_client.get_operations(page=1, limit=10)
+        started = time.perf_counter()
+        dossier = json.loads(await server.deal_dossier(operation_id=100007))
+        elapsed = time.perf_counter() - started
+        by_name = json.loads(await server.deal_dossier(company_name=dossier["target"]["name"]))
+        unseen = json.loads(await server.deal_dossier(operation_id=100042))
+        server.client = None
+        await dossier_client.close()
+        investors = dossier["operation"]["investors"]
+        assert "errors" not in dossier and dossier["target"]["id"] == 500007, dossier.get("errors")
+        assert "partial" not in dossier["target"] and len(dossier["investors"]) == len(investors)
+        assert [i["lead"] for i in dossier["investors"]] == [i["lead"] for i in investors]
+        assert dossier["lead_investor"]["id"] == investors[0]["id"] and dossier["news"]["items"]
+        assert elapsed < 0.25, f"dossier: {elapsed:.2f} s pour {3 + len(investors)} requêtes"
+        assert {"operation", "target", "investors", "news"} <= by_name.keys(), by_name.get("errors")
+        assert "mémoire locale" in unseen["errors"]["operation"] and "target" not in unseen, unseen
+        
+        # Cible partielle (recherche en échec): le cache et les entités restent intacts
+        async def no_companies(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/societe"):
+                return httpx.Response(503, text="Service temporairement indisponible")
+            return await api.handle(request)
+        
+        partial_client = CFNewsClient(
+            "offline", transport=httpx.MockTransport(no_companies), cache=ResponseCache(),
+            entities=EntityStore(), retry=RetryPolicy(max_attempts=1)
+        )
+        server.client = partial_client
+        before = json.loads(await server.search_operations(max_results=10))["items"][7]
+        degraded = json.loads(await server.deal_dossier(operation_id=before["id"]))
+        after = json.loads(await server.search_operations(max_results=10))["items"][7]
+        entity = json.loads(await server.get_entity("operation", before["id"]))
+        server.client = None
+        await partial_client.close()
+        assert degraded["target"]["partial"] and after == before, degraded.get("target")
+        assert "partial" not in entity["item"]["target"], entity
+        print(f"✅ Dossier d'opération (deal_dossier: {elapsed * 1000:.0f} ms)")
+        
+        # Veilles: seuls les items publiés depuis la création, une requête (304 si rien de neuf) par relève
+        feed = MockCFNewsAPI(total_items=500)
+        sorts = []
+        
+        async def sorted_feed(request: httpx.Request) -> httpx.Response:
+            sorts.append((request.url.path, *upstream_sort(request)))
+            return await feed.handle(request)
+        
+        watcher = CFNewsClient("offline", transport=httpx.MockTransport(sorted_feed), cache=ResponseCache())
+        server.client = watcher
+        created = json.loads(await server.create_watch("news", {"themes": ["LBO"]}, label="LBO"))
+        feed.publish("actualite", 3)
+        feed.requests = 0
+        updates = json.loads(await server.get_watch_updates(created["watch_id"], refresh=True))
+        calm = json.loads(await server.get_watch_updates(created["watch_id"], refresh=True))
+        await server.delete_watch(created["watch_id"])
+        server.client = None
+        await watcher.close()
+        assert [item["id"] for item in updates["items"]] == [899997, 899998, 899999], updates
+        assert calm["count"] == 0 and feed.requests == 2 and feed.not_modified == 1, feed.requests
+        assert set(sorts) == {("/v1/actualite", None, "descending")}, sorts
+        
+        # Première page momentanément vide: la relève suivante repart de l'ancienne tête
+        outage = {"empty": False}
+        
+        async def flaky(request: httpx.Request) -> httpx.Response:
+            if outage["empty"]:
+                return httpx.Response(200, json={"count": 0, "total": 0, "page": 1, "nb_pages": 1, "items": []})
+            return await sorted_feed(request)
+        
+        flaky_client = CFNewsClient("offline", transport=httpx.MockTransport(flaky))
+        poller = WatchPoller(lambda: flaky_client)
+        sorts.clear()
+        await poller.poll(poller.add("operations", "operation", {"sort_attribute": "attr_name_s"}))
+        assert sorts == [("/v1/operation", "fiche_operation_operation_date_value_dt", "descending")], sorts
+        try:
+            poller.add("funds", "vehicule", {})
+            raise AssertionError("veille acceptée sans tri par date")
+        except ValueError:
+            pass
+        watch = poller.add("news", "actualite", {})
+        await poller.poll(watch)
+        outage["empty"] = True
+        await poller.poll(watch)
+        outage["empty"] = False
+        feed.publish("actualite", 2)
+        found = await poller.poll(watch)
+        await flaky_client.close()
+        schema = next(tool for tool in await server.mcp.list_tools() if tool.name == "delete_watch").parameters
+        assert found == 2 and list(schema["properties"]) == ["watch_id"], (found, schema)
+        print("✅ Veilles (get_watch_updates)")
+
+        # Miroir local: synchronisation complète puis recherches sans appel amont
+        with tempfile.TemporaryDirectory() as tmp:
+            local = Mirror(os.path.join(tmp, "mirror.db"))
+            ordered = []
+            
+            async def recording(request: httpx.Request) -> httpx.Response:
+                ordered.append(upstream_sort(request))
+                return await api.handle(request)
+            
+            recorded = CFNewsClient("offline", transport=httpx.MockTransport(recording))
+            report = await MirrorSync(recorded, local, since=date(2000, 1, 1)).sync("operation")
+            await recorded.close()
+            assert report["complete"] and report["items"] == 95, report
+            assert set(ordered) == {("fiche_operation_operation_date_value_dt", "descending")}, ordered
+            server.client, server.mirror, api.requests = client, local, 0
+            result = json.loads(await server.search_operations(date_from="01/01/2000", max_results=5))
+            server.client, server.mirror = None, None
+            assert api.requests == 0 and result["total"] == 95 and result["count"] == 5, api.requests
+            
+            # Filtres locaux seulement sur des champs renseignés sur tous les items
+            by_sector = {"depuis": "01/01/2000", "sector": [124]}
+            assert local.search("operation", by_sector) is not None
+            assert local.search("operation", {"depuis": "01/01/2000", "Montantmin": 10}) is None
+            local.upsert("operation", [{"id": 1, "date": "01/01/2024", "name": "Sans secteur"}])
+            assert local.search("operation", by_sector) is None
+            
+            # Publication entre deux pages: la tête est relue hors cache
+            news = MockCFNewsAPI(total_items=250)
+            sorts = set()
+            
+            async def publishing(request: httpx.Request) -> httpx.Response:
+                sorts.add(upstream_sort(request))
+                if request.url.params.get("page") == "2" and not news.published:
+                    news.publish("actualite", 3)
+                return await news.handle(request)
+            
+            syncing = CFNewsClient("offline", transport=httpx.MockTransport(publishing), cache=ResponseCache())
+            report = await MirrorSync(syncing, local, since=date(2000, 1, 1)).sync("actualite")
+            cached = len(syncing.cache)
+            records = local.stats()["endpoints"]["actualite"]["records"]
+            await syncing.close()
+            local.close()
+            assert report["complete"] and report["items"] == 253, report
+            assert records == 253 and cached == 0 and sorts == {(None, None)}, sorts
+            
+            # Actualités sans tri documenté: un ordre non décroissant interrompt la passe
+            async def reversed_pages(request: httpx.Request) -> httpx.Response:
+                page = json.loads((await news.handle(request)).content)
+                page["items"].reverse()
+                return httpx.Response(200, json=page)
+            
+            unordered = CFNewsClient("offline", transport=httpx.MockTransport(reversed_pages))
+            target = Mirror(os.path.join(tmp, "unordered.db"))
+            try:
+                await MirrorSync(unordered, target, since=date(2000, 1, 1)).sync("actualite")
+                raise AssertionError("ordre des actualités non vérifié")
+            except MirrorSyncError:
+                pass
+            state = target.state("actualite")
+            target.close()
+            await unordered.close()
+            assert state is None, state
+        print("✅ Miroir local synchronisé")
+        
+        # Agrégats en colonnes: comptes, sommes et médianes par groupe
+        deals = [
+            {"date": "15/02/2024", "type": "LBO", "amount": 10.0},
+            {"date": "01/03/2024", "type": "lbo", "amount": 30.0},
+            {"date": "20/03/2024", "type": "LBO", "amount": None},
+            {"date": "05/07/2024", "type": "LBO", "amount": 50.0},
+        ]
+        columns = DealColumns(deals)
+        groups = columns.aggregate(["type", "quarter"])
+        assert set(columns.columns["type"]) == {271} and len(columns.warnings) == 2, columns.warnings
+        assert "'amount'" in DealColumns([{"date": "15/02/2024", "type": "LBO"}]).warnings[0]
+        assert groups[0] == {
+            "type": "LBO", "quarter": "2024-T1", "count": 3,
+            "amount_count": 2, "amount_sum": 40.0, "amount_median": 20.0
+        }, groups
+        assert groups[1]["quarter"] == "2024-T3" and groups[1]["amount_median"] == 50.0
+        
+        # deal_statistics: colonnes d'une même recherche réutilisées sans recollecte
+        stats_api = MockCFNewsAPI(total_items=250)
+        stats_client = CFNewsClient("offline", transport=stats_api.transport())
+        server.client = stats_client
+        server.stats_columns.clear()
+        first = json.loads(await server.deal_statistics(group_by=["sector"], max_items=250))
+        fetched = stats_api.requests
+        again = json.loads(await server.deal_statistics(group_by=["type", "year"], max_items=250))
+        server.client = None
+        await stats_client.close()
+        assert first["operations"] == again["operations"] == 250 and fetched == 3, first
+        assert stats_api.requests == fetched and server.stats_columns.hits == 1, stats_api.requests
+        assert sum(group["count"] for group in again["groups"]) == 250
+        print("✅ Statistiques en colonnes")
+        
+        # Métriques: appels d'outils et requêtes amont au format Prometheus
+        exposition = metrics.REGISTRY.render()
+        assert 'cfnews_tool_calls_total{tool="batch_search",outcome="ok"} 1' in exposition
+        assert 'cfnews_upstream_errors_total{error="CFNewsHTTPError"} 2' in exposition
+        assert metrics.UPSTREAM_LATENCY.count("operation", "200") > 0
+        print("✅ Métriques Prometheus")
+        
+        # Taille des réponses en octets, reprise de la sérialisation (sans réencodage)
+        server.client = client
+        before = metrics.TOOL_RESPONSE_BYTES.sum("search_news")
+        output = await server.search_news(themes=["LBO"], max_results=3)
+        recorded = server.last_encoded.get()
+        server.client = None
+        observed = metrics.TOOL_RESPONSE_BYTES.sum("search_news") - before
+        assert recorded is not None and recorded[0] is output, recorded
+        assert observed == recorded[1] == len(output.encode("utf-8")) > len(output), observed
+        
+        # Mode trace: durées par phase sous _timings
+        server.client = client
+        result = json.loads(await server.search_news(themes=["LBO"], page=7, trace=True))
+        server.client = None
+        assert {"filters", "http", "json_decode", "format"} <= set(result["_timings"]["phases"]), result["_timings"]
+        print("✅ Mode trace (_timings)")
+        
+        # Démarrage à froid: premier appel d'outil en stdio sous le budget
+        startup_budget = float(os.getenv("CFNEWS_STARTUP_BUDGET_MS", 5000))
+        startup = await time_to_first_response()
+        assert startup["first_response_ms"] < startup_budget, f"démarrage: {startup}"
+        print(f"✅ Démarrage à froid (stdio: {startup['first_response_ms']:.0f} ms)")
+        
+        print("\n✨ Tests hors ligne réussis!")
+        return True
+        
+    except AssertionError as e:
+        print(f"\n❌ Échec: {e}")
+        return False
+    finally:
+        await client.close()
+
+
+async def main(offline: bool = False):
     """Lance tous les tests."""
     print("=" * 60)
     print("🧪 Tests du serveur MCP CFNEWS")
     print("=" * 60)
     
-    # Test 1: Client de base
-    success1 = await test_client()
-    
-    # Test 2: Filtres avancés
-    success2 = await test_filters()
+    if offline:
+        success1 = await test_offline()
+        success2 = True
+    else:
+        # Test 1: Client de base
+        success1 = await test_client()
+        
+        # Test 2: Filtres avancés
+        success2 = await test_filters()
     
     print("\n" + "=" * 60)
     if success1 and success2:
@@ -146,5 +634,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = asyncio.run(main(offline="--offline" in sys.argv))
     exit(exit_code)
@@ -0,0 +1,196 @@
+"""Budget de taille des réponses d'outils (octets, ou tokens estimés)."""
+import contextvars
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from . import json_codec
+
+# Estimation grossière: ~4 octets UTF-8 par token pour du texte français ou
+# anglais et du JSON compact (pas de tokenizer sur le chemin critique)
+BYTES_PER_TOKEN = 4
+
+# Budget minimum accepté (octets)
+MIN_BYTES = 256
+
+# Longueur minimum conservée d'un texte tronqué, et marque de troncature
+MIN_TEXT = 80
+TRUNCATION_MARKER = " […]"
+
+# Place réservée au rapport `_budget`
+REPORT_BYTES = 128
+
+_current: "contextvars.ContextVar[Optional[int]]" = contextvars.ContextVar("cfnews_budget", default=None)
+
+
+def estimate_tokens(data: Union[str, bytes]) -> int:
+    """
+    Nombre de tokens estimé d'un texte ou de JSON encodé.
+
+    Sans allocation pour des octets ou du texte ASCII (longueur seule).
+    """
+    if isinstance(data, str) and not data.isascii():
+        data = data.encode("utf-8")
+    return (len(data) + BYTES_PER_TOKEN - 1) // BYTES_PER_TOKEN
+
+
+def limit(max_bytes: Optional[int] = None, max_tokens: Optional[int] = None) -> Optional[int]:
+    """Budget en octets (le plus strict des deux; None sans budget)."""
+    limits = [value for value in (max_bytes, max_tokens and max_tokens * BYTES_PER_TOKEN) if value]
+    if not limits:
+        return None
+    return max(MIN_BYTES, min(limits))
+
+
+def begin(max_bytes: int) -> "contextvars.Token[Optional[int]]":
+    """Applique un budget aux réponses de l'appel en cours."""
+    return _current.set(max_bytes)
+
+
+def end(token: "contextvars.Token[Optional[int]]") -> None:
+    _current.reset(token)
+
+
+def current() -> Optional[int]:
+    """Budget de l'appel en cours (None sans budget)."""
+    return _current.get()
+
+
+def _is_items(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(item, dict) for item in value)
+
+
+def _prepare(
+    value: Any,
+    text_limit: int,
+    lists: List[Tuple[Any, Any]],
+    stats: Dict[str, int],
+    inside: bool = False
+) -> Any:
+    """
+    Copie `value` en tronquant les textes trop longs.
+
+    Les listes d'objets les plus externes (listes d'items) ne sont pas
+    copiées mais relevées avec leur emplacement (conteneur, clé): leurs
+    items sont préparés un par un au remplissage. Les structures d'origine
+    ne sont pas modifiées (elles peuvent venir du cache).
+    """
+    if isinstance(value, str):
+        if len(value) > text_limit + len(TRUNCATION_MARKER):
+            stats["truncated_fields"] += 1
+            return value[:text_limit] + TRUNCATION_MARKER
+        return value
+    if isinstance(value, dict):
+        pairs = value.items()
+    elif isinstance(value, list):
+        pairs = enumerate(value)
+    else:
+        return value
+    copy: Any = {} if isinstance(value, dict) else []
+    for key, child in pairs:
+        outer = not inside and _is_items(child)
+        prepared = child if outer else _prepare(child, text_limit, lists, stats, inside)
+        if isinstance(copy, dict):
+            copy[key] = prepared
+        else:
+            copy.append(prepared)
+        if outer:
+            lists.append((copy, key))
+    return copy
+
+
+def _count_items(value: Any) -> int:
+    """Nombre d'items des listes d'objets les plus externes."""
+    if _is_items(value):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_count_items(child) for child in value.values())
+    if isinstance(value, list):
+        return sum(_count_items(child) for child in value)
+    return 0
+
+
+def dumps_bytes(
+    data: Any,
+    max_bytes: int,
+    indent: bool = False,
+    on_omitted: Optional[Callable[[Any, int], None]] = None
+) -> bytes:
+    """
+    Encode une réponse en JSON UTF-8 dans un budget de `max_bytes` octets.
+
+    Si la réponse dépasse le budget, les textes longs sont tronqués (avec
+    TRUNCATION_MARKER), puis les items de chaque liste d'objets sont
+    encodés un par un et conservés, dans l'ordre, tant qu'ils tiennent dans
+    la place restante (au moins un item est gardé, pour que la pagination
+    progresse). Les listes raccourcies reçoivent `omitted` (nombre d'items
+    retirés) dans leur objet parent, et la réponse un rapport `_budget`.
+
+    Args:
+        data: Réponse à encoder
+        max_bytes: Budget (octets UTF-8)
+        indent: Indentation (voir json_codec.dumps)
+        on_omitted: Appelé pour chaque liste raccourcie avec son objet parent
+            (copie) et le nombre d'items retirés en fin de liste
+    """
+    encoded = json_codec.dumps_bytes(data, indent)
+    if len(encoded) <= max_bytes or not isinstance(data, (dict, list)):
+        return encoded
+
+    # Textes: au plus la moitié de la part d'un item dans le budget
+    text_limit = max(MIN_TEXT, max_bytes // (2 * max(1, _count_items(data))))
+    lists: List[Tuple[Any, Any]] = []
+    stats = {"truncated_fields": 0}
+    shaped = _prepare(data, text_limit, lists, stats)
+    if _is_items(data):
+        # La réponse est elle-même une liste d'items
+        shaped = {"items": data}
+        lists.append((shaped, "items"))
+
+    # Place restante une fois toutes les listes vidées (l'enveloppe)
+    candidates = []
+    for container, key in lists:
+        candidates.append(container[key])
+        container[key] = []
+    remaining = max_bytes - REPORT_BYTES - len(json_codec.dumps_bytes(shaped, indent))
+
+    # Chaque liste reçoit une part égale de la place restante; la part non
+    # utilisée revient aux listes suivantes
+    kept_lists = []
+    for index, ((container, key), items) in enumerate(zip(lists, candidates)):
+        share = remaining // (len(lists) - index)
+        kept = []
+        for item in items:
+            item_stats = {"truncated_fields": 0}
+            item = _prepare(item, text_limit, [], item_stats, inside=True)
+            size = len(json_codec.dumps_bytes(item, indent)) + 1
+            if size > share and (kept or any(k for _, k, _ in kept_lists)):
+                break
+            share -= size
+            remaining -= size
+            stats["truncated_fields"] += item_stats["truncated_fields"]
+            kept.append(item)
+        container[key] = kept
+        kept_lists.append((container, kept, len(items)))
+
+    # Taille par item approchée (indentation, compteurs ajoutés): on retire
+    # des items depuis la fin tant que le budget est dépassé
+    report: Dict[str, Any] = {"max_bytes": max_bytes}
+    while True:
+        omitted = 0
+        for container, kept, count in kept_lists:
+            if len(kept) < count:
+                omitted += count - len(kept)
+                if isinstance(container, dict):
+                    container["omitted"] = count - len(kept)
+        report.update(omitted=omitted, truncated_fields=stats["truncated_fields"])
+        if isinstance(shaped, dict):
+            shaped["_budget"] = report
+        encoded = json_codec.dumps_bytes(shaped, indent)
+        nonempty = [kept for _, kept, _ in kept_lists if kept]
+        if len(encoded) <= max_bytes or sum(len(kept) for kept in nonempty) <= 1:
+            break
+        nonempty[-1].pop()
+    if on_omitted is not None:
+        for container, kept, count in kept_lists:
+            if len(kept) < count:
+                on_omitted(container, count - len(kept))
+    return encoded
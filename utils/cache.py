@@ -0,0 +1,165 @@
+"""Cache de réponses en mémoire (TTL + LRU) pour le client CFNEWS."""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+@dataclass
+class CacheEntry:
+    """
+    Entrée du cache: valeur décodée, taille du corps brut, échéance et
+    validateurs HTTP (ETag / Last-Modified) de la réponse.
+    """
+    value: Any
+    size: int
+    expires_at: float
+    validators: Optional[Dict[str, str]] = None
+
+
+def response_validators(headers: Mapping[str, str]) -> Optional[Dict[str, str]]:
+    """Validateurs HTTP d'une réponse (ETag, Last-Modified), ou None."""
+    validators = {}
+    if headers.get("ETag"):
+        validators["etag"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["last_modified"] = headers["Last-Modified"]
+    return validators or None
+
+
+def conditional_headers(validators: Dict[str, str]) -> Dict[str, str]:
+    """En-têtes d'une requête conditionnelle (If-None-Match, If-Modified-Since)."""
+    headers = {}
+    if "etag" in validators:
+        headers["If-None-Match"] = validators["etag"]
+    if "last_modified" in validators:
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+class ResponseCache:
+    """
+    Cache LRU borné en nombre d'entrées et en octets, avec TTL par entrée.
+
+    Les valeurs stockées sont partagées entre les appelants: elles doivent
+    être traitées en lecture seule. Une entrée expirée qui a des validateurs
+    HTTP est gardée (jusqu'à son éviction) pour être revalidée par une
+    requête conditionnelle plutôt que retéléchargée.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialise le cache.
+
+        Args:
+            max_entries: Nombre maximum d'entrées conservées
+            max_bytes: Taille cumulée maximum des réponses (octets du corps HTTP)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.expires_at > time.monotonic()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retourne la valeur en cache, ou None si absente ou expirée."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            if entry.validators is None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        size: int = 0,
+        validators: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None
+    ) -> None:
+        """
+        Stocke une valeur.
+
+        Args:
+            key: Clé canonique de la requête
+            value: Réponse décodée
+            ttl: Durée de vie en secondes (<= 0 désactive la mise en cache)
+            size: Taille du corps brut en octets, utilisée pour la borne mémoire
+            validators: Validateurs HTTP de la réponse ({"etag", "last_modified"})
+            body: Corps brut de la réponse (inutilisé: seule la valeur décodée
+                est gardée en mémoire)
+        """
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = CacheEntry(value, size, time.monotonic() + ttl, validators or None)
+        self._bytes += size
+        self._evict()
+
+    def validators(self, key: str) -> Optional[Tuple[Dict[str, str], int]]:
+        """Validateurs HTTP et taille d'une entrée (expirée ou non), ou None."""
+        entry = self._entries.get(key)
+        if entry is None or entry.validators is None:
+            return None
+        return entry.validators, entry.size
+
+    def refresh(self, key: str, ttl: float) -> Optional[Any]:
+        """
+        Prolonge une entrée confirmée par l'API (réponse 304).
+
+        Returns:
+            Valeur de l'entrée, ou None si elle a été évincée entre-temps
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry.expires_at = time.monotonic() + ttl
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def clear(self) -> None:
+        """Vide le cache (les compteurs sont conservés)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistiques d'utilisation du cache."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.evictions += 1
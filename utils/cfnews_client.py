@@ -1,31 +1,144 @@
 """Client pour l'API CFNEWS."""
+import asyncio
+import contextvars
+import functools
+import importlib.util
+import logging
+import math
+import time
 import httpx
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Callable, List, AsyncIterator, Tuple, Union, TYPE_CHECKING
 from urllib.parse import urlencode, quote
 
+from . import json_codec, metrics, tracing
+from .cache import ResponseCache, conditional_headers, response_validators
+from .entities import EntityStore
+from .prefetch import Prefetcher
+from .resilience import RetryPolicy, TokenBucket, CircuitBreaker, parse_retry_after
+
+if TYPE_CHECKING:
+    from .disk_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
 
 class CFNewsAPIError(Exception):
     """Erreur lors d'une requête à l'API CFNEWS."""
     pass
 
 
+class CFNewsHTTPError(CFNewsAPIError):
+    """Réponse HTTP en erreur de l'API CFNEWS."""
+    
+    def __init__(self, status_code: int, text: str):
+        super().__init__(f"Erreur HTTP {status_code}: {text}")
+        self.status_code = status_code
+
+
+class CFNewsRateLimitError(CFNewsHTTPError):
+    """Quota de l'API CFNEWS dépassé (429)."""
+    
+    def __init__(self, status_code: int, text: str, retry_after: Optional[float] = None):
+        super().__init__(status_code, text)
+        self.retry_after = retry_after
+
+
+class CFNewsCircuitOpenError(CFNewsAPIError):
+    """Requête refusée sans appel: l'API CFNEWS est considérée indisponible."""
+    pass
+
+
 class CFNewsClient:
     """Client pour interagir avec l'API CFNEWS."""
     
     BASE_URL = "https://api.cfnews.net/v1"
     
-    def __init__(self, api_key: str, timeout: int = 30):
+    # Durée de vie en cache (secondes) par endpoint: les actualités bougent
+    # vite, les fiches véhicules/acteurs et les portefeuilles très peu.
+    CACHE_TTLS = {
+        "actualite": 60,
+        "operation": 300,
+        "mouvement": 300,
+        "people": 900,
+        "societe": 900,
+        "vehicule": 3600,
+        "acteur": 3600,
+    }
+    DEFAULT_CACHE_TTL = 300
+    
+    # Valeur maximum acceptée pour `limit` (mode Evolution: 10x la taille
+    # de page par défaut de l'API)
+    MAX_LIMIT = 100
+    
+    # Filtre de nom par endpoint, pour retrouver une entité par son ID
+    # (get_entity), et nombre de résultats examinés
+    ENTITY_NAME_FILTERS = {
+        "operation": "op_nom",
+        "societe": "soc_nom",
+        "acteur": "acteur_nom",
+        "people": "people_nom",
+    }
+    ENTITY_SEARCH_LIMIT = 20
+    
+    def __init__(
+        self,
+        api_key: str,
+        timeout: Union[float, httpx.Timeout] = 30,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        cache: Optional[Union[ResponseCache, "SQLiteCache"]] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        prefetcher: Optional[Prefetcher] = None,
+        entities: Optional[EntityStore] = None
+    ):
         """
         Initialise le client CFNEWS.
         
         Args:
             api_key: Clé API CFNEWS
-            timeout: Timeout des requêtes en secondes
+            timeout: Timeout des requêtes en secondes, ou httpx.Timeout détaillé
+                (connexion, lecture, attente du pool)
+            limits: Limites du pool de connexions (httpx.Limits)
+            http2: Active le multiplexage HTTP/2 (nécessite le paquet h2)
+            cache: Cache de réponses, en mémoire ou sur disque (aucun si None)
+            cache_ttls: Surcharge des TTL par endpoint (voir CACHE_TTLS)
+            transport: Transport httpx (ex: MockCFNewsAPI().transport() hors ligne)
+            retry: Politique de nouvelles tentatives (RetryPolicy() par défaut)
+            rate_limiter: Limiteur de débit côté client (aucun si None)
+            circuit_breaker: Disjoncteur (aucun si None)
+            prefetcher: Préchargement des pages suivantes dans le cache
+                (aucun si None; ignoré sans cache)
+            entities: Entités des réponses reçues, indexées par (type, id) (aucun si None)
         """
         self.api_key = api_key
         self.timeout = timeout
+        self.cache = cache
+        self.cache_ttls = {**self.CACHE_TTLS, **(cache_ttls or {})}
+        # Requêtes en vol, par clé canonique (coalescence "single-flight")
+        self._inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        self.coalesced = 0
+        self.retry = retry or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.retries = 0
+        self.prefetcher = prefetcher if cache is not None else None
+        self._prefetch_tasks: "set[asyncio.Task[Dict[str, Any]]]" = set()
+        self.entities = entities
+        # Revalidations (réponses 304) et octets de corps non retéléchargés
+        self.revalidated = 0
+        self.bytes_saved = 0
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 demandé mais le paquet h2 est absent: HTTP/1.1 utilisé")
+            http2 = False
         self.client = httpx.AsyncClient(
             timeout=timeout,
+            limits=limits or httpx.Limits(),
+            http2=http2,
+            transport=transport,
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json"
@@ -34,8 +147,42 @@ class CFNewsClient:
     
     async def close(self):
         """Ferme le client HTTP."""
+        for task in list(self._prefetch_tasks):
+            task.cancel()
         await self.client.aclose()
     
+    async def warmup(self) -> bool:
+        """
+        Ouvre une connexion vers l'API (DNS, TCP, TLS) avant la première requête.
+        
+        La connexion reste dans le pool (keep-alive) pour le premier appel
+        d'outil. Le statut de la réponse est ignoré.
+        
+        Returns:
+            True si l'API a répondu
+        """
+        try:
+            await self.client.head(f"{self.BASE_URL}/")
+            return True
+        except httpx.HTTPError as e:
+            logger.warning("Préchauffage de la connexion CFNEWS impossible: %s", e)
+            return False
+    
+    def stats(self) -> Dict[str, Any]:
+        """Statistiques du client (cache, coalescence des requêtes)."""
+        return {
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "inflight": len(self._inflight),
+            "coalesced": self.coalesced,
+            "retries": self.retries,
+            "revalidated": self.revalidated,
+            "bytes_saved": self.bytes_saved,
+            "circuit": self.circuit_breaker.state if self.circuit_breaker is not None else None,
+            "prefetch": self.prefetcher.stats() if self.prefetcher is not None else None,
+            "entities": self.entities.stats() if self.entities is not None else None
+        }
+    
+    @tracing.traced("query_string")
     def _build_query_string(self, params: Dict[str, Any]) -> str:
         """
         Construit la query string encodée pour l'API CFNEWS.
@@ -63,12 +210,293 @@ class CFNewsClient:
         
         return "&".join(query_parts)
     
+    def _cache_key(self, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Construit la clé canonique d'une requête.
+        
+        Les paramètres sont triés pour que deux requêtes équivalentes
+        (mêmes filtres dans un ordre différent) partagent la même clé.
+        
+        Args:
+            path: Chemin relatif à BASE_URL (ex: "operation")
+            params: Paramètres HTTP (page, limit, q)
+        """
+        if not params:
+            return path
+        return f"{path}?{self._build_query_string(dict(sorted(params.items())))}"
+    
+    def _cache_ttl(self, path: str) -> float:
+        """TTL applicable à un chemin, d'après son premier segment."""
+        return self.cache_ttls.get(path.split("/", 1)[0], self.DEFAULT_CACHE_TTL)
+    
+    async def _get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        fresh: bool = False,
+        store: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Effectue un GET sur l'API en passant par le cache de réponses.
+        
+        Les appels concurrents portant sur la même requête canonique
+        attendent une unique requête amont; une erreur est propagée à
+        tous les appelants.
+        
+        Args:
+            path: Chemin relatif à BASE_URL
+            params: Paramètres HTTP
+            fresh: Ignore une réponse encore valide en cache (elle est
+                revalidée par une requête conditionnelle)
+            store: Alimente le cache et les entités; sinon (lectures de
+                masse en tâche de fond), la requête est envoyée telle quelle
+                sans lire ni écrire le cache
+            
+        Returns:
+            Données de la réponse JSON
+        """
+        key = self._cache_key(path, params)
+        if not store:
+            return await self._fetch(key, path, params, store=False)
+        if self.cache is not None and not fresh:
+            with tracing.span("cache"):
+                cached = await self._cache_call(self.cache.get, key)
+            if cached is not None:
+                if self.prefetcher is not None:
+                    self.prefetcher.claim(key, served=True)
+                return cached
+        
+        task = self._inflight.get(key)
+        if self.prefetcher is not None:
+            self.prefetcher.claim(key, served=task is not None)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(self._fetch(key, path, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget_inflight(key, t))
+        # shield: l'annulation d'un appelant n'annule pas la requête partagée
+        return await asyncio.shield(task)
+    
+    async def _cache_call(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Appelle une méthode du cache de réponses.
+        
+        Un cache sur disque (qui expose un `executor`) est appelé dans son
+        thread dédié pour que les accès SQLite ne bloquent pas la boucle
+        d'événements; le cache mémoire est appelé directement.
+        """
+        executor = getattr(self.cache, "executor", None)
+        if executor is None:
+            return method(*args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, functools.partial(method, *args, **kwargs)
+        )
+    
+    def _forget_inflight(self, key: str, task: "asyncio.Task[Dict[str, Any]]") -> None:
+        """Retire une requête terminée de la table des requêtes en vol."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Marque l'exception comme récupérée si plus personne n'attend
+            task.exception()
+    
+    def _prefetch(self, path: str, params: Dict[str, Any]) -> None:
+        """
+        Lance en tâche de fond une requête dont le résultat alimente le cache.
+        
+        La requête est enregistrée parmi les requêtes en vol: un appel réel
+        arrivant avant la fin l'attend au lieu d'en lancer une seconde. Rien
+        n'est lancé si la réponse est déjà en cache ou en vol, si le
+        disjoncteur n'est pas fermé, si le limiteur de débit n'a pas de jeton
+        d'avance ou si le budget de préchargement est épuisé. Un cache sur
+        disque n'est pas consulté ici (accès bloquant) mais par la tâche de
+        préchargement.
+        """
+        key = self._cache_key(path, params)
+        if key in self._inflight:
+            return
+        if getattr(self.cache, "executor", None) is None and key in self.cache:
+            return
+        if self.circuit_breaker is not None and self.circuit_breaker.state != CircuitBreaker.CLOSED:
+            return
+        if self.rate_limiter is not None and self.rate_limiter.available() < 2:
+            self.prefetcher.skipped += 1
+            return
+        if not self.prefetcher.acquire(key):
+            return
+        # Contexte vierge: le préchargement n'apparaît pas dans la trace de l'appel
+        task = asyncio.create_task(self._prefetch_fetch(key, path, params), context=contextvars.Context())
+        self._inflight[key] = task
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(lambda t: self._prefetch_done(key, t))
+    
+    async def _prefetch_fetch(self, key: str, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Préchargement: page déjà dans le cache sur disque, sinon requête amont."""
+        if getattr(self.cache, "executor", None) is not None:
+            cached = await self._cache_call(self.cache.get, key)
+            if cached is not None:
+                return cached
+        return await self._fetch(key, path, params)
+    
+    def _prefetch_done(self, key: str, task: "asyncio.Task[Dict[str, Any]]") -> None:
+        self._prefetch_tasks.discard(task)
+        self._forget_inflight(key, task)
+        self.prefetcher.release(key, failed=task.cancelled() or task.exception() is not None)
+    
+    async def _fetch(
+        self,
+        key: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        store: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Envoie la requête amont et alimente le cache (sauf `store=False`).
+        
+        Une réponse expirée gardée en cache avec ses validateurs (ETag,
+        Last-Modified) est revalidée par une requête conditionnelle: un 304
+        la prolonge sans retélécharger ni redécoder le corps. Si l'API ignore
+        les validateurs, la réponse complète est traitée normalement.
+        """
+        stale = await self._cache_call(self.cache.validators, key) if self.cache is not None and store else None
+        try:
+            response = await self._send(path, params, conditional_headers(stale[0]) if stale else None)
+            if response.status_code == 304:
+                data = await self._cache_call(self.cache.refresh, key, self._cache_ttl(path)) if stale else None
+                if data is not None:
+                    self.revalidated += 1
+                    self.bytes_saved += stale[1]
+                    metrics.UPSTREAM_BYTES_SAVED.inc(metrics.endpoint_label(path), amount=stale[1])
+                    if self.entities is not None:
+                        self.entities.add_response(path, data)
+                    return data
+                # Entrée évincée pendant la requête: on redemande le corps
+                response = await self._send(path, params)
+                if response.status_code == 304:
+                    raise CFNewsHTTPError(304, "réponse 304 à une requête non conditionnelle")
+        except CFNewsAPIError as e:
+            metrics.UPSTREAM_ERRORS.inc(type(e).__name__)
+            raise
+        with tracing.span("json_decode"):
+            data = json_codec.loads(response.content)
+        
+        if not store:
+            return data
+        if self.cache is not None:
+            await self._cache_call(
+                self.cache.set, key, data, self._cache_ttl(path), len(response.content),
+                response_validators(response.headers), body=response.content
+            )
+        if self.entities is not None:
+            self.entities.add_response(path, data)
+        return data
+    
+    async def _send(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Envoie un GET avec la couche de résilience.
+        
+        Les erreurs réseau et les statuts 429/502/503/504 sont retentés avec
+        un backoff exponentiel (ou le délai Retry-After); un 429 suspend
+        aussi le limiteur de débit. Le disjoncteur fait échouer la requête
+        immédiatement tant que l'API est considérée en panne.
+        
+        Args:
+            path: Chemin relatif à BASE_URL
+            params: Paramètres HTTP
+            headers: En-têtes ajoutés (ex: requête conditionnelle, à laquelle
+                l'API peut répondre 304)
+        
+        Raises:
+            CFNewsCircuitOpenError: Le disjoncteur est ouvert
+            CFNewsRateLimitError: Quota dépassé après les tentatives permises
+            CFNewsHTTPError: Réponse en erreur
+            CFNewsAPIError: Erreur réseau après les tentatives permises
+        """
+        url = f"{self.BASE_URL}/{path}"
+        endpoint = metrics.endpoint_label(path)
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.circuit_breaker is not None and not self.circuit_breaker.allow():
+                raise CFNewsCircuitOpenError(
+                    f"API CFNEWS indisponible, nouvel essai dans "
+                    f"{self.circuit_breaker.retry_in():.0f}s"
+                )
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            
+            start = time.perf_counter()
+            metrics.UPSTREAM_INFLIGHT.inc()
+            error: Optional[httpx.RequestError] = None
+            trace = tracing.current()
+            try:
+                if trace is None:
+                    response = await self.client.get(url, params=params, headers=headers)
+                else:
+                    with tracing.span("http"):
+                        response = await self.client.get(
+                            url, params=params, headers=headers, extensions={"trace": tracing.HTTPTrace(trace)}
+                        )
+            except httpx.RequestError as e:
+                error = e
+            finally:
+                metrics.UPSTREAM_INFLIGHT.dec()
+            elapsed = time.perf_counter() - start
+            
+            if error is not None:
+                metrics.UPSTREAM_LATENCY.observe(elapsed, endpoint, type(error).__name__)
+                self._record_outcome(failed=True)
+                if self.retry.should_retry(attempt):
+                    await self._backoff(attempt)
+                    continue
+                raise CFNewsAPIError(f"Erreur de requête: {str(error)}")
+            
+            metrics.UPSTREAM_LATENCY.observe(elapsed, endpoint, str(response.status_code))
+            metrics.UPSTREAM_RESPONSE_BYTES.observe(len(response.content), endpoint)
+            
+            # Un 429 signale un quota, pas une panne: il n'ouvre pas le circuit
+            self._record_outcome(failed=response.status_code >= 500)
+            if response.status_code in self.retry.RETRY_STATUSES:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if response.status_code == 429 and retry_after and self.rate_limiter is not None:
+                    self.rate_limiter.pause(retry_after)
+                if self.retry.should_retry(attempt, retry_after):
+                    await self._backoff(attempt, retry_after)
+                    continue
+                if response.status_code == 429:
+                    raise CFNewsRateLimitError(response.status_code, response.text, retry_after)
+            if response.is_error:
+                raise CFNewsHTTPError(response.status_code, response.text)
+            return response
+    
+    def _record_outcome(self, failed: bool) -> None:
+        """Informe le disjoncteur du résultat d'une tentative."""
+        if self.circuit_breaker is None:
+            return
+        if failed:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+    
+    async def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> None:
+        """Attend avant une nouvelle tentative."""
+        self.retries += 1
+        await asyncio.sleep(self.retry.delay(attempt, retry_after))
+    
     async def search(
         self,
         endpoint: str,
         page: int = 1,
         query_params: Optional[Dict[str, Any]] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        fresh: bool = False,
+        store: bool = True
     ) -> Dict[str, Any]:
         """
         Effectue une recherche sur un endpoint CFNEWS.
@@ -78,40 +506,194 @@ class CFNewsClient:
             page: Numéro de page
             query_params: Paramètres de recherche
             limit: Limite de résultats (utilise le mode Evolution)
+            fresh: Interroge l'API même si la réponse est en cache (voir _get)
+            store: Alimente le cache et les entités (voir _get)
             
         Returns:
             Données de la réponse JSON
         """
-        url = f"{self.BASE_URL}/{endpoint}"
-        
+        return await self._get(endpoint, self._search_params(page, query_params, limit), fresh, store)
+    
+    def _search_params(
+        self,
+        page: int,
+        query_params: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Paramètres HTTP d'une recherche (page, limit, q)."""
         # Paramètres de base
-        base_params = {"page": page}
+        base_params: Dict[str, Any] = {"page": page}
         if limit:
             base_params["limit"] = limit
         
-        # Construire la query string
+        # Construire la query string (clés triées: forme canonique, partagée
+        # par le cache quel que soit l'ordre des filtres)
         query_string = ""
         if query_params:
-            query_string = self._build_query_string(query_params)
+            query_string = self._build_query_string(dict(sorted(query_params.items())))
         
         if query_string:
             base_params["q"] = query_string
         
+        return base_params
+    
+    async def search_window(
+        self,
+        endpoint: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        page: int = 1,
+        page_size: int = 10,
+        concurrency: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Récupère la page `page` d'une recherche découpée en pages de `page_size`.
+        
+        Le paramètre `limit` de l'API est utilisé pour ne télécharger que les
+        items demandés. Au-delà de MAX_LIMIT, les pages amont couvrant la
+        fenêtre sont récupérées en parallèle puis fusionnées.
+        
+        Avec un `prefetcher`, les pages suivantes (jusqu'à sa profondeur) sont
+        ensuite préchargées en tâche de fond dans le cache.
+        
+        Args:
+            endpoint: Endpoint à interroger
+            query_params: Paramètres de recherche
+            page: Numéro de page (en pages de `page_size` items)
+            page_size: Nombre d'items par page
+            concurrency: Nombre maximum de requêtes simultanées
+            
+        Returns:
+            Réponse au format de l'API (count, total, page, nb_pages, items)
+        """
+        page = max(1, page)
+        page_size = max(1, page_size)
+        limit, upstream_pages = self._window_pages(page, page_size)
+        if page_size <= self.MAX_LIMIT:
+            result = await self.search(endpoint, page, query_params, limit=page_size)
+        else:
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+            
+            async def fetch(upstream_page: int) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.search(endpoint, upstream_page, query_params, limit=limit)
+            
+            pages = await asyncio.gather(*(fetch(p) for p in upstream_pages))
+            items: List[Dict[str, Any]] = []
+            for data in pages:
+                items.extend(data.get("items") or [])
+            start = (page - 1) * page_size - (upstream_pages[0] - 1) * limit
+            items = items[start:start + page_size]
+            total = pages[0].get("total", 0)
+            
+            result = {
+                "count": len(items),
+                "total": total,
+                "page": page,
+                "nb_pages": max(1, math.ceil(total / page_size)),
+                "items": items
+            }
+        
+        if self.prefetcher is not None:
+            last_page = min(int(result.get("nb_pages") or 1), page + self.prefetcher.depth)
+            for next_page in range(page + 1, last_page + 1):
+                limit, upstream_pages = self._window_pages(next_page, page_size)
+                for upstream_page in upstream_pages:
+                    self._prefetch(endpoint, self._search_params(upstream_page, query_params, limit))
+        return result
+    
+    def _window_pages(self, page: int, page_size: int) -> Tuple[int, List[int]]:
+        """
+        Pages amont couvrant la page `page` d'une recherche en pages de `page_size`.
+        
+        Returns:
+            Taille des pages amont (`limit`) et numéros des pages à récupérer
+        """
+        if page_size <= self.MAX_LIMIT:
+            return page_size, [page]
+        # Fenêtre [offset, offset + page_size) couverte par des pages amont
+        # de MAX_LIMIT items
+        chunk = self.MAX_LIMIT
+        offset = (page - 1) * page_size
+        first_page = offset // chunk + 1
+        last_page = (offset + page_size - 1) // chunk + 1
+        return chunk, list(range(first_page, last_page + 1))
+    
+    async def iter_pages(
+        self,
+        endpoint: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        concurrency: int = 4,
+        max_items: Optional[int] = None,
+        ordered: bool = True,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parcourt les pages d'une recherche.
+        
+        La page 1 est récupérée d'abord pour lire `nb_pages`, puis les pages
+        suivantes sont demandées en parallèle (au plus `concurrency` requêtes
+        simultanées). Les requêtes restantes sont annulées si l'appelant
+        interrompt l'itération.
+        
+        Args:
+            endpoint: Endpoint à interroger
+            query_params: Paramètres de recherche
+            max_pages: Nombre maximum de pages à récupérer
+            concurrency: Nombre maximum de requêtes simultanées
+            max_items: Arrête la récupération une fois ce nombre d'items atteint
+            ordered: Restitue les pages dans l'ordre (sinon dès leur arrivée)
+            limit: Taille des pages amont (mode Evolution, au plus MAX_LIMIT)
+            
+        Yields:
+            Réponses JSON de chaque page
+        """
+        if limit is not None:
+            limit = min(limit, self.MAX_LIMIT)
+        first = await self.search(endpoint, 1, query_params, limit)
+        yield first
+        
+        last_page = int(first.get("nb_pages") or 1)
+        if max_pages is not None:
+            last_page = min(last_page, max_pages)
+        page_size = len(first.get("items") or [])
+        if max_items is not None and page_size:
+            last_page = min(last_page, math.ceil(max_items / page_size))
+        if last_page <= 1:
+            return
+        
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def fetch(page: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.search(endpoint, page, query_params, limit)
+        
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(2, last_page + 1)]
         try:
-            response = await self.client.get(url, params=base_params)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            raise CFNewsAPIError(f"Erreur HTTP {e.response.status_code}: {e.response.text}")
-        except httpx.RequestError as e:
-            raise CFNewsAPIError(f"Erreur de requête: {str(e)}")
+            for task in (tasks if ordered else asyncio.as_completed(tasks)):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def iter_items(
+        self,
+        endpoint: str,
+        query_params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Parcourt les items de toutes les pages (voir iter_pages)."""
+        async for page in self.iter_pages(endpoint, query_params, **kwargs):
+            for item in page.get("items") or []:
+                yield item
     
     async def get_operations(
         self,
         page: int = 1,
         filters: Optional[Dict[str, Any]] = None,
         sort_by: str = "fiche_operation_operation_date_value_dt",
-        sort_order: str = "descending"
+        sort_order: str = "descending",
+        limit: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Recherche des opérations (deals).
@@ -121,13 +703,24 @@ class CFNewsClient:
             filters: Filtres de recherche
             sort_by: Champ de tri
             sort_order: Ordre (ascending/descending)
+            limit: Taille de page (au plus MAX_LIMIT)
         """
-        params = filters or {}
-        params.update({
+        return await self.search(
+            "operation", page, self.operation_params(filters, sort_by, sort_order), limit
+        )
+    
+    @staticmethod
+    def operation_params(
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "fiche_operation_operation_date_value_dt",
+        sort_order: str = "descending"
+    ) -> Dict[str, Any]:
+        """Paramètres de recherche d'opérations, tri inclus."""
+        return {
+            **(filters or {}),
             "sort_attribute": sort_by,
             "sort_type": sort_order
-        })
-        return await self.search("operation", page, params)
+        }
     
     async def get_vehicules(
         self,
@@ -172,27 +765,41 @@ class CFNewsClient:
     async def get_actualites(
         self,
         page: int = 1,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
     ) -> Dict[str, Any]:
         """Recherche des actualités."""
-        return await self.search("actualite", page, filters)
+        return await self.search("actualite", page, filters, limit)
+    
+    async def get_entity(self, endpoint: str, entity_id: int, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrouve une entité par son ID à l'aide de la recherche par nom.
+        
+        L'API ne documente pas de lecture par ID: l'entité est cherchée par
+        son nom (filtre de nom de l'endpoint, voir ENTITY_NAME_FILTERS) et
+        retenue si son `id` correspond.
+        
+        Args:
+            endpoint: Endpoint de l'entité (operation, societe, acteur, people)
+            entity_id: ID de l'entité
+            name: Nom de l'entité (ou de la société cible pour une opération)
+        
+        Returns:
+            L'item, ou None s'il ne figure pas dans les résultats
+        """
+        param = self.ENTITY_NAME_FILTERS.get(endpoint)
+        if param is None or not name:
+            return None
+        data = await self.search(endpoint, 1, {param: name}, limit=self.ENTITY_SEARCH_LIMIT)
+        return next(
+            (item for item in data.get("items") or [] if isinstance(item, dict) and item.get("id") == entity_id),
+            None
+        )
     
     async def get_actor_portfolio_current(self, actor_id: int) -> Dict[str, Any]:
         """Récupère le portefeuille actuel d'un fonds."""
-        url = f"{self.BASE_URL}/acteur/portfolio_now/{actor_id}"
-        try:
-            response = await self.client.get(url)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            raise CFNewsAPIError(f"Erreur HTTP {e.response.status_code}: {e.response.text}")
+        return await self._get(f"acteur/portfolio_now/{actor_id}")
     
     async def get_actor_portfolio_exits(self, actor_id: int) -> Dict[str, Any]:
         """Récupère le portefeuille de sorties d'un fonds."""
-        url = f"{self.BASE_URL}/acteur/portfolio_sortie/{actor_id}"
-        try:
-            response = await self.client.get(url)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            raise CFNewsAPIError(f"Erreur HTTP {e.response.status_code}: {e.response.text}")
+        return await self._get(f"acteur/portfolio_sortie/{actor_id}")
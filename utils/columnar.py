@@ -0,0 +1,186 @@
+"""Représentation en colonnes NumPy des opérations et agrégats vectorisés."""
+import math
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .taxonomy import OPERATION_TYPES, REGIONS, SECTORS, Taxonomy
+
+# Dimensions de regroupement: nom -> colonne (ou seau de temps)
+GROUP_BY = ("type", "sector", "region", "year", "quarter", "month")
+
+# Colonnes d'ids: champ libellé des items -> taxonomie de MAPPINGS.md
+TAXONOMIES: Dict[str, Taxonomy] = {"type": OPERATION_TYPES, "sector": SECTORS, "region": REGIONS}
+
+
+def _date_key(value: Any) -> int:
+    """Date d'opération (DD/MM/YYYY ou YYYY-MM-DD) en entier AAAAMMJJ (0 si illisible)."""
+    if not isinstance(value, str):
+        return 0
+    try:
+        if "/" in value:
+            day, month, year = value[:10].split("/")
+        else:
+            year, month, day = value[:10].split("-")
+        return int(year) * 10000 + int(month) * 100 + int(day)
+    except ValueError:
+        return 0
+
+
+class DealColumns:
+    """
+    Opérations stockées en colonnes NumPy: date (AAAAMMJJ), type, secteur,
+    région (ids int64, 0 si absent) et montant en M€ (float64, NaN si non
+    communiqué).
+
+    Les ids sont ceux de MAPPINGS.md, déduits des libellés des items
+    (`type`, `sector`, `region`): chaque libellé distinct n'est résolu qu'une
+    fois, un libellé hors référentiel reçoit un id négatif propre à ce jeu
+    d'opérations. Les libellés sont conservés à part pour l'affichage. Une
+    colonne absente de tous les items est signalée dans `warnings` (ses
+    valeurs ne sont que des 0 ou des NaN).
+    """
+
+    def __init__(self, items: Iterable[Dict[str, Any]]):
+        """
+        Args:
+            items: Items de l'endpoint operation
+        """
+        rows = [item for item in items if isinstance(item, dict)]
+        dates = np.fromiter((_date_key(item.get("date")) for item in rows), np.int64, len(rows))
+        amounts = np.fromiter(
+            (item["amount"] if isinstance(item.get("amount"), (int, float)) else math.nan for item in rows),
+            np.float64, len(rows)
+        )
+        present = {
+            "date": int(np.count_nonzero(dates)),
+            "amount": sum("amount" in item for item in rows),
+        }
+        self.labels: Dict[str, Dict[int, str]] = {}
+        ids: Dict[str, Any] = {}
+        for name, taxonomy in TAXONOMIES.items():
+            ids[name], self.labels[name] = self._resolve(rows, name, taxonomy)
+            present[name] = int(np.count_nonzero(ids[name]))
+
+        self.columns: Dict[str, Any] = {"date": dates, **ids, "amount": amounts}
+        self.warnings: List[str] = [
+            f"Champ {name!r} absent de toutes les opérations: colonne non renseignée"
+            for name, count in present.items() if rows and not count
+        ]
+
+    @staticmethod
+    def _resolve(rows: List[Dict[str, Any]], name: str, taxonomy: Taxonomy) -> Tuple[Any, Dict[int, str]]:
+        """Colonne d'ids d'un champ libellé: résolution des seuls libellés distincts."""
+        labels = [item.get(name) if isinstance(item.get(name), str) else "" for item in rows]
+        uniques, inverse = np.unique(np.array(labels, dtype=object), return_inverse=True)
+        values = np.zeros(len(uniques), np.int64)
+        names: Dict[int, str] = {}
+        unknown = 0
+        for i, label in enumerate(uniques):
+            if not label:
+                continue
+            if label in taxonomy:
+                values[i] = int(taxonomy.resolve(label))
+            else:
+                unknown += 1
+                values[i] = -unknown
+            names.setdefault(int(values[i]), label)
+        return values[inverse.reshape(-1)], names
+
+    def __len__(self) -> int:
+        return len(self.columns["date"])
+
+    def key_column(self, name: str) -> Any:
+        """Colonne de regroupement (ids, ou seau de temps dérivé de la date)."""
+        dates = self.columns["date"]
+        if name in TAXONOMIES:
+            return self.columns[name]
+        if name == "year":
+            return dates // 10000
+        if name == "month":
+            return dates // 100
+        return dates // 10000 * 10 + (dates // 100 % 100 - 1) // 3 + 1
+
+    def label(self, name: str, key: int) -> Any:
+        """Libellé d'une valeur de regroupement (ex: 20241 -> "2024-T1")."""
+        if name in self.labels:
+            return self.labels[name].get(key, key or None)
+        if not key:
+            return None
+        if name == "month":
+            return f"{key // 100}-{key % 100:02d}"
+        if name == "quarter":
+            return f"{key // 10}-T{key % 10}"
+        return key
+
+    def aggregate(self, group_by: List[str]) -> List[Dict[str, Any]]:
+        """
+        Regroupe les opérations et calcule nombre, somme et médiane des montants.
+
+        Args:
+            group_by: Dimensions parmi GROUP_BY (vide: une seule ligne)
+
+        Returns:
+            Une ligne par groupe ({dimension: libellé, count, amount_count,
+            amount_sum, amount_median}), par nombre d'opérations décroissant
+        """
+        unknown = [name for name in group_by if name not in GROUP_BY]
+        if unknown:
+            raise ValueError(f"Dimension inconnue: {', '.join(unknown)} (attendu: {', '.join(GROUP_BY)})")
+        if not len(self):
+            return []
+        keys = [self.key_column(name) for name in group_by]
+        groups = self._aggregate(keys)
+
+        rows = []
+        for key, count, amount_count, amount_sum, median in groups:
+            row: Dict[str, Any] = {name: self.label(name, int(k)) for name, k in zip(group_by, key)}
+            row.update({
+                "count": int(count),
+                "amount_count": int(amount_count),
+                "amount_sum": round(float(amount_sum), 2),
+                "amount_median": round(float(median), 2) if amount_count else None,
+            })
+            rows.append(row)
+        return sorted(rows, key=lambda row: -row["count"])
+
+    def _aggregate(self, keys: List[Any]) -> List[Tuple[Tuple[int, ...], int, int, float, float]]:
+        """Agrégation vectorisée: codes de groupe, bincount, médianes par tri."""
+        amounts = self.columns["amount"]
+        # Code de groupe: combinaison des rangs de chaque dimension
+        codes = np.zeros(len(amounts), np.int64)
+        values = []
+        for column in keys:
+            uniques, ranks = np.unique(column, return_inverse=True)
+            codes = codes * len(uniques) + ranks.reshape(-1)
+            values.append(uniques)
+        groups, codes = np.unique(codes, return_inverse=True)
+        codes = codes.reshape(-1)
+        n = len(groups)
+
+        known = ~np.isnan(amounts)
+        counts = np.bincount(codes, minlength=n)
+        amount_counts = np.bincount(codes[known], minlength=n)
+        sums = np.bincount(codes[known], weights=amounts[known], minlength=n)
+
+        # Médianes: montants connus triés par (groupe, montant), puis milieu de chaque tranche
+        sorted_amounts = amounts[known][np.lexsort((amounts[known], codes[known]))]
+        starts = np.concatenate(([0], np.cumsum(amount_counts)[:-1]))
+        present = amount_counts > 0
+        low = starts + np.maximum(amount_counts - 1, 0) // 2
+        high = starts + amount_counts // 2
+        medians = np.full(n, np.nan)
+        if present.any():
+            medians[present] = (sorted_amounts[low[present]] + sorted_amounts[high[present]]) / 2
+
+        # Décodage des codes de groupe en valeurs de chaque dimension
+        labels = []
+        remainder = groups
+        for uniques in reversed(values):
+            labels.append(uniques[remainder % len(uniques)])
+            remainder = remainder // len(uniques)
+        labels.reverse()
+        return [
+            (tuple(int(column[i]) for column in labels), counts[i], amount_counts[i], sums[i], medians[i])
+            for i in range(n)
+        ]
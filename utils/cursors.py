@@ -0,0 +1,142 @@
+"""Curseurs de résultats: suite d'une recherche servie depuis les items déjà téléchargés."""
+import asyncio
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Récupère la page amont `page` de `size` items: (page, size) -> réponse de l'API
+ChunkFetcher = Callable[[int, int], Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class Cursor:
+    """
+    Position dans les résultats d'une recherche et items téléchargés non encore servis.
+
+    Les pages amont sont alignées sur `chunk_size` items, comme celles de la
+    recherche d'origine: la suite réutilise les mêmes requêtes (et donc le
+    cache et le préchargement). Une page amont n'est téléchargée qu'une fois
+    par curseur; le tampon ne garde que les items non servis.
+    """
+    endpoint: str
+    query_params: Dict[str, Any]
+    offset: int
+    total: int
+    chunk_size: int
+    max_results: int = 10
+    compact: bool = False
+    fields: Optional[List[str]] = None
+    buffer: List[Dict[str, Any]] = field(default_factory=list)
+    buffer_start: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def exhausted(self) -> bool:
+        return self.offset >= self.total
+
+    def rewind(self, count: int) -> None:
+        """Recule de `count` items (items non affichés); ils seront redemandés."""
+        self.offset = max(0, self.offset - count)
+        self.buffer = []
+        self.buffer_start = self.offset
+
+    async def read(self, count: int, fetch: ChunkFetcher) -> List[Dict[str, Any]]:
+        """
+        Renvoie les `count` items suivants et avance le curseur.
+
+        Les pages amont manquantes sont demandées ensemble (`fetch` en limite
+        la concurrence).
+
+        Args:
+            count: Nombre d'items voulus
+            fetch: Récupération d'une page amont (page, taille)
+
+        Returns:
+            Items (moins de `count` en fin de résultats)
+        """
+        end = min(self.offset + count, self.total)
+        if end <= self.offset:
+            return []
+        buffered_end = self.buffer_start + len(self.buffer)
+        if self.buffer_start <= self.offset < buffered_end:
+            kept = self.buffer[self.offset - self.buffer_start:]
+            start = buffered_end
+        else:
+            kept = []
+            start = self.offset
+        if start < end:
+            first = start // self.chunk_size + 1
+            last = (end - 1) // self.chunk_size + 1
+            pages = await asyncio.gather(*(fetch(page, self.chunk_size) for page in range(first, last + 1)))
+            fetched = [item for data in pages for item in data.get("items") or []]
+            self.total = int(pages[0].get("total", self.total))
+            kept += fetched[start - (first - 1) * self.chunk_size:]
+
+        items = kept[:end - self.offset]
+        if len(items) < end - self.offset:
+            # L'API renvoie moins d'items qu'annoncé: fin des résultats
+            self.total = self.offset + len(items)
+        self.offset += len(items)
+        self.buffer = kept[len(items):]
+        self.buffer_start = self.offset
+        return items
+
+
+class CursorStore:
+    """
+    Curseurs en mémoire, identifiés par un jeton opaque.
+
+    Le nombre de curseurs est borné (les moins récemment utilisés sont
+    évincés) et chaque curseur expire `ttl` secondes après sa dernière
+    utilisation.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 1800.0):
+        """
+        Args:
+            max_entries: Nombre maximum de curseurs conservés
+            ttl: Durée de vie (secondes) d'un curseur inutilisé
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, cursor: Cursor) -> str:
+        """Enregistre un curseur et renvoie son identifiant."""
+        self._expire()
+        cursor_id = secrets.token_urlsafe(9)
+        self._entries[cursor_id] = (cursor, time.monotonic() + self.ttl)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return cursor_id
+
+    def get(self, cursor_id: str) -> Optional[Cursor]:
+        """Curseur `cursor_id` (None s'il est inconnu ou expiré); prolonge sa durée de vie."""
+        entry = self._entries.get(cursor_id)
+        if entry is None:
+            return None
+        cursor, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[cursor_id]
+            return None
+        self._entries[cursor_id] = (cursor, time.monotonic() + self.ttl)
+        self._entries.move_to_end(cursor_id)
+        return cursor
+
+    def discard(self, cursor_id: str) -> None:
+        self._entries.pop(cursor_id, None)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for cursor_id in [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]:
+            del self._entries[cursor_id]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "evictions": self.evictions}
@@ -0,0 +1,314 @@
+"""Cache de réponses persistant (SQLite, mode WAL) partagé entre processus."""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from . import json_codec
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCache:
+    """
+    Cache de réponses sur disque, interchangeable avec `ResponseCache`.
+
+    Plusieurs processus (sessions stdio, workers uvicorn) peuvent partager le
+    même fichier: SQLite en mode WAL autorise des lectures concurrentes avec
+    un écrivain à la fois. Les entrées expirées puis les moins récemment
+    utilisées sont évincées lorsque les bornes sont dépassées; le nombre et
+    la taille des entrées sont suivis en mémoire (resynchronisés depuis le
+    fichier à chaque éviction et tous les `RESYNC_EVERY` écritures, pour
+    tenir compte des autres processus) plutôt que recalculés à chaque
+    écriture. Les dates d'accès (ordre LRU) relevées par `get()` sont
+    écrites en une transaction toutes les `TOUCH_BATCH` lectures, ou à
+    l'écriture suivante, plutôt qu'à chaque lecture. Une erreur SQLite est traitée comme un défaut de
+    cache et ne fait jamais échouer la requête. Comme en mémoire, les
+    entrées expirées ayant des validateurs HTTP restent revalidables
+    jusqu'à leur éviction.
+
+    Les méthodes sont bloquantes (verrou SQLite jusqu'à `timeout`): le
+    client CFNEWS les appelle dans `executor`, un thread dédié, pour ne pas
+    bloquer la boucle d'événements.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL,
+            validators TEXT
+        );
+        CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+        CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires_at);
+    """
+
+    # Écritures entre deux recomptages des entrées du fichier
+    RESYNC_EVERY = 1000
+
+    # Lectures dont la date d'accès est accumulée avant d'être écrite en une transaction
+    TOUCH_BATCH = 64
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 10000,
+        max_bytes: int = 256 * 1024 * 1024,
+        timeout: float = 5.0
+    ):
+        """
+        Ouvre (ou crée) le cache.
+
+        Args:
+            path: Chemin du fichier SQLite
+            max_entries: Nombre maximum d'entrées conservées
+            max_bytes: Taille cumulée maximum des réponses (octets)
+            timeout: Attente maximum d'un verrou d'écriture (secondes)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # Thread unique des accès au fichier depuis le code asynchrone
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cfnews-sqlite")
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "validators" not in columns:
+            # Fichier créé par une version antérieure
+            self._conn.execute("ALTER TABLE responses ADD COLUMN validators TEXT")
+        # Nombre et taille des entrées, tenus à jour à chaque écriture
+        self._entries, self._bytes = self._totals()
+        self._writes = 0
+        # Dates d'accès des lectures, pas encore écrites: clé -> date
+        self._touched: Dict[str, float] = {}
+        self._reads = 0
+
+    def __len__(self) -> int:
+        try:
+            with self._lock:
+                return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        except sqlite3.Error as e:
+            self._error("len", e)
+            return 0
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT 1 FROM responses WHERE key = ? AND expires_at > ?", (key, time.time())
+                ).fetchone()
+        except sqlite3.Error as e:
+            self._error("contains", e)
+            return False
+        return row is not None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retourne la valeur en cache, ou None si absente ou expirée."""
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires_at > ?", (key, now)
+                ).fetchone()
+                if row is not None:
+                    self._touched[key] = now
+                    self._reads += 1
+                    if self._reads >= self.TOUCH_BATCH:
+                        self._flush_touches()
+        except sqlite3.Error as e:
+            self._error("get", e)
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json_codec.loads(row[0])
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        size: int = 0,
+        validators: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None
+    ) -> None:
+        """
+        Stocke une valeur.
+
+        Args:
+            key: Clé canonique de la requête
+            value: Réponse décodée (sérialisable en JSON)
+            ttl: Durée de vie en secondes (<= 0 désactive la mise en cache)
+            size: Taille du corps brut en octets (calculée si absente)
+            validators: Validateurs HTTP de la réponse ({"etag", "last_modified"})
+            body: Corps JSON brut de la réponse, stocké tel quel (sinon la
+                valeur est resérialisée)
+        """
+        if ttl <= 0:
+            return
+        encoded = body if body is not None else json_codec.dumps_bytes(value)
+        size = size or len(encoded)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                self._flush_touches()
+                old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, size, expires_at, accessed_at, validators) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, encoded, size, now + ttl, now, json_codec.dumps(validators) if validators else None)
+                )
+                self._entries += old is None
+                self._bytes += size - (old[0] if old is not None else 0)
+                self._writes += 1
+                if self._writes % self.RESYNC_EVERY == 0:
+                    self._entries, self._bytes = self._totals()
+                if self._entries > self.max_entries or self._bytes > self.max_bytes:
+                    self._evict(now)
+        except sqlite3.Error as e:
+            self._error("set", e)
+
+    def validators(self, key: str) -> Optional[Tuple[Dict[str, str], int]]:
+        """Validateurs HTTP et taille d'une entrée (expirée ou non), ou None."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT validators, size FROM responses WHERE key = ? AND validators IS NOT NULL", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            self._error("validators", e)
+            return None
+        if row is None:
+            return None
+        return json_codec.loads(row[0]), row[1]
+
+    def refresh(self, key: str, ttl: float) -> Optional[Any]:
+        """
+        Prolonge une entrée confirmée par l'API (réponse 304).
+
+        Returns:
+            Valeur de l'entrée, ou None si elle a été évincée entre-temps
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                self._touched.pop(key, None)
+                self._conn.execute(
+                    "UPDATE responses SET expires_at = ?, accessed_at = ? WHERE key = ?", (now + ttl, now, key)
+                )
+                row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            self._error("refresh", e)
+            return None
+        return json_codec.loads(row[0]) if row is not None else None
+
+    def clear(self) -> None:
+        """Vide le cache (pour tous les processus)."""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM responses")
+                self._entries, self._bytes = 0, 0
+                self._touched.clear()
+        except sqlite3.Error as e:
+            self._error("clear", e)
+
+    def close(self) -> None:
+        """Écrit les dates d'accès en attente et ferme la connexion SQLite."""
+        with self._lock:
+            try:
+                self._flush_touches()
+            except sqlite3.Error as e:
+                self._error("close", e)
+            self._conn.close()
+        self.executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Statistiques d'utilisation du cache (compteurs propres au processus).
+
+        Le nombre et la taille des entrées sont les totaux tenus en mémoire:
+        lue par la collecte des métriques, la méthode n'accède pas au fichier.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._entries,
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "path": self.path
+        }
+
+    def _totals(self) -> Tuple[int, int]:
+        """Nombre et taille cumulée des entrées du fichier."""
+        entries, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return entries, size
+
+    def _error(self, operation: str, error: sqlite3.Error) -> None:
+        """Compte et journalise une erreur SQLite (traitée comme un défaut de cache)."""
+        self.errors += 1
+        logger.warning("Cache SQLite %s (%s): %s", self.path, operation, error)
+
+    def _flush_touches(self) -> None:
+        """Écrit en une transaction les dates d'accès relevées par get()."""
+        if not self._touched:
+            return
+        touched, self._touched = self._touched, {}
+        self._reads = 0
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", [(at, key) for key, at in touched.items()]
+            )
+            self._conn.execute("COMMIT")
+        except sqlite3.Error:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, now: float) -> None:
+        """
+        Évince les entrées expirées puis les moins récemment utilisées.
+
+        Appelée quand les totaux tenus en mémoire dépassent les bornes; ils
+        sont recomptés depuis le fichier avant de choisir les entrées à évincer.
+        """
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            removed = self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,)).rowcount
+            entries, size = self._totals()
+            rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+            victims = []
+            for key, entry_size in rows:
+                if entries <= self.max_entries and size <= self.max_bytes:
+                    break
+                victims.append((key,))
+                entries -= 1
+                size -= entry_size
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+            self._conn.execute("COMMIT")
+        except sqlite3.Error:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._entries, self._bytes = entries, size
+        self.evictions += removed + len(victims)
@@ -0,0 +1,155 @@
+"""Entités déjà vues (opérations, sociétés, acteurs, personnes) indexées par (type, id)."""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from . import json_codec
+
+# Type d'entité exposé -> endpoint CFNEWS
+ENTITY_TYPES = {
+    "operation": "operation",
+    "company": "societe",
+    "actor": "acteur",
+    "person": "people",
+}
+
+# Entités partielles incluses dans les items d'un endpoint:
+# (champ, endpoint de l'entité, champs gardés ou None pour tous)
+EMBEDDED = {
+    "operation": (("target", "societe", None), ("investors", "acteur", ("id", "name"))),
+}
+
+
+def resolve_type(entity_type: str) -> Optional[str]:
+    """Endpoint d'un type d'entité (nom exposé ou nom d'endpoint; None si inconnu)."""
+    key = entity_type.strip().lower()
+    if key in ENTITY_TYPES:
+        return ENTITY_TYPES[key]
+    return key if key in ENTITY_TYPES.values() else None
+
+
+@dataclass(slots=True)
+class EntityRecord:
+    """
+    Entité en mémoire: l'item est gardé encodé en JSON (bien plus compact
+    qu'un dictionnaire Python) et décodé à la lecture.
+    """
+    endpoint: str
+    id: int
+    name: Optional[str]
+    payload: bytes
+    partial: bool
+    expires_at: float
+
+    def item(self) -> Dict[str, Any]:
+        return json_codec.loads(self.payload)
+
+
+class EntityStore:
+    """
+    Entités vues dans les réponses de l'API, bornées en nombre (éviction des
+    moins récemment utilisées) et expirées après `ttl` secondes.
+
+    Les entités incluses dans d'autres items (cible et investisseurs d'une
+    opération) sont gardées comme partielles: elles sont complétées par les
+    entités partielles suivantes et remplacées par l'entité complète, jamais
+    l'inverse.
+    """
+
+    def __init__(self, max_entries: int = 20000, ttl: float = 3600.0):
+        """
+        Args:
+            max_entries: Nombre maximum d'entités conservées
+            ttl: Durée de vie d'une entité (secondes)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, int], EntityRecord]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, endpoint: str, entity_id: int) -> Optional[EntityRecord]:
+        """Entité (endpoint, id), ou None si absente ou expirée."""
+        key = (endpoint, entity_id)
+        with self._lock:
+            record = self._entries.get(key)
+            if record is None or record.expires_at <= time.monotonic():
+                if record is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return record
+
+    def put(self, endpoint: str, item: Dict[str, Any], partial: bool = False) -> None:
+        """Enregistre un item (ignoré sans id entier)."""
+        entity_id = item.get("id")
+        if isinstance(entity_id, str) and entity_id.isdigit():
+            entity_id = int(entity_id)
+        if not isinstance(entity_id, int) or isinstance(entity_id, bool):
+            return
+        key = (endpoint, entity_id)
+        with self._lock:
+            existing = self._entries.get(key)
+            if partial and existing is not None and existing.expires_at > time.monotonic():
+                if not existing.partial:
+                    return
+                item = {**existing.item(), **item}
+            self._entries[key] = EntityRecord(
+                endpoint, entity_id, item.get("name"), json_codec.dumps_bytes(item),
+                partial, time.monotonic() + self.ttl
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def add_response(self, path: str, data: Any) -> None:
+        """
+        Enregistre les entités d'une réponse de l'API.
+
+        Args:
+            path: Chemin interrogé ("operation" pour une recherche,
+                "societe/123" pour une entité)
+            data: Réponse décodée
+        """
+        if not isinstance(data, dict):
+            return
+        parts = path.split("/")
+        endpoint = parts[0]
+        if endpoint not in ENTITY_TYPES.values():
+            return
+        if len(parts) == 1:
+            items: Iterable[Any] = data.get("items") or []
+        elif len(parts) == 2 and parts[1].isdigit():
+            items = data.get("items") or [data]
+        else:
+            return
+        embedded = EMBEDDED.get(endpoint, ())
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            self.put(endpoint, item)
+            for field, target, keys in embedded:
+                value = item.get(field)
+                for entity in value if isinstance(value, list) else [value]:
+                    if isinstance(entity, dict):
+                        if keys is not None:
+                            entity = {k: entity[k] for k in keys if k in entity}
+                        self.put(target, entity, partial=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,47 @@
+"""Encodage/décodage JSON: orjson s'il est installé, sinon la bibliothèque standard."""
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    orjson = None
+
+# CFNEWS_JSON_BACKEND=json force la bibliothèque standard
+if os.getenv("CFNEWS_JSON_BACKEND", "").lower() == "json":
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Décode du JSON (directement depuis les octets avec orjson)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Encode en JSON, caractères non ASCII conservés (ensure_ascii=False).
+
+    Args:
+        obj: Objet à encoder
+        indent: Indentation de 2 espaces; sinon sortie compacte sans espaces
+    """
+    return dumps_bytes(obj, indent).decode("utf-8")
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Encode en JSON UTF-8 (voir dumps)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # Types non gérés par orjson (ex: entiers > 64 bits)
+            pass
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,200 @@
+"""Métriques Prometheus (format d'exposition texte), sans dépendance externe."""
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# Bornes des histogrammes de durée (secondes) et de taille (octets)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base des métriques: nom, aide et étiquettes."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Compteur croissant."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return self.header() + [
+            f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}" for labels, value in values
+        ]
+
+
+class Gauge(Counter):
+    """Valeur instantanée (ex: requêtes en vol)."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Distribution d'observations par seaux cumulés."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Par étiquettes: [comptes par seau (non cumulés, +Inf en dernier), somme]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def count(self, *labels: str) -> int:
+        state = self._values.get(labels)
+        return sum(state[0]) if state else 0
+
+    def sum(self, *labels: str) -> float:
+        state = self._values.get(labels)
+        return state[1] if state else 0.0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = [(labels, list(counts), total) for labels, (counts, total) in self._values.items()]
+        lines = self.header()
+        for labels, counts, total in values:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """
+    Ensemble de métriques exposées ensemble.
+
+    Les collecteurs sont des fonctions appelées uniquement au moment de la
+    collecte (ex: lecture des statistiques du cache): rien n'est calculé tant
+    que personne ne lit /metrics.
+    """
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Exposition au format texte Prometheus (version 0.0.4)."""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+def gauge_lines(name: str, documentation: str, value: Optional[float], kind: str = "gauge") -> List[str]:
+    """Lignes d'exposition d'une valeur lue au moment de la collecte (None: omise)."""
+    if value is None:
+        return []
+    return [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}", f"{name} {_number(value)}"]
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REGISTRY = Registry()
+
+TOOL_CALLS = REGISTRY.register(Counter(
+    "cfnews_tool_calls_total", "Appels d'outils MCP par outil et résultat", ("tool", "outcome")
+))
+TOOL_LATENCY = REGISTRY.register(Histogram(
+    "cfnews_tool_duration_seconds", "Durée des appels d'outils MCP", ("tool",)
+))
+TOOL_RESPONSE_BYTES = REGISTRY.register(Histogram(
+    "cfnews_tool_response_bytes", "Taille des réponses d'outils MCP (octets)", ("tool",), SIZE_BUCKETS
+))
+UPSTREAM_LATENCY = REGISTRY.register(Histogram(
+    "cfnews_upstream_request_duration_seconds", "Durée des requêtes à l'API CFNEWS",
+    ("endpoint", "status")
+))
+UPSTREAM_RESPONSE_BYTES = REGISTRY.register(Histogram(
+    "cfnews_upstream_response_bytes", "Taille des réponses de l'API CFNEWS", ("endpoint",), SIZE_BUCKETS
+))
+UPSTREAM_INFLIGHT = REGISTRY.register(Gauge(
+    "cfnews_upstream_inflight_requests", "Requêtes en cours vers l'API CFNEWS"
+))
+UPSTREAM_ERRORS = REGISTRY.register(Counter(
+    "cfnews_upstream_errors_total", "Erreurs de l'API CFNEWS par classe d'exception", ("error",)
+))
+UPSTREAM_BYTES_SAVED = REGISTRY.register(Counter(
+    "cfnews_upstream_bytes_saved_total", "Octets non retéléchargés grâce aux réponses 304", ("endpoint",)
+))
+
+
+def endpoint_label(path: str) -> str:
+    """Étiquette d'endpoint sans identifiants (ex: acteur/portfolio_now/1625 -> acteur/portfolio_now)."""
+    return "/".join(part for part in path.split("/") if not part.isdigit())
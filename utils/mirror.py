@@ -0,0 +1,501 @@
+"""Miroir local (SQLite) des opérations et actualités, synchronisé par filigrane."""
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
+
+from . import json_codec
+
+if TYPE_CHECKING:
+    from .cfnews_client import CFNewsClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MirrorSpec:
+    """
+    Description d'un endpoint répliqué.
+
+    Attributes:
+        endpoint: Endpoint CFNEWS
+        date_field: Champ date des items (filigrane)
+        date_format: Format de ce champ
+        since_param: Filtre amont de date de début
+        until_param: Filtre amont de date de fin
+        param_format: Format des dates de ces filtres
+        filters: Filtres évaluables localement: paramètre -> (chemin JSON, opérateur)
+        sort_attribute: Seul tri servi localement, code de tri par date de
+            MAPPINGS.md aussi envoyé par la synchronisation (None: aucun tri
+            documenté, l'ordre par défaut de l'API est vérifié)
+    """
+    endpoint: str
+    date_field: str
+    date_format: str
+    since_param: str
+    until_param: str
+    param_format: str
+    filters: Dict[str, Any] = field(default_factory=dict)
+    sort_attribute: Optional[str] = None
+
+
+class MirrorSyncError(Exception):
+    """Synchronisation interrompue: les items ne sont pas lus par date décroissante."""
+    pass
+
+
+# Les ids `type_id` / `sector_id` / `region_id` sont ceux des items de
+# l'API simulée (utils/mock_api.py), non confirmés sur l'API réelle: si un
+# champ y est absent, covers() le détecte et ces filtres sont renvoyés à
+# l'API (chemin réel tant que le format des items n'est pas vérifié).
+MIRROR_SPECS: Dict[str, MirrorSpec] = {
+    "operation": MirrorSpec(
+        "operation", "date", "%d/%m/%Y", "depuis", "jusquau", "%d/%m/%Y",
+        filters={
+            "op_nom": ("$.name", "contains"),
+            "op_type": ("$.type_id", "in"),
+            "sector": ("$.sector_id", "in"),
+            "region": ("$.region_id", "in"),
+            "Montantmin": ("$.amount", ">="),
+            "Montantmax": ("$.amount", "<="),
+        },
+        sort_attribute="fiche_operation_operation_date_value_dt"
+    ),
+    "actualite": MirrorSpec(
+        "actualite", "date", "%Y-%m-%d", "date_start", "date_end", "%Y-%m-%d",
+        filters={
+            "title": ("$.title", "contains"),
+            "theme": ("$.themes", "any"),
+        },
+        # Aucun code de tri des actualités n'est documenté: l'ordre par
+        # défaut de l'API (plus récentes d'abord) est vérifié page à page
+    ),
+}
+
+
+def parse_date(value: Any, fmt: str) -> Optional[date]:
+    """Lit une date (les heures éventuelles d'un format ISO sont ignorées)."""
+    if not isinstance(value, str) or not value:
+        return None
+    if fmt == "%Y-%m-%d":
+        value = value[:10]
+    try:
+        return datetime.strptime(value, fmt).date()
+    except ValueError:
+        return None
+
+
+class Mirror:
+    """
+    Réplique locale des items de certains endpoints, interrogeable en SQL.
+
+    Chaque item est stocké tel que renvoyé par l'API avec sa date au format
+    ISO (indexée). Le filigrane d'un endpoint est la date la plus récente vue
+    lors de la dernière synchronisation complète; `since` est la date à partir
+    de laquelle le miroir est exhaustif.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS records (
+            endpoint TEXT NOT NULL,
+            id TEXT NOT NULL,
+            date_key TEXT NOT NULL,
+            data TEXT NOT NULL,
+            synced_at REAL NOT NULL,
+            PRIMARY KEY (endpoint, id)
+        );
+        CREATE INDEX IF NOT EXISTS records_date ON records (endpoint, date_key);
+        CREATE TABLE IF NOT EXISTS watermarks (
+            endpoint TEXT PRIMARY KEY,
+            since TEXT NOT NULL,
+            watermark TEXT NOT NULL,
+            synced_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        """
+        Ouvre (ou crée) le miroir.
+
+        Args:
+            path: Chemin du fichier SQLite
+            timeout: Attente maximum d'un verrou d'écriture (secondes)
+        """
+        self.path = path
+        self.hits = 0
+        self.fallbacks = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # (endpoint, chemin JSON) -> champ renseigné sur tous les items répliqués
+        self._covered: Dict[tuple, bool] = {}
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def upsert(self, endpoint: str, items: List[Dict[str, Any]]) -> List[str]:
+        """
+        Insère ou met à jour des items (les items sans id ni date sont ignorés).
+
+        Returns:
+            Dates ISO des items enregistrés
+        """
+        spec = MIRROR_SPECS[endpoint]
+        now = time.time()
+        rows = []
+        for item in items:
+            day = parse_date(item.get(spec.date_field), spec.date_format)
+            if day is None or item.get("id") is None:
+                continue
+            rows.append((endpoint, str(item["id"]), day.isoformat(), json_codec.dumps(item), now))
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO records (endpoint, id, date_key, data, synced_at) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._covered = {key: covered for key, covered in self._covered.items() if key[0] != endpoint}
+        return [row[2] for row in rows]
+
+    def state(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Filigrane d'un endpoint ({"since", "watermark", "synced_at"}), ou None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT since, watermark, synced_at FROM watermarks WHERE endpoint = ?", (endpoint,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"since": row[0], "watermark": row[1], "synced_at": row[2]}
+
+    def commit(self, endpoint: str, since: str, watermark: str) -> None:
+        """Enregistre le filigrane d'une synchronisation complète."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watermarks (endpoint, since, watermark, synced_at) VALUES (?, ?, ?, ?)",
+                (endpoint, since, watermark, time.time())
+            )
+
+    def covers(self, endpoint: str, path: str) -> bool:
+        """
+        Indique si le champ `path` est renseigné sur tous les items répliqués.
+
+        Un filtre local sur un champ absent (ou nul) d'une partie des items
+        les exclurait à tort, alors que l'API les filtre sur ses propres
+        données: la recherche est alors renvoyée à l'API.
+        """
+        key = (endpoint, path)
+        with self._lock:
+            if key not in self._covered:
+                self._covered[key] = not self._conn.execute(
+                    "SELECT EXISTS (SELECT 1 FROM records WHERE endpoint = ? AND json_extract(data, ?) IS NULL)",
+                    (endpoint, path)
+                ).fetchone()[0]
+            return self._covered[key]
+
+    def is_fresh(self, endpoint: str, max_age: float) -> bool:
+        """Indique si la dernière synchronisation complète date de moins de `max_age` secondes."""
+        state = self.state(endpoint)
+        return state is not None and time.time() - state["synced_at"] <= max_age
+
+    def search(
+        self,
+        endpoint: str,
+        query_params: Optional[Dict[str, Any]],
+        page: int = 1,
+        page_size: int = 10
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Répond localement à une recherche, si le miroir le permet.
+
+        La recherche doit porter sur une période couverte par le miroir (date de
+        début postérieure à `since`) et n'utiliser que des filtres évaluables
+        localement, sur des champs renseignés sur tous les items répliqués;
+        sinon None est renvoyé et l'appelant interroge l'API.
+
+        Args:
+            endpoint: Endpoint interrogé
+            query_params: Paramètres de recherche (tels qu'envoyés à l'API)
+            page: Numéro de page (pages de `page_size` items)
+            page_size: Taille de page
+
+        Returns:
+            Réponse au format de l'API (count, total, page, nb_pages, items) ou None
+        """
+        spec = MIRROR_SPECS.get(endpoint)
+        state = self.state(endpoint) if spec else None
+        query = self._build_query(spec, state, query_params or {}) if state else None
+        if query is None or not all(self.covers(endpoint, path) for path in query[3]):
+            self.fallbacks += 1
+            return None
+        where, args, order, _ = query
+
+        page = max(1, page)
+        page_size = max(1, page_size)
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM records WHERE {where}", args).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT data FROM records WHERE {where} ORDER BY date_key {order}, id {order} LIMIT ? OFFSET ?",
+                [*args, page_size, (page - 1) * page_size]
+            ).fetchall()
+        self.hits += 1
+        items = [json_codec.loads(row[0]) for row in rows]
+        return {
+            "count": len(items),
+            "total": total,
+            "page": page,
+            "nb_pages": max(1, -(-total // page_size)),
+            "items": items
+        }
+
+    def _build_query(
+        self,
+        spec: MirrorSpec,
+        state: Dict[str, Any],
+        query_params: Dict[str, Any]
+    ) -> Optional[tuple]:
+        """
+        Traduit les paramètres de recherche en clause SQL.
+
+        Returns:
+            (clause, arguments, ordre, chemins JSON filtrés), ou None si impossible
+        """
+        since = parse_date(query_params.get(spec.since_param), spec.param_format)
+        if since is None or since.isoformat() < state["since"]:
+            return None
+        where = ["endpoint = ?", "date_key >= ?"]
+        args: List[Any] = [spec.endpoint, since.isoformat()]
+        order = "DESC"
+        paths: Set[str] = set()
+
+        for key, value in query_params.items():
+            if key == spec.since_param:
+                continue
+            if key == spec.until_param:
+                until = parse_date(value, spec.param_format)
+                if until is None:
+                    return None
+                where.append("date_key <= ?")
+                args.append(until.isoformat())
+            elif key == "sort_attribute":
+                if value != spec.sort_attribute:
+                    return None
+            elif key == "sort_type":
+                if value not in ("ascending", "descending"):
+                    return None
+                order = "ASC" if value == "ascending" else "DESC"
+            elif key in spec.filters:
+                path, operator = spec.filters[key]
+                paths.add(path)
+                values = value if isinstance(value, list) else [value]
+                placeholders = ", ".join("?" * len(values))
+                if operator == "contains":
+                    where.append(f"json_extract(data, '{path}') LIKE ?")
+                    args.append(f"%{value}%")
+                elif operator == "in":
+                    where.append(f"json_extract(data, '{path}') IN ({placeholders})")
+                    args.extend(values)
+                elif operator == "any":
+                    where.append(f"EXISTS (SELECT 1 FROM json_each(data, '{path}') WHERE value IN ({placeholders}))")
+                    args.extend(values)
+                else:
+                    where.append(f"json_extract(data, '{path}') {operator} ?")
+                    args.append(value)
+            else:
+                return None
+        return " AND ".join(where), args, order, paths
+
+    def stats(self) -> Dict[str, Any]:
+        """Nombre d'items et filigrane par endpoint, requêtes servies localement."""
+        with self._lock:
+            counts = dict(self._conn.execute(
+                "SELECT endpoint, COUNT(*) FROM records GROUP BY endpoint"
+            ).fetchall())
+        endpoints = {}
+        for endpoint in MIRROR_SPECS:
+            state = self.state(endpoint)
+            endpoints[endpoint] = {"records": counts.get(endpoint, 0), **(state or {})}
+        return {"endpoints": endpoints, "hits": self.hits, "fallbacks": self.fallbacks, "path": self.path}
+
+    def close(self) -> None:
+        """Ferme la connexion SQLite."""
+        with self._lock:
+            self._conn.close()
+
+
+class MirrorSync:
+    """
+    Synchronisation incrémentale du miroir.
+
+    Chaque passe relit les items depuis le filigrane moins `overlap_days`
+    (l'API n'offre pas de filtre « modifié depuis »: la fenêtre de
+    recouvrement rattrape les corrections récentes et les items publiés avec
+    une date antérieure). Les items sont lus par date décroissante: un
+    item publié pendant la passe s'insère en tête et décale les pages
+    suivantes, ce qui produit des doublons (absorbés par l'upsert) mais
+    aucun trou; la tête est relue en fin de passe pour le récupérer. L'ordre
+    est vérifié page à page (il n'est pas garanti pour les actualités, faute
+    de tri documenté): un item plus récent que ceux des pages précédentes
+    interrompt la passe par une MirrorSyncError, sans avancer le filigrane. Si le
+    total diminue pendant la passe (suppressions, qui peuvent faire sauter des
+    items), le filigrane n'est pas avancé et la passe suivante recommence
+    depuis le même point.
+    """
+
+    def __init__(
+        self,
+        client: "CFNewsClient",
+        mirror: Mirror,
+        since: date,
+        overlap_days: int = 7,
+        interval: float = 900,
+        endpoints: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            client: Client API
+            mirror: Miroir à alimenter
+            since: Date à partir de laquelle répliquer (première synchronisation)
+            overlap_days: Jours relus avant le filigrane à chaque passe
+            interval: Délai entre deux passes (secondes)
+            endpoints: Endpoints répliqués (défaut: tous ceux de MIRROR_SPECS)
+        """
+        self.client = client
+        self.mirror = mirror
+        self.since = since
+        self.overlap_days = overlap_days
+        self.interval = interval
+        self.endpoints = endpoints or list(MIRROR_SPECS)
+
+    async def _fetch(self, endpoint: str, page: int, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Lit une page de taille maximale, par date décroissante.
+
+        La lecture contourne le cache de réponses: une page relue (la tête en
+        fin de passe) doit refléter les publications intervenues depuis, et
+        les pages de synchronisation ne doivent évincer ni le cache ni le
+        registre d'entités.
+        """
+        spec = MIRROR_SPECS[endpoint]
+        params = dict(filters)
+        if spec.sort_attribute:
+            params.update({"sort_attribute": spec.sort_attribute, "sort_type": "descending"})
+        return await self.client.search(
+            endpoint, page, params, limit=self.client.MAX_LIMIT, fresh=True, store=False
+        )
+
+    async def sync(self, endpoint: str) -> Dict[str, Any]:
+        """
+        Effectue une passe de synchronisation d'un endpoint.
+
+        Returns:
+            Bilan de la passe (pages, items, filigrane, complete)
+        
+        Raises:
+            MirrorSyncError: Les items ne sont pas lus par date décroissante
+        """
+        spec = MIRROR_SPECS[endpoint]
+        state = self.mirror.state(endpoint)
+        since = self.since.isoformat()
+        start = self.since
+        watermark = since
+        if state is not None:
+            since = min(state["since"], since)
+            watermark = state["watermark"]
+            start = max(date.fromisoformat(watermark) - timedelta(days=self.overlap_days),
+                        date.fromisoformat(since))
+        filters = {spec.since_param: start.strftime(spec.param_format)}
+
+        seen: Set[str] = set()
+        pages = 0
+        first_total: Optional[int] = None
+        total = 0
+        oldest: Optional[date] = None
+        page = 1
+        while True:
+            data = await self._fetch(endpoint, page, filters)
+            pages += 1
+            items = data.get("items") or []
+            # Items déjà lus, décalés par une publication: hors vérification
+            oldest = self._check_order(
+                endpoint, [item for item in items if isinstance(item, dict) and str(item.get("id")) not in seen], oldest
+            )
+            total = data.get("total", 0)
+            if first_total is None:
+                first_total = total
+            for day in self.mirror.upsert(endpoint, items):
+                watermark = max(watermark, day)
+            seen.update(str(item.get("id")) for item in items if isinstance(item, dict))
+            if not items or page >= data.get("nb_pages", 1):
+                break
+            page += 1
+
+        # Items publiés pendant la passe: relire la tête jusqu'à une page connue
+        page = 1
+        while total > (first_total or 0) and pages < 1000:
+            data = await self._fetch(endpoint, page, filters)
+            pages += 1
+            items = data.get("items") or []
+            fresh = [item for item in items if isinstance(item, dict) and str(item.get("id")) not in seen]
+            for day in self.mirror.upsert(endpoint, fresh):
+                watermark = max(watermark, day)
+            seen.update(str(item.get("id")) for item in fresh)
+            if not fresh or page >= data.get("nb_pages", 1):
+                break
+            page += 1
+
+        complete = total >= (first_total or 0)
+        if complete:
+            self.mirror.commit(endpoint, since, watermark)
+        else:
+            logger.warning("Synchronisation %s incomplète (total %s -> %s), filigrane conservé",
+                           endpoint, first_total, total)
+        return {"endpoint": endpoint, "pages": pages, "items": len(seen), "watermark": watermark, "complete": complete}
+
+    def _check_order(self, endpoint: str, items: List[Dict[str, Any]], oldest: Optional[date]) -> Optional[date]:
+        """
+        Vérifie qu'une page poursuit l'ordre par date décroissante.
+
+        Args:
+            endpoint: Endpoint synchronisé
+            items: Items de la page encore jamais lus pendant la passe
+            oldest: Date la plus ancienne des pages précédentes
+
+        Returns:
+            Date la plus ancienne lue jusqu'ici
+
+        Raises:
+            MirrorSyncError: Un item est plus récent que le précédent
+        """
+        spec = MIRROR_SPECS[endpoint]
+        for item in items:
+            day = parse_date(item.get(spec.date_field), spec.date_format)
+            if day is None:
+                continue
+            if oldest is not None and day > oldest:
+                raise MirrorSyncError(
+                    f"Synchronisation {endpoint}: item {item.get('id')} du {day.isoformat()} après un item "
+                    f"du {oldest.isoformat()}; l'API ne renvoie pas les items par date décroissante"
+                )
+            oldest = day
+        return oldest
+
+    async def sync_all(self) -> List[Dict[str, Any]]:
+        """Synchronise tous les endpoints répliqués."""
+        return [await self.sync(endpoint) for endpoint in self.endpoints]
+
+    async def run(self) -> None:
+        """Boucle de synchronisation périodique (les erreurs sont journalisées)."""
+        while True:
+            for endpoint in self.endpoints:
+                try:
+                    await self.sync(endpoint)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning("Synchronisation %s échouée: %s", endpoint, e)
+            await asyncio.sleep(self.interval)
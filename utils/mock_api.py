@@ -0,0 +1,318 @@
+"""Faux serveur de l'API CFNEWS pour les tests et benchmarks hors ligne."""
+import asyncio
+import hashlib
+import json
+import math
+import random
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+
+SECTORS = [
+    (124, "Biotechnologies"),
+    (297, "Logiciel et services informatiques"),
+    (300, "Produits & Services industriels"),
+    (302, "Santé, beauté et services associés"),
+    (304, "Services & Conseil aux entreprises"),
+    (305, "Services Financiers"),
+]
+REGIONS = [
+    (132336, "Île-de-France"),
+    (132360, "Auvergne-Rhône-Alpes"),
+    (132354, "Occitanie"),
+    (132335, "Nouvelle-Aquitaine"),
+]
+OP_TYPES = [
+    (271, "LBO"),
+    (272, "M&A Corporate"),
+    (273, "Capital Développement"),
+    (274, "Capital Innovation"),
+]
+FUNDS = ["Ardian", "Eurazeo", "Tikehau", "Bpifrance", "Andera", "Keensight", "Naxicap", "Siparex"]
+WORDS = (
+    "capital investissement opération cession rachat fonds levée croissance "
+    "industriel majoritaire minoritaire management dette unitranche valorisation"
+).split()
+
+
+class MockCFNewsAPI:
+    """
+    Simule api.cfnews.net via un `httpx.MockTransport`.
+
+    Sert tous les endpoints utilisés par `CFNewsClient` avec des données
+    synthétiques déterministes (même graine, mêmes items), en respectant
+    `page` et `limit`. Les réponses portent un ETag et un Last-Modified, et
+    les requêtes conditionnelles correspondantes reçoivent un 304. La
+    latence, la gigue et le taux d'erreur sont configurables pour les
+    benchmarks.
+    """
+
+    ENDPOINTS = ("operation", "vehicule", "acteur", "societe", "people", "mouvement", "actualite")
+    LAST_MODIFIED = "Wed, 01 Oct 2025 00:00:00 GMT"
+
+    def __init__(
+        self,
+        total_items: int = 250,
+        page_size: int = 10,
+        text_size: int = 200,
+        portfolio_size: int = 40,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        validators: bool = True
+    ):
+        """
+        Initialise le faux serveur.
+
+        Args:
+            total_items: Nombre total de résultats par recherche
+            page_size: Taille de page par défaut (sans `limit`)
+            text_size: Longueur approximative des champs texte longs (caractères)
+            portfolio_size: Nombre de participations par portefeuille
+            latency: Latence injectée par requête (secondes)
+            jitter: Gigue maximum ajoutée à la latence (secondes)
+            error_rate: Probabilité de répondre 503 (0 à 1)
+            seed: Graine des données et des tirages aléatoires
+            validators: Envoie ETag / Last-Modified et répond 304 aux requêtes
+                conditionnelles (sinon les ignore, comme une API sans validateurs)
+        """
+        self.total_items = total_items
+        self.page_size = page_size
+        self.text_size = text_size
+        self.portfolio_size = portfolio_size
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.seed = seed
+        self.validators = validators
+        self._random = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self.not_modified = 0
+        # Items publiés après coup, en tête des résultats (index négatifs)
+        self.published: Dict[str, int] = {}
+        self._builders: Dict[str, Callable[[random.Random, int], Dict[str, Any]]] = {
+            "operation": self._operation,
+            "vehicule": self._vehicule,
+            "acteur": self._acteur,
+            "societe": self._societe,
+            "people": self._people,
+            "mouvement": self._mouvement,
+            "actualite": self._actualite,
+        }
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport httpx à passer à `CFNewsClient(transport=...)`."""
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Traite une requête HTTP simulée."""
+        self.requests += 1
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.errors += 1
+            return httpx.Response(503, text="Service temporairement indisponible")
+
+        parts = [p for p in urlparse(str(request.url)).path.split("/") if p]
+        # /v1/<endpoint> ou /v1/acteur/portfolio_now|portfolio_sortie/<id>
+        parts = parts[1:] if parts and parts[0] == "v1" else parts
+        if len(parts) == 3 and parts[0] == "acteur" and parts[1] in ("portfolio_now", "portfolio_sortie"):
+            return self._json(request, self.portfolio(int(parts[2]), exits=parts[1] == "portfolio_sortie"))
+        if len(parts) == 1 and parts[0] in self._builders:
+            query = parse_qs(request.url.query.decode())
+            page = int(query.get("page", ["1"])[0])
+            limit = int(query.get("limit", [self.page_size])[0])
+            return self._json(request, self.page(parts[0], page, limit))
+        return httpx.Response(404, text=f"Endpoint inconnu: {request.url.path}")
+
+    def publish(self, endpoint: str, count: int = 1) -> None:
+        """
+        Publie `count` nouveaux items en tête des résultats d'un endpoint
+        (plus récents que les autres; leurs ids précèdent la base de l'endpoint).
+        """
+        self.published[endpoint] = self.published.get(endpoint, 0) + count
+
+    def page(self, endpoint: str, page: int, limit: int) -> Dict[str, Any]:
+        """Construit une page de résultats."""
+        published = self.published.get(endpoint, 0)
+        total = self.total_items + published
+        start = (page - 1) * limit
+        stop = min(start + limit, total)
+        items = [self.item(endpoint, index - published) for index in range(start, stop)]
+        return {
+            "count": len(items),
+            "total": total,
+            "page": page,
+            "nb_pages": max(1, math.ceil(total / limit)),
+            "items": items
+        }
+
+    def item(self, endpoint: str, index: int) -> Dict[str, Any]:
+        """Construit l'item `index` d'un endpoint (déterministe)."""
+        rng = random.Random(f"{self.seed}:{endpoint}:{index}")
+        return self._builders[endpoint](rng, index)
+
+    def portfolio(self, actor_id: int, exits: bool = False) -> Dict[str, Any]:
+        """Construit le portefeuille (actuel ou sorties) d'un acteur."""
+        rng = random.Random(f"{self.seed}:portfolio:{actor_id}:{exits}")
+        items = []
+        for _ in range(self.portfolio_size):
+            company_id = rng.randint(1, self.total_items * 4)
+            sector_id, sector = rng.choice(SECTORS)
+            entry = self._date(rng)
+            line = {
+                "id": company_id,
+                "name": self._name(rng),
+                "sector": sector,
+                "sector_id": sector_id,
+                "entry_date": entry.strftime("%d/%m/%Y"),
+                "operation_type": rng.choice(OP_TYPES)[1],
+            }
+            if exits:
+                line["exit_date"] = (entry + timedelta(days=rng.randint(365, 2500))).strftime("%d/%m/%Y")
+            items.append(line)
+        return {"actor_id": actor_id, "count": len(items), "total": len(items), "items": items}
+
+    def _json(self, request: httpx.Request, payload: Dict[str, Any]) -> httpx.Response:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        if not self.validators:
+            return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        headers = {"ETag": etag, "Last-Modified": self.LAST_MODIFIED}
+        if request.headers.get("If-None-Match") == etag or (
+            "If-None-Match" not in request.headers
+            and request.headers.get("If-Modified-Since") == self.LAST_MODIFIED
+        ):
+            self.not_modified += 1
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, content=body, headers={**headers, "Content-Type": "application/json"})
+
+    def _text(self, rng: random.Random) -> str:
+        words: List[str] = []
+        length = 0
+        while length < self.text_size:
+            word = rng.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+        return " ".join(words)
+
+    @staticmethod
+    def _name(rng: random.Random) -> str:
+        syllables = ["ka", "lo", "vi", "ta", "ne", "mo", "ri", "sa", "do", "xe"]
+        return "".join(rng.choice(syllables) for _ in range(3)).capitalize()
+
+    @staticmethod
+    def _date(rng: random.Random) -> date:
+        return date(2015, 1, 1) + timedelta(days=rng.randint(0, 3800))
+
+    def _operation(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        type_id, type_name = rng.choice(OP_TYPES)
+        sector_id, sector = rng.choice(SECTORS)
+        region_id, region = rng.choice(REGIONS)
+        target = self._name(rng)
+        return {
+            "id": 100000 + index,
+            "name": f"{type_name} sur {target}",
+            "date": (date(2025, 10, 1) - timedelta(days=index)).strftime("%d/%m/%Y"),
+            "type": type_name,
+            "type_id": type_id,
+            "amount": round(rng.uniform(1, 800), 1) if rng.random() > 0.2 else None,
+            "target": {"id": 500000 + index, "name": target, "sector": sector, "region": region},
+            "sector": sector,
+            "sector_id": sector_id,
+            "region": region,
+            "region_id": region_id,
+            "investors": [
+                {"id": 2000 + rng.randint(0, 50), "name": rng.choice(FUNDS), "lead": i == 0}
+                for i in range(rng.randint(1, 4))
+            ],
+            "advisors": [self._name(rng) for _ in range(rng.randint(0, 5))],
+            "description": self._text(rng),
+        }
+
+    def _vehicule(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        return {
+            "id": 300000 + index,
+            "name": f"{rng.choice(FUNDS)} Fund {rng.randint(1, 9)}",
+            "management_company": rng.choice(FUNDS),
+            "type": rng.choice(["FCPR", "FPCI", "SCR", "SLP"]),
+            "segment": rng.choice(["LBO", "Capital développement", "Capital innovation / VC", "Dette"]),
+            "status": rng.choice(["Closé", "En cours de levée", "1er closing"]),
+            "amount_raised": round(rng.uniform(10, 3000), 1),
+            "vintage": rng.randint(2010, 2025),
+            "description": self._text(rng),
+        }
+
+    def _acteur(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        region_id, region = rng.choice(REGIONS)
+        return {
+            "id": 2000 + index,
+            "name": f"{rng.choice(FUNDS)} {self._name(rng)}",
+            "domain": rng.choice(["Fonds d'investissement", "Avocats", "Banquiers", "Conseils"]),
+            "nationality": rng.choice(["FR", "GB", "US", "DE"]),
+            "region": region,
+            "region_id": region_id,
+            "is_tech": rng.random() < 0.3,
+            "nb_deals": rng.randint(0, 400),
+            "description": self._text(rng),
+        }
+
+    def _societe(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        sector_id, sector = rng.choice(SECTORS)
+        region_id, region = rng.choice(REGIONS)
+        return {
+            "id": 500000 + index,
+            "name": self._name(rng),
+            "activity": rng.choice(["Familiale", "Sté sous LBO", "Cotée", "Indépendante"]),
+            "sector": sector,
+            "sector_id": sector_id,
+            "region": region,
+            "region_id": region_id,
+            "revenue": round(rng.uniform(0.5, 2000), 1),
+            "is_tech": rng.random() < 0.3,
+            "nb_deals": rng.randint(0, 30),
+            "description": self._text(rng),
+        }
+
+    def _people(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        first, last = self._name(rng), self._name(rng).upper()
+        return {
+            "id": 700000 + index,
+            "name": f"{first} {last}",
+            "first_name": first,
+            "last_name": last,
+            "title": rng.choice(["Directeur général", "Associé(e)", "Partner", "Directeur"]),
+            "organization": rng.choice(FUNDS),
+            "organization_type": rng.choice(["Fonds", "Avocats", "Banquiers", "Conseils"]),
+            "region": rng.choice(REGIONS)[1],
+            "email": f"{first.lower()}.{last.lower()}@example.com" if rng.random() < 0.5 else None,
+        }
+
+    def _mouvement(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        return {
+            "id": 800000 + index,
+            "date": self._date(rng).strftime("%d/%m/%Y"),
+            "person": f"{self._name(rng)} {self._name(rng).upper()}",
+            "from_organization": rng.choice(FUNDS),
+            "to_organization": rng.choice(FUNDS),
+            "title": rng.choice(["Directeur général", "Associé(e)", "Partner"]),
+        }
+
+    def _actualite(self, rng: random.Random, index: int) -> Dict[str, Any]:
+        published = date(2025, 10, 1) - timedelta(days=index // 3)
+        return {
+            "id": 900000 + index,
+            "title": f"{rng.choice(FUNDS)} {rng.choice(['reprend', 'cède', 'soutient', 'refinance'])} {self._name(rng)}",
+            "date": published.isoformat(),
+            "themes": rng.sample(["LBO", "Levée de Fonds", "M&A", "Capital Innovation"], 2),
+            "keywords": rng.sample(WORDS, 3),
+            "summary": self._text(rng)[:200],
+            "content": self._text(rng) * 4,
+            "url": f"https://www.cfnews.net/article/{900000 + index}",
+        }
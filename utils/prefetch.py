@@ -0,0 +1,89 @@
+"""Préchargement spéculatif des pages suivantes d'une recherche."""
+import time
+from collections import OrderedDict
+from typing import Any, Dict
+
+
+class Prefetcher:
+    """
+    Budget et statistiques du préchargement des pages N+1..N+depth.
+
+    Le nombre de préchargements simultanés est plafonné: au-delà, la page
+    n'est pas préchargée plutôt que d'attendre, pour que le préchargement ne
+    retarde jamais une requête réelle. Une clé préchargée compte comme un
+    succès si une requête réelle la demande dans les `window` secondes.
+    """
+
+    def __init__(self, depth: int = 1, max_inflight: int = 4, window: float = 300.0):
+        """
+        Args:
+            depth: Nombre de pages préchargées après la page demandée
+            max_inflight: Préchargements simultanés au plus (tous endpoints)
+            window: Délai (secondes) pendant lequel une page préchargée peut être utilisée
+        """
+        self.depth = depth
+        self.max_inflight = max_inflight
+        self.window = window
+        self.inflight = 0
+        # Clés préchargées non encore demandées -> échéance
+        self._pending: "OrderedDict[str, float]" = OrderedDict()
+        self.issued = 0
+        self.skipped = 0
+        self.failed = 0
+        self.hits = 0
+        self.expired = 0
+
+    def acquire(self, key: str) -> bool:
+        """Réserve une place pour précharger `key` (False si le budget est épuisé)."""
+        self._expire()
+        if self.inflight >= self.max_inflight:
+            self.skipped += 1
+            return False
+        self.inflight += 1
+        self.issued += 1
+        self._pending[key] = time.monotonic() + self.window
+        return True
+
+    def release(self, key: str, failed: bool) -> None:
+        """Libère la place d'un préchargement terminé."""
+        self.inflight -= 1
+        if failed:
+            self.failed += 1
+            self._pending.pop(key, None)
+
+    def claim(self, key: str, served: bool) -> None:
+        """
+        Signale une requête réelle sur `key`.
+
+        Args:
+            key: Clé canonique de la requête
+            served: La requête est servie par le cache ou une requête en vol
+        """
+        if self._pending.pop(key, None) is not None:
+            if served:
+                self.hits += 1
+            else:
+                self.expired += 1
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        while self._pending:
+            key, deadline = next(iter(self._pending.items()))
+            if deadline > now:
+                break
+            del self._pending[key]
+            self.expired += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistiques: préchargements lancés, refusés, échoués, utilisés."""
+        useful = self.issued - self.failed
+        return {
+            "depth": self.depth,
+            "inflight": self.inflight,
+            "issued": self.issued,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "hits": self.hits,
+            "expired": self.expired,
+            "hit_rate": round(self.hits / useful, 3) if useful > 0 else None
+        }
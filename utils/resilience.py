@@ -0,0 +1,174 @@
+"""Briques de résilience du client CFNEWS: retries, limitation de débit, disjoncteur."""
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+
+class RetryPolicy:
+    """
+    Politique de nouvelles tentatives pour les GET (idempotents).
+
+    Délai exponentiel avec gigue complète ("full jitter"); un en-tête
+    `Retry-After` renvoyé par l'API prend le pas sur le délai calculé.
+    """
+
+    RETRY_STATUSES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        max_retry_after: float = 30.0
+    ):
+        """
+        Args:
+            max_attempts: Nombre total de tentatives (1 = pas de retry)
+            base_delay: Délai de base du backoff exponentiel (secondes)
+            max_delay: Délai maximum entre deux tentatives (secondes)
+            max_retry_after: Au-delà de ce Retry-After, l'erreur est remontée sans attendre
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+
+    def should_retry(self, attempt: int, retry_after: Optional[float] = None) -> bool:
+        """Indique si une nouvelle tentative est permise après l'essai `attempt`."""
+        if attempt >= self.max_attempts:
+            return False
+        return retry_after is None or retry_after <= self.max_retry_after
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Délai avant la tentative suivant l'essai `attempt` (numéroté à partir de 1)."""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convertit un en-tête Retry-After (secondes ou date HTTP) en secondes."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Limiteur de débit côté client (seau à jetons).
+
+    `pause()` suspend toutes les requêtes, par exemple après un 429 avec
+    Retry-After, pour ne pas marteler l'API pendant la pénalité.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Requêtes par seconde autorisées en régime établi
+            capacity: Taille de rafale (par défaut: `rate`, au moins 1)
+        """
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self.waits = 0
+
+    async def acquire(self) -> None:
+        """Attend qu'un jeton soit disponible puis le consomme."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    self.waits += 1
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                self.waits += 1
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def available(self) -> float:
+        """Jetons disponibles immédiatement (0 pendant une pause), sans en consommer."""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return 0.0
+        return min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Suspend la délivrance de jetons pendant `seconds` secondes."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur: échoue immédiatement tant que l'API amont est en panne.
+
+    Après `failure_threshold` échecs consécutifs (erreurs réseau ou 5xx), le
+    circuit s'ouvre pendant `reset_timeout` secondes; une seule requête
+    d'essai est ensuite autorisée (semi-ouvert) et referme le circuit si elle
+    réussit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold: Échecs consécutifs avant ouverture
+            reset_timeout: Durée d'ouverture avant une requête d'essai (secondes)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejections = 0
+
+    def allow(self) -> bool:
+        """Indique si une requête peut partir."""
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at >= self.reset_timeout:
+            # Requête d'essai (renouvelée si la précédente n'a jamais abouti)
+            self.state = self.HALF_OPEN
+            self.opened_at = now
+            return True
+        self.rejections += 1
+        return False
+
+    def retry_in(self) -> float:
+        """Secondes restantes avant la prochaine requête d'essai."""
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def record_success(self) -> None:
+        """Enregistre une réponse de l'API (le circuit se referme)."""
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        """Enregistre un échec (erreur réseau ou 5xx)."""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
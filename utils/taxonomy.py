@@ -0,0 +1,395 @@
+"""Référentiel des taxonomies CFNEWS (voir MAPPINGS.md) et résolution des libellés."""
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+TaxonomyValue = Union[int, str]
+
+
+# Valeurs acceptées, rappelées quand un libellé inconnu n'a pas de suggestion
+DEFAULT_HINT = "utilisez un libellé de MAPPINGS.md ou l'ID numérique"
+
+
+class TaxonomyError(ValueError):
+    """Libellé introuvable dans une taxonomie CFNEWS."""
+
+    def __init__(self, taxonomy: str, label: str, suggestions: List[str], hint: Optional[str] = None):
+        message = f"Valeur inconnue pour {taxonomy}: {label!r}"
+        if suggestions:
+            message += f" (suggestions: {', '.join(suggestions)})"
+        else:
+            message += f" ({hint or DEFAULT_HINT})"
+        super().__init__(message)
+        self.taxonomy = taxonomy
+        self.label = label
+        self.suggestions = suggestions
+
+
+def normalize(label: str) -> str:
+    """Forme canonique d'un libellé: sans accents, minuscules, ponctuation réduite."""
+    decomposed = unicodedata.normalize("NFKD", label)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return re.sub(r"[^0-9a-z]+", " ", stripped.casefold()).strip()
+
+
+def _trigrams(key: str) -> List[str]:
+    padded = f"  {key} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+class Taxonomy:
+    """
+    Table libellé -> ID d'une taxonomie, indexée une fois pour toutes.
+
+    La recherche exacte se fait en O(1) sur le libellé normalisé; à défaut,
+    un index de trigrammes propose le libellé le plus proche (coefficient de
+    Dice), accepté seulement s'il est suffisamment proche et sans ambiguïté.
+
+    Une taxonomie partielle (MAPPINGS.md n'en liste que les valeurs
+    courantes, ex: mots-clés) ne rejette rien: un libellé absent de la table
+    est transmis tel quel à l'API, sans rapprochement approximatif.
+    """
+
+    MIN_SCORE = 0.7
+    MIN_MARGIN = 0.1
+
+    def __init__(
+        self,
+        name: str,
+        entries: Sequence[Tuple[str, TaxonomyValue]],
+        aliases: Optional[Dict[str, str]] = None,
+        passthrough: Optional[Callable[[str], Optional[TaxonomyValue]]] = None,
+        partial: bool = False,
+        hint: Optional[str] = None
+    ):
+        """
+        Args:
+            name: Nom du paramètre API (ex: "op_type")
+            entries: Couples (libellé, ID) de MAPPINGS.md
+            aliases: Libellés alternatifs -> libellé de référence
+            passthrough: Convertit une valeur acceptée telle quelle (ex: code ISO)
+            partial: La table ne liste que des valeurs courantes (libellés
+                inconnus transmis tels quels)
+            hint: Valeurs acceptées, rappelées dans les erreurs (défaut: DEFAULT_HINT)
+        """
+        self.name = name
+        self.partial = partial
+        self.hint = hint
+        self.labels: Dict[TaxonomyValue, str] = {}
+        self._index: Dict[str, TaxonomyValue] = {}
+        for label, value in entries:
+            self.labels.setdefault(value, label)
+            self._index[normalize(label)] = value
+        for alias, target in (aliases or {}).items():
+            self._index[normalize(alias)] = self._index[normalize(target)]
+        self._passthrough = passthrough
+        # Construit au premier libellé inexact (hors du démarrage du serveur)
+        self._trigram_index: Optional[Dict[str, List[str]]] = None
+
+    def __contains__(self, label: str) -> bool:
+        return normalize(label) in self._index
+
+    def resolve(self, label: Union[str, int]) -> TaxonomyValue:
+        """
+        Convertit un libellé (ou un ID) en valeur attendue par l'API.
+
+        Raises:
+            TaxonomyError: Libellé introuvable, avec des suggestions (jamais
+                pour une taxonomie partielle)
+        """
+        if isinstance(label, int) and not isinstance(label, bool):
+            return label
+        text = str(label).strip()
+        if text.isdigit():
+            return int(text)
+        key = normalize(text)
+        value = self._index.get(key)
+        if value is not None:
+            return value
+        if self._passthrough is not None:
+            value = self._passthrough(text)
+            if value is not None:
+                return value
+        if self.partial:
+            return text
+        matches = self._fuzzy(key)
+        if matches and matches[0][1] >= self.MIN_SCORE and (
+            len(matches) == 1 or matches[0][1] - matches[1][1] >= self.MIN_MARGIN
+        ):
+            return self._index[matches[0][0]]
+        raise TaxonomyError(self.name, text, self._suggest(matches), self.hint)
+
+    def resolve_many(self, labels: Iterable[Union[str, int]]) -> List[TaxonomyValue]:
+        """Résout une liste de libellés (voir resolve)."""
+        return [self.resolve(label) for label in labels]
+
+    def _fuzzy(self, key: str) -> List[Tuple[str, float]]:
+        """Libellés candidats triés par similarité décroissante."""
+        if self._trigram_index is None:
+            index: Dict[str, List[str]] = defaultdict(list)
+            for known in self._index:
+                for trigram in set(_trigrams(known)):
+                    index[trigram].append(known)
+            self._trigram_index = index
+        query = set(_trigrams(key))
+        shared: Dict[str, int] = defaultdict(int)
+        for trigram in query:
+            for candidate in self._trigram_index.get(trigram, ()):
+                shared[candidate] += 1
+        scored = [
+            (candidate, 2 * count / (len(query) + len(set(_trigrams(candidate)))))
+            for candidate, count in shared.items()
+        ]
+        scored.sort(key=lambda match: match[1], reverse=True)
+        # Plusieurs libellés (alias) peuvent désigner la même valeur
+        unique: List[Tuple[str, float]] = []
+        seen = set()
+        for candidate, score in scored:
+            value = self._index[candidate]
+            if value not in seen:
+                seen.add(value)
+                unique.append((candidate, score))
+        return unique
+
+    def _suggest(self, matches: List[Tuple[str, float]], limit: int = 3) -> List[str]:
+        return [self.labels[self._index[key]] for key, score in matches[:limit] if score >= 0.3]
+
+
+def _iso_code(text: str) -> Optional[str]:
+    return text.upper() if re.fullmatch(r"[A-Za-z]{2}", text) else None
+
+
+OPERATION_TYPES = Taxonomy("op_type", [
+    ("LBO", 271),
+    ("M&A Corporate", 272),
+    ("Capital Développement", 273),
+    ("Capital Innovation", 274),
+    ("Immobilier", 275),
+    ("Financement", 29093),
+    ("Restructuration", 14447),
+    ("Bourse", 25006),
+    ("Infrastructure", 199547),
+    ("Mouvement", 278),
+], aliases={"M&A": "M&A Corporate", "Venture Capital": "Capital Innovation", "VC": "Capital Innovation"})
+
+OPERATION_SUBTYPES = Taxonomy("op_sstype", [
+    ("Amorçage", 1208),
+    ("1er tour", 1209),
+    ("2e tour", 1210),
+    ("3e tour", 1211),
+    ("4e tour", 1212),
+    ("5e tour", 1213),
+    ("6e tour", 1216),
+    ("LBO Primaire", 1221),
+    ("LBO bis", 1222),
+    ("LBO ter", 1223),
+    ("LBO IV", 1224),
+    ("MBO", 1225),
+    ("MBI", 1226),
+    ("BIMBO", 1227),
+    ("Recap", 1230),
+    ("Build-up", 1231),
+    ("OBO", 1232),
+    ("M&A Corporate", 1239),
+    ("Minoritaire", 1242),
+    ("Majoritaire", 35456),
+    ("IPO", 1253),
+    ("Refinancement", 42798),
+    ("Retournement", 1252),
+    ("Carve-out", 417190),
+], aliases={"Seed": "Amorçage", "Série A": "1er tour", "Série B": "2e tour", "Série C": "3e tour"})
+
+SECTORS = Taxonomy("sector", [
+    ("Agriculture & alimentaire", 122),
+    ("Automobile, aérospatial, construction navale", 123),
+    ("Biotechnologies", 124),
+    ("Distribution", 125),
+    ("Electronique & Informatique", 126),
+    ("Energie & Utilities", 127),
+    ("Environnement & CleanTechs", 294),
+    ("Immobilier & construction, bâtiment", 295),
+    ("Information, communication, télécom", 299),
+    ("Internet & ecommerce, eservices", 296),
+    ("Logiciel et services informatiques", 297),
+    ("Matières premières & industries de base", 298),
+    ("Produits & Services industriels", 300),
+    ("Produits Pharmaceutiques & matériel médical", 301),
+    ("Santé, beauté et services associés", 302),
+    ("Services & Biens de consommation", 303),
+    ("Services & Conseil aux entreprises", 304),
+    ("Services Financiers", 305),
+    ("Textile, Mode, Luxe, Décoration", 19661),
+    ("Tourisme, hôtellerie/restauration, loisirs", 306),
+    ("Transports & logistique", 307),
+    ("Corporate Finance", 19486),
+], aliases={"Biotech": "Biotechnologies", "Logiciel": "Logiciel et services informatiques", "Fintech": "Services Financiers"})
+
+REGIONS = Taxonomy("region", [
+    ("Île-de-France", 132336),
+    ("Auvergne-Rhône-Alpes", 132360),
+    ("Bourgogne-Franche-Comté", 132340),
+    ("Bretagne", 132341),
+    ("Centre-Val de Loire", 132342),
+    ("Corse", 132344),
+    ("Grand Est", 132334),
+    ("Guadeloupe", 132346),
+    ("Guyane", 132347),
+    ("Hauts-de-France", 132355),
+    ("La Réunion", 132349),
+    ("Martinique", 132353),
+    ("Mayotte", 410918),
+    ("Normandie", 132348),
+    ("Nouvelle-Aquitaine", 132335),
+    ("Nouvelle-Calédonie", 495949),
+    ("Occitanie", 132354),
+    ("Pays de la Loire", 132356),
+    ("Région Sud - Provence-Alpes-Côte d'Azur", 132359),
+    ("Saint-Barthélemy", 453236),
+    ("Etranger", 132337),
+    ("N.D.", 132338),
+], aliases={"IDF": "Île-de-France", "PACA": "Région Sud - Provence-Alpes-Côte d'Azur", "Région Sud": "Région Sud - Provence-Alpes-Côte d'Azur"})
+
+NATIONALITIES = Taxonomy("acteur_zone", [
+    ("France", "FR"),
+    ("Allemagne", "DE"),
+    ("Royaume-Uni", "GB"),
+    ("États-Unis", "US"),
+    ("Belgique", "BE"),
+    ("Suisse", "CH"),
+    ("Italie", "IT"),
+    ("Espagne", "ES"),
+    ("Pays-Bas", "NL"),
+    ("Luxembourg", "LU"),
+    ("Canada", "CA"),
+    ("Chine", "CN"),
+    ("Japon", "JP"),
+    ("Singapour", "SG"),
+    ("Hong Kong", "HK"),
+], aliases={"UK": "Royaume-Uni", "USA": "États-Unis"}, passthrough=_iso_code,
+    hint="utilisez un pays de MAPPINGS.md ou son code ISO à deux lettres, ex: FR")
+
+VEHICLE_SEGMENTS = Taxonomy("vehicle_segment", [
+    ("Amorçage", 189606),
+    ("Capital développement", 189607),
+    ("Capital innovation / VC", 189608),
+    ("Dette", 189609),
+    ("Fonds de fonds", 189610),
+    ("Fonds secondaire", 189611),
+    ("Immobilier", 189612),
+    ("Infrastructure", 189613),
+    ("Holding ISF", 189614),
+    ("LBO", 189615),
+    ("Mezzanine", 189617),
+    ("PPP", 189618),
+    ("Retournement / Situations spéciales", 189619),
+    ("Bourse", 337543),
+    ("Feeder", 469642),
+    ("Fonds à impact", 341167),
+    ("Growth", 421404),
+    ("Unitranche", 379771),
+], aliases={"Venture Capital": "Capital innovation / VC", "VC": "Capital innovation / VC", "Capital innovation": "Capital innovation / VC"})
+
+VEHICLE_TYPES = Taxonomy("vehicle_type", [
+    ("FCPR", 335940),
+    ("FPCI", 335945),
+    ("FPCR", 335942),
+    ("FCP", 335965),
+    ("FCPE", 445211),
+    ("FCT", 335946),
+    ("FIPS", 335962),
+    ("FPS", 335961),
+    ("SCI", 335966),
+    ("SCSp", 335972),
+    ("SICAV", 335969),
+    ("SCR", 335939),
+    ("OPCI", 335959),
+    ("OPPCI", 335964),
+    ("Holding ISF", 335967),
+    ("SAS", 345645),
+    ("SASU", 337529),
+    ("SPAC", 348339),
+])
+
+VEHICLE_STATUSES = Taxonomy("vehicle_status", [
+    ("En cours de levée", 189636),
+    ("1er closing", 189637),
+    ("2nd closing", 189638),
+    ("3ème closing", 337533),
+    ("4ème closing", 337534),
+    ("Closé", 189639),
+    ("En cours de désinvestissement", 189640),
+    ("Entièrement investi", 337535),
+    ("Entièrement désinvesti", 523819),
+    ("Levée abandonnée", 538716),
+], aliases={"Clos": "Closé", "Final closing": "Closé"})
+
+ACTOR_TYPES = Taxonomy("acteur_domaine", [
+    ("Fonds d'investissement / gestionnaire", 187),
+    ("Avocats", 188),
+    ("Banquiers", 189),
+    ("Conseils", 190),
+    ("Investisseurs institutionnels (LPs)", 191),
+    ("Asset Managers", 451255),
+], aliases={
+    "Fonds d'investissement": "Fonds d'investissement / gestionnaire",
+    "Fonds": "Fonds d'investissement / gestionnaire",
+    "Investisseurs institutionnels": "Investisseurs institutionnels (LPs)",
+    "LPs": "Investisseurs institutionnels (LPs)",
+})
+
+COMPANY_TYPES = Taxonomy("soc_activity", [
+    ("Familiale", 260),
+    ("Indépendante", 259),
+    ("Filiale Groupe", 258),
+    ("Sté sous LBO", 20104),
+    ("Cotée", 18904),
+    ("Sté en redressement", 328312),
+    ("Sté liquidée", 148797),
+    ("Société soutenue par un ou des fonds (hors LBO)", 495165),
+], aliases={"Société sous LBO": "Sté sous LBO", "Filiale": "Filiale Groupe"})
+
+PEOPLE_ORGANIZATION_TYPES = Taxonomy("people_type_organisation", [
+    ("Avocats", 207),
+    ("Banquiers", 226),
+    ("Conseils", 230),
+    ("Fonds", 308),
+    ("Invest. institutionnels (LPs)", 242),
+    ("Sociétés", 254),
+    ("Asset Managers", 451443),
+], aliases={"Investisseurs institutionnels": "Invest. institutionnels (LPs)", "Entreprises": "Sociétés"})
+
+PEOPLE_TITLES = Taxonomy("people_titres", [
+    ("Directeur général", 8416),
+    ("Directeur", 8406),
+    ("Directeur adjoint", 19862),
+    ("Directeur associé(e)", 8414),
+    ("Associé(e)", 8410),
+    ("Partner", 8408),
+    ("Managing Partner", 8429),
+    ("Directeur d'investissements", 8417),
+    ("Directeur financier", 22940),
+    ("Directeur juridique", 8447),
+    ("CEO", 407564),
+    ("CFO (Directeur administratif et financier)", 8426),
+    ("Président", 8436),
+    ("Président-directeur général", 8425),
+], aliases={"Associé": "Associé(e)", "DG": "Directeur général", "PDG": "Président-directeur général", "CFO": "CFO (Directeur administratif et financier)", "DAF": "CFO (Directeur administratif et financier)"}, partial=True)
+
+KEYWORDS = Taxonomy("keyword", [
+    ("capital investissement", 659),
+    ("fintech", 783),
+    ("deeptech", 330956),
+    ("biotechnologies", 653),
+    ("intelligence artificielle", 697),
+    ("cleantech", 22359),
+    ("cybersécurité", 346479),
+    ("blockchain", 299862),
+    ("santé digitale", 435911),
+    ("M&A", 23897),
+    ("levée de fonds", 24945),
+    ("ESG", 817),
+    ("impact investing", 345514),
+    ("start-up", 22107),
+    ("retournement", 22106),
+], partial=True)
@@ -0,0 +1,221 @@
+"""Mesure des durées par phase d'un appel d'outil (mode trace) et profilage échantillonné."""
+import contextvars
+import functools
+import logging
+import os
+import random
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_current: "contextvars.ContextVar[Optional[Trace]]" = contextvars.ContextVar("cfnews_trace", default=None)
+
+
+class Trace:
+    """Durées cumulées par phase (ms) et nombre d'occurrences d'un appel."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases: Dict[str, list] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        phase = self.phases.get(name)
+        if phase is None:
+            self.phases[name] = [seconds, 1]
+        else:
+            phase[0] += seconds
+            phase[1] += 1
+
+    def timings(self) -> Dict[str, Any]:
+        """Résumé exposé sous la clé `_timings` des réponses."""
+        return {
+            "total_ms": round((time.perf_counter() - self.start) * 1000, 3),
+            "phases": {
+                name: {"ms": round(seconds * 1000, 3), "count": count}
+                for name, (seconds, count) in self.phases.items()
+            }
+        }
+
+
+class _Span:
+    __slots__ = ("trace", "name", "start")
+
+    def __init__(self, trace: Trace, name: str):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.trace.add(self.name, time.perf_counter() - self.start)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def current() -> Optional[Trace]:
+    """Trace de l'appel en cours (None hors mode trace)."""
+    return _current.get()
+
+
+def span(name: str) -> Any:
+    """
+    Mesure un bloc `with` dans la trace en cours.
+
+    Hors mode trace, renvoie un gestionnaire de contexte partagé qui ne fait
+    rien: le coût se limite à la lecture d'une ContextVar.
+    """
+    trace = _current.get()
+    if trace is None:
+        return _NO_SPAN
+    return _Span(trace, name)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Décorateur: mesure chaque appel d'une fonction synchrone comme la phase `name`."""
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            trace = _current.get()
+            if trace is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                trace.add(name, time.perf_counter() - start)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def begin() -> "contextvars.Token[Optional[Trace]]":
+    """Démarre une trace pour l'appel en cours (tâches filles incluses)."""
+    return _current.set(Trace())
+
+
+def end(token: "contextvars.Token[Optional[Trace]]") -> None:
+    _current.reset(token)
+
+
+class HTTPTrace:
+    """
+    Extension `trace` de httpx: découpe une requête en connexion, attente du
+    premier octet et lecture du corps.
+    """
+
+    def __init__(self, trace: Trace):
+        self.trace = trace
+        self.started: Dict[str, float] = {}
+
+    async def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        # ex: connection.connect_tcp.started, http11.receive_response_body.complete
+        step, _, state = event.rpartition(".")
+        now = time.perf_counter()
+        if state == "started":
+            self.started[step] = now
+        elif state in ("complete", "failed"):
+            start = self.started.pop(step, None)
+            if start is None:
+                return
+            if step.endswith(("connect_tcp", "connect_unix_socket", "start_tls")):
+                self.trace.add("http.connect", now - start)
+            elif step.endswith("receive_response_headers"):
+                sent = self.started.pop("request_sent", start)
+                self.trace.add("http.ttfb", now - sent)
+            elif step.endswith("receive_response_body"):
+                self.trace.add("http.body", now - start)
+            elif step.endswith("send_request_headers"):
+                self.started["request_sent"] = start
+
+
+def enabled_by_env() -> bool:
+    """Mode trace activé pour tous les appels (CFNEWS_TRACE=true)."""
+    return os.getenv("CFNEWS_TRACE", "false").lower() in ("1", "true", "yes")
+
+
+class Profiler:
+    """
+    Profilage échantillonné des appels d'outils (cProfile, ou pyinstrument
+    s'il est installé et demandé), écrit dans un répertoire.
+
+    Un seul appel est profilé à la fois: les profileurs s'attachent au
+    thread, et les autres coroutines de la boucle apparaissent aussi dans le
+    profil.
+    """
+
+    def __init__(self, directory: str, rate: float = 0.01, backend: str = "cprofile"):
+        """
+        Args:
+            directory: Répertoire des profils (un fichier par appel)
+            rate: Proportion d'appels profilés (0 à 1)
+            backend: "cprofile" (.prof, lisible avec pstats/snakeviz) ou "pyinstrument" (.html)
+        """
+        self.directory = directory
+        self.rate = rate
+        self.backend = backend
+        self.active = False
+        os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional["Profiler"]:
+        """Profileur configuré par CFNEWS_PROFILE_DIR / _RATE / _BACKEND (None si désactivé)."""
+        directory = os.getenv("CFNEWS_PROFILE_DIR")
+        if not directory:
+            return None
+        return cls(
+            directory,
+            rate=float(os.getenv("CFNEWS_PROFILE_RATE", 0.01)),
+            backend=os.getenv("CFNEWS_PROFILE_BACKEND", "cprofile").lower()
+        )
+
+    def start(self) -> Optional[Any]:
+        """Démarre un profil si l'appel est échantillonné (None sinon)."""
+        if self.active or random.random() >= self.rate:
+            return None
+        if self.backend == "pyinstrument":
+            try:
+                from pyinstrument import Profiler as Sampler
+            except ImportError:
+                logger.warning("pyinstrument absent: profilage avec cProfile")
+                self.backend = "cprofile"
+            else:
+                self.active = True
+                sampler = Sampler(async_mode="enabled")
+                sampler.start()
+                return sampler
+        import cProfile
+        self.active = True
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile
+
+    def stop(self, profile: Any, name: str) -> str:
+        """Arrête le profil et l'écrit; renvoie le chemin du fichier."""
+        self.active = False
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        base = os.path.join(self.directory, f"{name}-{stamp}-{os.getpid()}-{random.randrange(1 << 16):04x}")
+        if hasattr(profile, "output_html"):
+            profile.stop()
+            path = f"{base}.html"
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(profile.output_html())
+        else:
+            profile.disable()
+            path = f"{base}.prof"
+            profile.dump_stats(path)
+        return path
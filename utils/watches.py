@@ -0,0 +1,271 @@
+"""Veilles: recherches enregistrées, relevées en tâche de fond, dont seuls les nouveaux items sont renvoyés."""
+import asyncio
+import logging
+import secrets
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cfnews_client import CFNewsClient
+
+logger = logging.getLogger(__name__)
+
+# Prévient l'abonné d'une veille que de nouveaux items sont disponibles
+Notifier = Callable[[], Awaitable[None]]
+
+# Tri par date décroissante imposé à chaque endpoint relevé (la relève s'arrête
+# au premier item connu): code de MAPPINGS.md pour les opérations; aucun code
+# n'étant documenté pour les actualités, seul le sens est imposé sur leur
+# ordre par défaut (date de publication)
+DATE_SORTS: Dict[str, Dict[str, str]] = {
+    "operation": {"sort_attribute": "fiche_operation_operation_date_value_dt", "sort_type": "descending"},
+    "actualite": {"sort_type": "descending"},
+}
+
+
+@dataclass
+class Watch:
+    """
+    Recherche enregistrée et nouveaux items non encore lus.
+
+    `head` garde les IDs de la première page lue à la dernière relève: la
+    relève suivante lit les résultats par date décroissante et s'arrête au
+    premier item déjà vu. Une page entière d'IDs (et non le seul premier)
+    tolère la suppression des items les plus récents.
+    """
+    id: str
+    entity: str
+    endpoint: str
+    query_params: Dict[str, Any]
+    label: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    head: List[Any] = field(default_factory=list)
+    # Nouveaux items non lus, les plus récents d'abord
+    pending: List[Dict[str, Any]] = field(default_factory=list)
+    dropped: int = 0
+    overflow: bool = False
+    polls: int = 0
+    pages: int = 0
+    last_polled: Optional[float] = None
+    last_error: Optional[str] = None
+    notify: Optional[Notifier] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_taken: List[Dict[str, Any]] = field(default_factory=list)
+
+    def take(self, count: int) -> List[Dict[str, Any]]:
+        """Retire et renvoie les `count` nouveaux items les plus récents."""
+        items = self.pending[:max(0, count)]
+        del self.pending[:len(items)]
+        if not self.pending:
+            self.dropped = 0
+            self.overflow = False
+        self.last_taken = items
+        return items
+
+    def restore(self, count: int) -> None:
+        """Remet en attente les `count` derniers items du dernier `take` (non renvoyés)."""
+        if count > 0:
+            self.pending = self.last_taken[-count:] + self.pending
+            self.last_taken = self.last_taken[:-count]
+
+    def summary(self) -> Dict[str, Any]:
+        """Description de la veille (sans ses items)."""
+        return {
+            "watch_id": self.id,
+            "entity": self.entity,
+            "label": self.label,
+            "pending": len(self.pending),
+            "polls": self.polls,
+            "last_polled": (
+                datetime.fromtimestamp(self.last_polled).isoformat(timespec="seconds")
+                if self.last_polled is not None else None
+            ),
+            "last_error": self.last_error,
+        }
+
+
+class WatchPoller:
+    """
+    Veilles en mémoire, relevées par une unique boucle asyncio.
+
+    Chaque relève lit la première page sans passer par le cache (revalidée
+    par requête conditionnelle quand l'API le permet) et ne lit les pages
+    suivantes que tant qu'elles ne contiennent que des nouveaux items, dans
+    la limite de `max_pages`: le coût d'une relève dépend du nombre de
+    nouveaux items, pas du nombre de résultats de la recherche.
+    """
+
+    def __init__(
+        self,
+        client: Callable[[], "CFNewsClient"],
+        interval: float = 300.0,
+        page_size: int = 20,
+        max_pages: int = 5,
+        max_pending: int = 500,
+        max_watches: int = 100,
+        concurrency: int = 4
+    ):
+        """
+        Args:
+            client: Renvoie le client API partagé
+            interval: Délai entre deux relèves de toutes les veilles (secondes)
+            page_size: Items par page lue
+            max_pages: Pages lues au plus par veille et par relève
+            max_pending: Nouveaux items gardés par veille (les plus anciens sont abandonnés)
+            max_watches: Nombre maximum de veilles
+            concurrency: Veilles relevées simultanément
+        """
+        self.client = client
+        self.interval = interval
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.max_pending = max_pending
+        self.max_watches = max_watches
+        self.concurrency = concurrency
+        self.watches: Dict[str, Watch] = {}
+        self.polls = 0
+        self.requests = 0
+        self.new_items = 0
+        self.errors = 0
+
+    def __len__(self) -> int:
+        return len(self.watches)
+
+    def add(
+        self,
+        entity: str,
+        endpoint: str,
+        query_params: Dict[str, Any],
+        label: Optional[str] = None,
+        notify: Optional[Notifier] = None
+    ) -> Watch:
+        """
+        Enregistre une veille (relevée à partir de la prochaine relève).
+
+        Le tri par date décroissante de l'endpoint (DATE_SORTS) remplace
+        tout tri présent dans `query_params`.
+
+        Raises:
+            ValueError: Nombre maximum de veilles atteint, ou endpoint sans
+                tri par date
+        """
+        if endpoint not in DATE_SORTS:
+            raise ValueError(f"Endpoint sans tri par date, veille impossible: {endpoint}")
+        if len(self.watches) >= self.max_watches:
+            raise ValueError(f"Nombre maximum de veilles atteint ({self.max_watches})")
+        query_params = {**query_params, **DATE_SORTS[endpoint]}
+        watch = Watch(secrets.token_urlsafe(9), entity, endpoint, query_params, label, notify=notify)
+        self.watches[watch.id] = watch
+        return watch
+
+    def get(self, watch_id: str) -> Optional[Watch]:
+        return self.watches.get(watch_id)
+
+    def remove(self, watch_id: str) -> bool:
+        return self.watches.pop(watch_id, None) is not None
+
+    async def poll(self, watch: Watch) -> int:
+        """
+        Relève une veille.
+
+        La première relève fixe le point de départ: seuls les items publiés
+        ensuite sont signalés.
+
+        Returns:
+            Nombre de nouveaux items
+        """
+        async with watch.lock:
+            known = set(watch.head)
+            seen = {item.get("id") for item in watch.pending}
+            fresh: List[Dict[str, Any]] = []
+            head: Optional[List[Any]] = None
+            reached = False
+            page = 1
+            try:
+                while page <= self.max_pages:
+                    data = await self.client().search(
+                        watch.endpoint, page, watch.query_params, limit=self.page_size, fresh=True
+                    )
+                    self.requests += 1
+                    watch.pages += 1
+                    items = [item for item in data.get("items") or [] if isinstance(item, dict)]
+                    if head is None:
+                        head = [item.get("id") for item in items]
+                    for item in items:
+                        if item.get("id") in known:
+                            reached = True
+                            break
+                        if item.get("id") not in seen:
+                            fresh.append(item)
+                    # Première relève: la première page suffit à fixer le point de départ
+                    if reached or not items or watch.polls == 0 or page >= int(data.get("nb_pages") or 1):
+                        reached = True
+                        break
+                    page += 1
+            except Exception as e:
+                watch.last_error = str(e)
+                self.errors += 1
+                raise
+            finally:
+                watch.last_polled = time.time()
+
+            baseline = watch.polls == 0
+            watch.polls += 1
+            self.polls += 1
+            # Première page vide (ex: recherche momentanément sans résultat):
+            # garder l'ancienne tête, sinon tous les items seraient signalés
+            if head:
+                watch.head = head
+            watch.last_error = None
+            if baseline or not fresh:
+                return 0
+            # Pages épuisées sans retrouver d'item connu: des nouveaux items manquent
+            watch.overflow = watch.overflow or not reached
+            watch.pending = fresh + watch.pending
+            if len(watch.pending) > self.max_pending:
+                watch.dropped += len(watch.pending) - self.max_pending
+                del watch.pending[self.max_pending:]
+            self.new_items += len(fresh)
+
+        if watch.notify is not None:
+            try:
+                await watch.notify()
+            except Exception as e:
+                logger.warning("Notification de la veille %s impossible: %s", watch.id, e)
+        return len(fresh)
+
+    async def poll_all(self) -> Dict[str, Any]:
+        """Relève toutes les veilles (les erreurs sont renvoyées par veille)."""
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def poll_one(watch: Watch) -> Any:
+            async with semaphore:
+                try:
+                    return await self.poll(watch)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    return {"error": str(e)}
+
+        watches = list(self.watches.values())
+        results = await asyncio.gather(*(poll_one(watch) for watch in watches))
+        return {watch.id: result for watch, result in zip(watches, results)}
+
+    async def run(self) -> None:
+        """Boucle de relève périodique (les erreurs sont journalisées)."""
+        while True:
+            await asyncio.sleep(self.interval)
+            for watch_id, result in (await self.poll_all()).items():
+                if isinstance(result, dict):
+                    logger.warning("Relève de la veille %s échouée: %s", watch_id, result["error"])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "watches": len(self.watches),
+            "polls": self.polls,
+            "requests": self.requests,
+            "new_items": self.new_items,
+            "errors": self.errors,
+        }